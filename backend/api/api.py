@@ -2,25 +2,35 @@
 
 import logging
 from contextlib import asynccontextmanager
-from typing import Dict
+from typing import Awaitable, Callable, Dict
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from backend.api.models import AppInfoResponse
+from backend.api.routes.changes_routes import router as changes_router
 from backend.api.routes.depth_chart_routes import router as depth_chart_router
 from backend.api.routes.schedule_routes import router as schedule_router
 from backend.api.routes.statistics_routes import router as statistics_router
 from backend.api.routes.teams_routes import router as teams_router
-from backend.api.util.cache_helpers import get_app_caches, get_cache
+from backend.api.util.api_statistics_helpers import season_stat_columns
+from backend.api.util.cache_helpers import cache_version, get_app_caches, get_cache
 from backend.app import App
 from backend.config.settings import CORS_ALLOW_CREDENTIALS, CORS_ORIGINS
+from backend.database.service.lazy_cache import LazyRecordListMapping
 from backend.util import constants
-from backend.util.exceptions import CacheNotLoadedError, FantasyFootballError, PlayerNotFoundError
+from backend.util.exceptions import (
+    CacheNotLoadedError,
+    CacheVersionNotFoundError,
+    FantasyFootballError,
+    PlayerNotFoundError,
+)
 
 logger = logging.getLogger(__name__)
 
+_DATA_VERSION_HEADER = "X-Data-Version"
+
 @asynccontextmanager
 async def lifespan(app_instance: FastAPI):
     """Initialize cache-backed app state at startup and close resources on shutdown."""
@@ -48,7 +58,20 @@ api.add_middleware(CORSMiddleware,
                    allow_origins=CORS_ORIGINS,
                    allow_credentials=allow_credentials,
                    allow_methods=["*"],
-                   allow_headers=["*"])
+                   allow_headers=["*"],
+                   expose_headers=[_DATA_VERSION_HEADER])
+
+@api.middleware("http")
+async def data_version_header(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """Tag every response with the cache generation it was served from; pinned generations never change."""
+    response = await call_next(request)
+    pinned = getattr(request.state, "cache_version", None)
+    version = pinned if pinned is not None else getattr(getattr(request.app.state, "fantasy_app", None), "generation", None)
+    if version is not None:
+        response.headers[_DATA_VERSION_HEADER] = str(version)
+    if pinned is not None and response.status_code == 200:
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
 
 # ==================== EXCEPTION HANDLERS ====================
 
@@ -57,6 +80,10 @@ async def cache_not_loaded_handler(request: Request, exc: CacheNotLoadedError) -
     logger.warning("[%s] %s", exc.source, exc)
     return JSONResponse(status_code=503, content={"detail": str(exc)})
 
+@api.exception_handler(CacheVersionNotFoundError)
+async def cache_version_not_found_handler(request: Request, exc: CacheVersionNotFoundError) -> JSONResponse:
+    return JSONResponse(status_code=404, content={"detail": str(exc)})
+
 @api.exception_handler(PlayerNotFoundError)
 async def player_not_found_handler(request: Request, exc: PlayerNotFoundError) -> JSONResponse:
     return JSONResponse(status_code=404, content={"detail": str(exc)})
@@ -75,7 +102,7 @@ def read_root() -> Dict[str, str]:
             "version": "0.1.0"}
 
 
-@api.get("/api/app-info", response_model=AppInfoResponse)
+@api.get("/api/app-info", response_model=AppInfoResponse, dependencies=[Depends(cache_version)])
 def get_app_info(request: Request) -> AppInfoResponse:
     """Return application overview metadata for the landing page."""
     caches = get_app_caches(request)
@@ -89,17 +116,13 @@ def get_app_info(request: Request) -> AppInfoResponse:
     current_season_players = sum(len(df) for df in current_season_positions.values())
 
     # Total weekly game logs across all players/seasons
-    total_game_logs = sum(len(weeks) for weeks in weekly_stats.values())
+    # Lazily loaded logs know their counts up front, so don't materialize every player to count them.
+    total_game_logs = weekly_stats.total_records if isinstance(weekly_stats, LazyRecordListMapping) else sum(len(weeks) for weeks in weekly_stats.values())
 
     # Count rookies and stat columns
     rookie_count = sum(1 for p in all_players if p.get("is_rookie"))
-    stat_columns = 0
-    for season_map in by_year.values():
-        if not isinstance(season_map, dict):
-            continue
-        for df in season_map.values():
-            if hasattr(df, "columns"):
-                stat_columns = max(stat_columns, len(df.columns))
+    # Lazily loaded seasons carry their column lists, so counting them reads no season.
+    stat_columns = max((len(columns) for season in by_year for columns in season_stat_columns(by_year, season).values()), default=0)
 
     return AppInfoResponse(
         seasons=constants.SEASONS,
@@ -112,7 +135,9 @@ def get_app_info(request: Request) -> AppInfoResponse:
     )
 
 
-api.include_router(statistics_router)
-api.include_router(teams_router)
-api.include_router(schedule_router)
-api.include_router(depth_chart_router)
+# Every data endpoint accepts ?version= to read from a kept cache generation.
+api.include_router(statistics_router, dependencies=[Depends(cache_version)])
+api.include_router(teams_router, dependencies=[Depends(cache_version)])
+api.include_router(schedule_router, dependencies=[Depends(cache_version)])
+api.include_router(depth_chart_router, dependencies=[Depends(cache_version)])
+api.include_router(changes_router, dependencies=[Depends(cache_version)])
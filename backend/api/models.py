@@ -308,6 +308,29 @@ class DepthChartEntry(BaseModel):
     )
 
 
+class ChangesResponse(BaseModel):
+    """Response for the change feed between two cache generations"""
+    since: int = Field(..., description="Data version the client already has")
+    version: int = Field(..., description="Data version the changes lead to")
+    full_refresh: bool = Field(..., description="True when the changes cannot be listed and everything should be refetched")
+    players: List[str] = Field(..., description="Players whose stats, weekly logs, or profile changed")
+    seasons: List[int] = Field(..., description="Seasons with changed stats or schedules")
+    teams: List[str] = Field(..., description="Teams with changed schedules or depth charts")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "since": 41,
+                "version": 42,
+                "full_refresh": False,
+                "players": ["Ja'Marr Chase", "Patrick Mahomes"],
+                "seasons": [2025],
+                "teams": ["CIN", "KC"],
+            }
+        }
+    )
+
+
 class TeamDepthChartResponse(BaseModel):
     """Response for a single team's depth chart"""
     team: str = Field(..., description="Team abbreviation")
@@ -0,0 +1,25 @@
+"""Change feed API routes — what changed between cache generations"""
+
+from fastapi import APIRouter, Query, Request
+
+from backend.api.models import ChangesResponse
+from backend.api.util.cache_helpers import get_app_generation, get_live_db
+from backend.util.exceptions import CacheNotLoadedError, CacheVersionNotFoundError
+
+router = APIRouter(prefix="/api/changes", tags=["changes"])
+
+
+@router.get("", response_model=ChangesResponse)
+def get_changes(request: Request, since: int = Query(..., ge=0, description="Data version the client already has")) -> ChangesResponse:
+    """List the players, seasons, and teams that changed after a data version, up to the live (or pinned) one"""
+    db = get_live_db(request)
+    if db is None:
+        raise CacheNotLoadedError("Cache database not available", source="changes_routes")
+    live = get_app_generation(request)
+    version = getattr(request.state, "cache_version", None) or live
+    for requested in (since, version):
+        if requested > live:
+            raise CacheVersionNotFoundError(f"Data version {requested} is not available", source="changes_routes")
+    if since > version:
+        raise CacheVersionNotFoundError(f"Data version {since} is newer than {version}", source="changes_routes")
+    return ChangesResponse(since=since, version=version, **db.changes_since(since, version))
@@ -1,8 +1,8 @@
 """Statistics API routes — player details, search, and chart data."""
 
-from typing import Optional
+from typing import Optional, Union
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from backend.api.models import (
     ChartDataResponse,
@@ -20,49 +20,36 @@ from backend.api.util.api_statistics_helpers import (
     build_overall_chart_players,
     build_player_trend_points,
     build_position_chart_players,
-    find_player_team,
     get_all_players,
-    get_player_profile,
     resolve_chart_season,
 )
-from backend.api.util.cache_helpers import get_app_caches, get_cache
-from backend.api.util.search_helpers import filter_search_results
+from backend.api.util.cache_helpers import get_app_caches, get_app_db, get_cache
+from backend.api.util.player_response_helpers import build_player_response, stored_json_response
+from backend.api.util.search_helpers import filter_search_results, rank_search_results
 from backend.util import constants
 from backend.util.exceptions import PlayerNotFoundError
 
 router = APIRouter(prefix="/api", tags=["statistics"])
 _VALID_CHART_POSITIONS = constants.POSITIONS + ["Overall"]
+_SEARCH_LIMIT = 20
 
 
 @router.get("/player/{player_name}", response_model=PlayerResponse)
-def get_player(request: Request, player_name: str, season: Optional[int] = None) -> PlayerResponse:
+def get_player(request: Request, player_name: str, season: Optional[int] = None) -> Union[PlayerResponse, Response]:
     """Get detailed stats for a specific player"""
     caches = get_app_caches(request)
-    stats_cache = get_cache(caches, constants.CACHE["STATISTICS"])
+    get_cache(caches, constants.CACHE["STATISTICS"])
     resolved_name = player_name.strip()
-    stats_dict, position, available_seasons, player_meta = get_player_profile(stats_cache, resolved_name, season)
-    if not stats_dict or not position:
+    db = get_app_db(request)
+    # Refreshes pre-render every player's response; stream the stored bytes when this variant exists.
+    stored = db.load_player_response(resolved_name, season) if db is not None else None
+    if stored is not None:
+        return stored_json_response(request, stored)
+
+    response = build_player_response(caches, resolved_name, season)
+    if response is None:
         raise PlayerNotFoundError(f"Player '{player_name}' not found", source="api")
-    weekly_stats = stats_cache.get(constants.STATS["PLAYER_WEEKLY_STATS"], {}).get(resolved_name)
-
-    meta = player_meta or {}
-    depth_charts = caches.get(constants.CACHE["DEPTH_CHART"], {})
-    player_team = meta.get("team")
-    if isinstance(player_team, str):
-        player_team = constants.TEAM_ABBR_NORMALIZATION.get(player_team, player_team)
-    if player_team not in constants.TEAM_METADATA:
-        player_team = find_player_team(resolved_name, depth_charts)
-
-    return PlayerResponse(name=resolved_name,
-                          position=position,
-                          team=player_team,
-                          stats=stats_dict,
-                          available_seasons=available_seasons,
-                          age=meta.get("age"),
-                          is_rookie=bool(meta.get("is_rookie", False)),
-                          is_eligible=bool(meta.get("is_eligible", True)),
-                          headshot_url=meta.get("headshot_url"),
-                          weekly_stats=weekly_stats)
+    return response
 
 @router.get("/search", response_model=SearchResponse)
 def search_players(request: Request, q: str, position: Optional[str] = None) -> SearchResponse:
@@ -72,15 +59,19 @@ def search_players(request: Request, q: str, position: Optional[str] = None) ->
 
     caches = get_app_caches(request)
     stats_cache = get_cache(caches, constants.CACHE["STATISTICS"])
-    all_players = get_all_players(stats_cache, position)
-
-    results = filter_search_results(all_players, q)
-    top_results = sorted(results, key=lambda x: (x.get("name") or "").lower())[:20]
+    db = get_app_db(request)
+    # The FTS5 index ranks, filters, and counts in SQL; caches without one fall back to scanning all_players.
+    indexed = db.search_players(q, position, limit=_SEARCH_LIMIT) if db is not None else None
+    if indexed is not None:
+        top_results, count = indexed
+    else:
+        results = filter_search_results(get_all_players(stats_cache, position), q)
+        top_results, count = rank_search_results(results, q)[:_SEARCH_LIMIT], len(results)
     typed_results = [PlayerSearchResult(**result) for result in top_results]
 
     return SearchResponse(query=q,
                           results=typed_results,
-                          count=len(results))
+                          count=count)
 
 @router.get("/chart-data", response_model=ChartDataResponse)
 def get_chart_data(request: Request, position: str, season: Optional[int] = None) -> ChartDataResponse:
@@ -6,6 +6,11 @@ from typing import Any, Dict, List, Mapping, Optional, Tuple, cast
 import pandas as pd
 from fastapi import HTTPException
 
+from backend.database.service.lazy_cache import (
+    LazyRecordListMapping,
+    LazySeasonMapping,
+    select_records,
+)
 from backend.util import constants
 
 
@@ -16,21 +21,32 @@ def get_player_profile(stats_cache: Dict[str, Any], player_name: str, season: Op
 
     stats_dict: Optional[Dict[str, Any]] = None
     position: Optional[str] = None
-    available_seasons: List[int] = []
+    available_seasons = sorted(player_seasons(by_year_stats, player_name), reverse=True)
+    target_season = season if season is not None else next(iter(available_seasons), None)
 
-    for year in sorted(by_year_stats.keys(), reverse=True):
-        season_frames = by_year_stats.get(year, {})
-        for pos, df in season_frames.items():
-            if not isinstance(df, pd.DataFrame) or player_name not in df.index:
-                continue
-            available_seasons.append(year)
-            if (season is None and stats_dict is None) or season == year:
+    # Only the requested (or latest) season is read; the others are known from the player index.
+    if target_season in available_seasons:
+        for pos, df in by_year_stats.get(target_season, {}).items():
+            if isinstance(df, pd.DataFrame) and player_name in df.index:
                 stats_dict = df.loc[player_name].to_dict()
                 position = pos
-            break
+                break
 
     return stats_dict, position, available_seasons, player_meta
 
+def player_seasons(by_year: Mapping[int, Dict[str, pd.DataFrame]], player_name: str) -> List[int]:
+    """Return the seasons (ascending) with a by-year row for the player, from the player index when seasons are lazy."""
+    if isinstance(by_year, LazySeasonMapping):
+        return by_year.player_seasons(player_name)
+    return sorted(season for season, frames in by_year.items()
+                  if any(isinstance(df, pd.DataFrame) and player_name in df.index for df in frames.values()))
+
+def season_stat_columns(by_year: Mapping[int, Dict[str, pd.DataFrame]], season: int) -> Dict[str, List[str]]:
+    """Return each position's stat columns for one season, from recorded metadata when seasons are lazy."""
+    if isinstance(by_year, LazySeasonMapping) and by_year.season_columns is not None:
+        return dict(by_year.season_columns.get(season, {}))
+    return {position: list(df.columns) for position, df in by_year.get(season, {}).items() if isinstance(df, pd.DataFrame) and not df.empty}
+
 def find_player_team(player_name: str, depth_charts: Dict[str, Any]) -> Optional[str]:
     """Find a player's current team from depth chart values."""
     for team, df in depth_charts.items():
@@ -115,7 +131,13 @@ def _season_weekly_points(weekly_records: List[Dict[str, Any]], season: int) ->
         points.append(fp_value)
     return points
 
-def build_consistency_chart_players(season_data: Dict[str, pd.DataFrame], weekly_by_player: Dict[str, List[Dict[str, Any]]], players_by_name: Dict[str, Dict[str, Any]], position: str, season: int, top_n: int) -> List[Dict[str, Any]]:
+def season_weekly_records(weekly_by_player: Mapping[str, List[Dict[str, Any]]], player_names: List[str], season: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the named players' weekly records for one season, in one batched read when the cache is lazy."""
+    if isinstance(weekly_by_player, LazyRecordListMapping):
+        return weekly_by_player.records_where(player_names, {"season": season})
+    return select_records(weekly_by_player, player_names, {"season": season})
+
+def build_consistency_chart_players(season_data: Dict[str, pd.DataFrame], weekly_by_player: Mapping[str, List[Dict[str, Any]]], players_by_name: Dict[str, Dict[str, Any]], position: str, season: int, top_n: int) -> List[Dict[str, Any]]:
     """Build weekly consistency/upside chart rows from seasonal and weekly caches."""
     seasonal_candidates: List[Tuple[str, str, float]] = []
     position_frames = season_data.items() if position == "Overall" else [(position, season_data.get(position))]
@@ -131,10 +153,11 @@ def build_consistency_chart_players(season_data: Dict[str, pd.DataFrame], weekly
             seasonal_candidates.append((player_name, pos_label, seasonal_fp))
 
     sorted_candidates = sorted(seasonal_candidates, key=lambda row: row[2], reverse=True)[:top_n]
+    weekly_by_candidate = season_weekly_records(weekly_by_player, [player_name for player_name, _, _ in sorted_candidates], season)
     chart_rows: List[Dict[str, Any]] = []
 
     for player_name, pos_label, _ in sorted_candidates:
-        weekly_records = weekly_by_player.get(player_name, [])
+        weekly_records = weekly_by_candidate.get(player_name, [])
         weekly_points = _season_weekly_points(weekly_records, season)
         if not weekly_points:
             continue
@@ -158,19 +181,23 @@ def build_player_trend_points(by_year: Dict[int, Dict[str, pd.DataFrame]], playe
     if not available_seasons:
         raise HTTPException(status_code=404, detail="No seasonal data available")
 
-    stat_seen = False
+    stat_seen = any(stat in columns for season in available_seasons
+                    for pos, columns in season_stat_columns(by_year, season).items() if position in ("Overall", pos))
+    if not stat_seen:
+        raise HTTPException(status_code=400, detail=f"Invalid stat '{stat}' for position '{position}'")
+
+    # Seasons the player has no row in stay None without being read.
+    played = set(player_seasons(by_year, player_name))
     points: List[Dict[str, Optional[float]]] = []
 
     for season in sorted(available_seasons):
-        season_data = by_year.get(season, {})
-        frames = season_data.items() if position == "Overall" else [(position, season_data.get(position))]
         value: Optional[float] = None
+        season_data = by_year.get(season, {}) if season in played else {}
+        frames = season_data.items() if position == "Overall" else [(position, season_data.get(position))]
 
         for _, df in frames:
             if not isinstance(df, pd.DataFrame) or df.empty:
                 continue
-            if stat in df.columns:
-                stat_seen = True
             if stat not in df.columns or player_name not in df.index:
                 continue
 
@@ -181,7 +208,4 @@ def build_player_trend_points(by_year: Dict[int, Dict[str, pd.DataFrame]], playe
 
         points.append({"season": season, "value": value})
 
-    if not stat_seen:
-        raise HTTPException(status_code=400, detail=f"Invalid stat '{stat}' for position '{position}'")
-
     return available_seasons, points
@@ -1,18 +1,52 @@
 """Cache access helpers for FastAPI routes."""
 
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional, cast
 
-from fastapi import Request
+from fastapi import Query, Request
 
-from backend.util.exceptions import CacheNotLoadedError
+from backend.database.service.sqlite_service import SQLService
+from backend.util.exceptions import CacheNotLoadedError, CacheVersionNotFoundError
 
 
+def cache_version(request: Request,
+                  version: Optional[int] = Query(None, ge=1, description="Read from this cache generation instead of the live one")) -> Optional[int]:
+    """Router dependency that records the requested cache generation on the request."""
+    request.state.cache_version = version
+    return version
+
 def get_app_caches(request: Request) -> Dict[str, Any]:
-    """Return in-memory caches attached to FastAPI app state."""
+    """Return in-memory caches attached to FastAPI app state, for the requested generation when one is pinned."""
     fantasy_app = getattr(request.app.state, "fantasy_app", None)
     if fantasy_app is None or not hasattr(fantasy_app, "caches"):
         raise CacheNotLoadedError("Application cache not initialized", source="cache_helpers")
-    return cast(Dict[str, Any], fantasy_app.caches)
+    version = getattr(request.state, "cache_version", None)
+    if version is None:
+        return cast(Dict[str, Any], fantasy_app.caches)
+    caches = fantasy_app.caches_for(version) if hasattr(fantasy_app, "caches_for") else None
+    if caches is None:
+        raise CacheVersionNotFoundError(f"Data version {version} is not available", source="cache_helpers")
+    return cast(Dict[str, Any], caches)
+
+def get_live_db(request: Request) -> Optional[SQLService]:
+    """Return the cache database service attached to FastAPI app state, if there is one."""
+    db = getattr(getattr(request.app.state, "fantasy_app", None), "db", None)
+    return db if isinstance(db, SQLService) else None
+
+def get_app_db(request: Request) -> Optional[SQLService]:
+    """Return the cache database service when it is pinned to the generation the request's caches come from, else None.
+
+    Request-time reads (pre-rendered player responses, name search) then always agree with the in-memory caches and
+    X-Data-Version; a store that follows the live file could already hold a newer refresh.
+    """
+    version = getattr(request.state, "cache_version", None)
+    db = get_live_db(request)
+    if db is None or db.pinned_generation is None or db.pinned_generation != (version if version is not None else get_app_generation(request)):
+        return None
+    return db
+
+def get_app_generation(request: Request) -> int:
+    """Return the live cache generation of the app, 0 when it has none."""
+    return int(getattr(getattr(request.app.state, "fantasy_app", None), "generation", 0) or 0)
 
 def get_cache(caches: Dict[str, Any], name: str) -> Dict[str, Any]:
     """Get cache by name, raising CacheNotLoadedError if not loaded."""
@@ -0,0 +1,89 @@
+"""Player detail response building, pre-rendering, and stored-blob serving."""
+
+import gzip
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from backend.api.models import PlayerResponse
+from backend.api.util.api_statistics_helpers import find_player_team, get_player_profile
+from backend.util import constants
+
+# Level 1 compresses several times faster than the default 9 and still shrinks weekly-log JSON ~4x.
+_GZIP_LEVEL = 1
+_WEEKLY_STATS_ADAPTER: TypeAdapter[Optional[List[Dict[str, Any]]]] = TypeAdapter(Optional[List[Dict[str, Any]]])
+
+
+def build_player_response(caches: Dict[str, Any], player_name: str, season: Optional[int] = None) -> Optional[PlayerResponse]:
+    """Build a player's detail response from in-memory caches, or None when the player has no season stats."""
+    stats_cache = caches.get(constants.CACHE["STATISTICS"], {})
+    stats_dict, position, available_seasons, player_meta = get_player_profile(stats_cache, player_name, season)
+    if not stats_dict or not position:
+        return None
+    weekly_stats = stats_cache.get(constants.STATS["PLAYER_WEEKLY_STATS"], {}).get(player_name)
+
+    meta = player_meta or {}
+    player_team = meta.get("team")
+    if isinstance(player_team, str):
+        player_team = constants.TEAM_ABBR_NORMALIZATION.get(player_team, player_team)
+    if player_team not in constants.TEAM_METADATA:
+        player_team = find_player_team(player_name, caches.get(constants.CACHE["DEPTH_CHART"], {}))
+
+    return PlayerResponse(name=player_name,
+                          position=position,
+                          team=player_team,
+                          stats=stats_dict,
+                          available_seasons=available_seasons,
+                          age=meta.get("age"),
+                          is_rookie=bool(meta.get("is_rookie", False)),
+                          is_eligible=bool(meta.get("is_eligible", True)),
+                          headshot_url=meta.get("headshot_url"),
+                          weekly_stats=weekly_stats)
+
+def _compressed_json(response: PlayerResponse, weekly_json: bytes) -> bytes:
+    """Serialize a response around its already-serialized weekly_stats (the last field) and gzip it."""
+    head = response.model_dump_json(exclude={"weekly_stats"}).encode()
+    # mtime=0 keeps the bytes deterministic, so unchanged players hash the same on the next refresh.
+    return gzip.compress(head[:-1] + b',"weekly_stats":' + weekly_json + b"}", compresslevel=_GZIP_LEVEL, mtime=0)
+
+def render_player_responses(caches: Dict[str, Any]) -> Iterator[Tuple[str, Optional[int], bytes]]:
+    """Yield (player, season, gzip JSON) for every player's default response (season None) and each season variant."""
+    stats_cache = caches.get(constants.CACHE["STATISTICS"], {})
+    by_year = stats_cache.get(constants.STATS["BY_YEAR"], {})
+    player_names = sorted({name for season_frames in by_year.values() for df in season_frames.values() for name in df.index})
+    for player_name in player_names:
+        default = build_player_response(caches, player_name)
+        if default is None:
+            continue
+        # Season variants differ only in stats and position, so the weekly log is serialized once per player.
+        weekly_json = _WEEKLY_STATS_ADAPTER.dump_json(default.weekly_stats)
+        yield player_name, None, _compressed_json(default, weekly_json)
+        for season in default.available_seasons:
+            stats_dict, position, _, _ = get_player_profile(stats_cache, player_name, season)
+            if stats_dict and position:
+                yield player_name, season, _compressed_json(default.model_copy(update={"stats": stats_dict, "position": position}), weekly_json)
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Return True when an Accept-Encoding header allows gzip with a non-zero q-value, directly or through "*"."""
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding.strip():
+            qualities[coding.strip()] = quality
+    quality = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+    return quality > 0
+
+def stored_json_response(request: Request, body: bytes) -> Response:
+    """Send a stored gzip JSON body as-is when the client accepts gzip, else decompressed."""
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(content=body, media_type="application/json", headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+    return Response(content=gzip.decompress(body), media_type="application/json", headers={"Vary": "Accept-Encoding"})
@@ -7,3 +7,8 @@ def filter_search_results(all_players: List[Dict], query: str) -> List[Dict]:
     """Filter players by search query (case-insensitive substring match)."""
     query_lower = query.lower()
     return [p for p in all_players if query_lower in p["name"].lower()]
+
+def rank_search_results(results: List[Dict], query: str) -> List[Dict]:
+    """Order matches with name-prefix hits first, then alphabetically by name."""
+    query_lower = query.lower()
+    return sorted(results, key=lambda p: (not (p.get("name") or "").lower().startswith(query_lower), (p.get("name") or "").lower()))
@@ -1,8 +1,11 @@
 """Main application orchestrator for data sources and caching"""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from backend.api.util.player_response_helpers import render_player_responses
+from backend.config.settings import CACHE_PLAYER_RESPONSES, CACHE_SNAPSHOT, DB_READ_ONLY
+from backend.database.service.lazy_cache import LazyLRUMapping
 from backend.database.service.sqlite_service import SQLService
 from backend.depth_chart.nrp import NRPDepthChart
 from backend.schedules.schedules import Schedules
@@ -11,6 +14,10 @@ from backend.util import constants
 
 logger = logging.getLogger(__name__)
 
+_CACHE_NAMES = [constants.CACHE["DEPTH_CHART"], constants.CACHE["SCHEDULES"], constants.CACHE["STATISTICS"]]
+# Older generations are only read by version-pinned requests, so few stay resident.
+_RESIDENT_GENERATIONS = 2
+
 
 class App:
     """Orchestrates data fetching, caching, and loading for all sources"""
@@ -18,16 +25,31 @@ class App:
     def __init__(self) -> None:
         self.db: SQLService = SQLService()
         self.caches: Dict[str, Any] = {}
+        self.generation: int = 0
+        self._generation_caches: Optional[LazyLRUMapping[int, Dict[str, Any]]] = None
     
     def initialize(self) -> None:
         """Load cached data when available, otherwise fetch and persist fresh data."""
         if self.db.has_cached_data():
+            self._serve_read_only()
+            snapshot = self.db.load_snapshot() if CACHE_SNAPSHOT else None
+            if snapshot is not None:
+                self.caches.update(snapshot)
+                return
             self.load()
             return
         else:
             logger.info("Cache tables missing; fetching fresh data and rebuilding cache.")
             self.run()
             self.save()
+            # Request-time reads (player responses, search, lazy loads) must not share the writer connection.
+            self._serve_read_only()
+
+    def _serve_read_only(self) -> None:
+        """Serve the live cache through the backend's read-only view when DB_READ_ONLY is set, then adopt its generation."""
+        if DB_READ_ONLY:
+            self.db.use_read_only()
+        self._sync_generation()
 
     def run(self) -> None:
         """Fetch fresh data from all sources"""
@@ -38,14 +60,67 @@ class App:
         for cache_name, instance in instances:
             instance.run()
             self.caches[cache_name] = instance.get_cache()
+
+    def run_incremental(self) -> None:
+        """Rebuild only CURRENT_SEASON data and splice it into the persisted caches; falls back to run() without a cache."""
+        if not self.db.has_cached_data():
+            logger.info("No cached data to refresh incrementally; running a full refresh.")
+            self.run()
+            return
+        persisted = self.db.load_many(_CACHE_NAMES)
+        seasons = [constants.CURRENT_SEASON]
+        stats_cache = persisted[constants.CACHE["STATISTICS"]]
+        known_players = {player["name"] for player in stats_cache.get(constants.STATS["ALL_PLAYERS"], [])}
+
+        # Depth charts only ever cover the current season, so they are rebuilt whole.
+        depth_chart = NRPDepthChart()
+        depth_chart.run()
+        schedules = Schedules(seasons)
+        schedules.run()
+        schedules.splice_into(persisted[constants.CACHE["SCHEDULES"]])
+        statistics = Statistics(seasons)
+        statistics.run(known_players)
+        statistics.splice_into(stats_cache)
+
+        self.caches[constants.CACHE["DEPTH_CHART"]] = depth_chart.get_cache()
+        self.caches[constants.CACHE["SCHEDULES"]] = schedules.get_cache()
+        self.caches[constants.CACHE["STATISTICS"]] = statistics.get_cache()
     
     def save(self) -> None:
-        """Save all caches to database"""
-        for name, cache in self.caches.items():
-            self.db.save_to_db(cache, name)
+        """Save all caches into a staging store and atomically promote it over the live cache"""
+        with self.db.staged_write():
+            for name, cache in self.caches.items():
+                self.db.save_to_db(cache, name)
+            if CACHE_PLAYER_RESPONSES and constants.CACHE["STATISTICS"] in self.caches:
+                self.db.save_player_responses(render_player_responses(self.caches))
+        self._sync_generation()
+        if CACHE_SNAPSHOT:
+            self.db.write_snapshot(self.caches)
 
     def load(self) -> None:
-        """Load all caches from database"""
-        self.caches[constants.CACHE["DEPTH_CHART"]] = self.db.load_from_db(constants.CACHE["DEPTH_CHART"])
-        self.caches[constants.CACHE["SCHEDULES"]] = self.db.load_from_db(constants.CACHE["SCHEDULES"])
-        self.caches[constants.CACHE["STATISTICS"]] = self.db.load_from_db(constants.CACHE["STATISTICS"])
+        """Load all caches from database, reading tables concurrently when the backend allows it"""
+        self.caches.update(self.db.load_many(_CACHE_NAMES))
+
+    def _sync_generation(self) -> None:
+        """Adopt the live cache's generation number and forget caches loaded from older generations."""
+        build = self.db.cache_build_info()
+        self.generation = build["generation"] if build else 0
+        self._generation_caches = None
+
+    def caches_for(self, version: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Return the caches of one kept generation (the live ones for None), or None when it is not kept."""
+        if version is None or version == self.generation:
+            return self.caches
+        if self._generation_caches is None or version not in self._generation_caches:
+            kept = [generation for generation in self.db.generations() if generation != self.generation]
+            if version not in kept:
+                return None
+            self._generation_caches = LazyLRUMapping(kept, self._load_generation, max_entries=_RESIDENT_GENERATIONS, name="generations")
+        return self._generation_caches[version]
+
+    def _load_generation(self, generation: int) -> Dict[str, Any]:
+        service = self.db.open_generation(generation)
+        try:
+            return service.load_many(_CACHE_NAMES)
+        finally:
+            service.close()
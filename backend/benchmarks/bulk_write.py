@@ -0,0 +1,74 @@
+"""Benchmark SQLite cache save time: per-table autocommit `to_sql` vs one bulk-write transaction.
+
+Usage:
+    uv run python -m backend.benchmarks.bulk_write [--source-db PATH] [--repeat N]
+
+Caches are loaded from `--source-db` (default `DB_PATH`) when it holds a complete cache, so a refreshed
+2018-2025 database gives full-dataset numbers; otherwise synthetic caches of the same shape are used.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict
+
+from backend.benchmarks.synthetic import build_app_caches
+from backend.config.settings import DB_PATH
+from backend.database.DAO.sqlite_dao import SQLiteCacheManager
+from backend.database.service.sqlite_service import SQLService
+from backend.util import constants
+
+
+def _load_source_caches(source_db: str) -> Dict[str, Any]:
+    """Load real caches when the source database is complete, else build synthetic ones."""
+    if Path(source_db).exists():
+        service = SQLService(SQLiteCacheManager(source_db))
+        try:
+            if service.has_cached_data():
+                print(f"Using cached dataset from {source_db}")
+                return {name: service.load_from_db(name) for name in constants.CACHE.values()}
+        finally:
+            service.close()
+    print(f"No complete cache at {source_db}; using synthetic {constants.SEASONS[0]}-{constants.SEASONS[-1]} caches")
+    return build_app_caches(constants.SEASONS)
+
+
+def _time_save(caches: Dict[str, Any], db_path: Path, bulk: bool) -> float:
+    """Save all caches into a fresh database file and return elapsed seconds."""
+    db_path.unlink(missing_ok=True)
+    service = SQLService(SQLiteCacheManager(str(db_path)))
+    try:
+        start = perf_counter()
+        if bulk:
+            with service.bulk_write():
+                for name, cache in caches.items():
+                    service.save_to_db(cache, name)
+        else:
+            for name, cache in caches.items():
+                service.save_to_db(cache, name)
+        return perf_counter() - start
+    finally:
+        service.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source-db", default=DB_PATH, help="Database to read the benchmark dataset from")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode; the best run is reported")
+    args = parser.parse_args()
+
+    caches = _load_source_caches(args.source_db)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "bench_cache.db"
+        before = min(_time_save(caches, db_path, bulk=False) for _ in range(args.repeat))
+        after = min(_time_save(caches, db_path, bulk=True) for _ in range(args.repeat))
+
+    print(f"{'mode':<28}{'save (s)':>10}")
+    print(f"{'per-table autocommit':<28}{before:>10.3f}")
+    print(f"{'bulk-write transaction':<28}{after:>10.3f}")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Micro-benchmark combine_aliases: per-metric df[cols].bfill(axis=1) on a frame copy vs the NumPy coalesce.
+
+Usage:
+    uv run python -m backend.benchmarks.combine_aliases [--seasons 2018-2025] [--players N] [--weeks N] [--repeat N]
+
+The input is the synthetic weekly frame after the source merge (wide, 100k+ rows by default), with count
+columns cast to int32 as nflreadpy returns them, so the benchmark runs offline.
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from backend.benchmarks.roster_extraction import _parse_seasons
+from backend.benchmarks.synthetic import build_weekly_sources
+from backend.statistics import stats_config
+from backend.statistics.statistics import Statistics
+from backend.statistics.util import stats_helpers
+from backend.util import constants
+
+_INT_COUNT_COLUMNS = ["attempts", "carries", "receptions", "targets", "passing_tds", "rushing_tds", "receiving_tds"]
+
+
+def _bfill_combine_aliases(df: pd.DataFrame) -> pd.DataFrame:
+    """The previous implementation: copy the frame, then backfill across each metric's source columns."""
+    interpreted = df.copy()
+    for out_col, sources in stats_config.INTERPRETED_METRIC_SOURCES.items():
+        cols = [col for col in sources if col in interpreted.columns]
+        if cols:
+            interpreted[out_col] = interpreted[cols].bfill(axis=1).iloc[:, 0]
+    return interpreted
+
+
+def _best_time(combine: Callable[[pd.DataFrame], pd.DataFrame], df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        combine(df)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=_parse_seasons, default=constants.SEASONS, help="Season range, e.g. 2018-2025")
+    parser.add_argument("--players", type=int, default=800, help="Players per season")
+    parser.add_argument("--weeks", type=int, default=17, help="Weeks per player and season")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation; the best run is reported")
+    args = parser.parse_args()
+
+    weekly_df = Statistics(args.seasons)._merge_weekly_statistics_data(build_weekly_sources(args.seasons, args.players, args.weeks))
+    weekly_df = weekly_df.astype({column: np.int32 for column in _INT_COUNT_COLUMNS})
+    try:
+        pd.testing.assert_frame_equal(stats_helpers.combine_aliases(weekly_df), _bfill_combine_aliases(weekly_df))
+    except AssertionError as e:
+        raise SystemExit(f"Implementations disagree; aborting benchmark\n{e}") from e
+
+    before = _best_time(_bfill_combine_aliases, weekly_df, args.repeat)
+    after = _best_time(stats_helpers.combine_aliases, weekly_df, args.repeat)
+
+    print(f"rows={len(weekly_df)} columns={len(weekly_df.columns)} metrics={len(stats_config.INTERPRETED_METRIC_SOURCES)}")
+    print(f"{'implementation':<28}{'time (s)':>10}")
+    print(f"{'copy + bfill(axis=1)':<28}{before:>10.3f}")
+    print(f"{'numpy coalesce':<28}{after:>10.3f}")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
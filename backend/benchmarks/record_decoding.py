@@ -0,0 +1,76 @@
+"""Benchmark decoding the weekly stats table into record dicts: per-cell `pd.isna` vs column-wise masks.
+
+Usage:
+    uv run python -m backend.benchmarks.record_decoding [--source-db PATH] [--repeat N]
+
+The weekly table is read from `--source-db` (default `DB_PATH`) when it exists, so a refreshed database
+gives full-dataset numbers; otherwise a synthetic weekly table of the same shape is used.
+"""
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from backend.benchmarks.synthetic import build_statistics_cache
+from backend.config.settings import DB_PATH
+from backend.database.DAO.base_dao import frame_to_records
+from backend.database.DAO.sqlite_dao import SQLiteCacheManager
+from backend.util import constants
+
+_WEEKLY_TABLE = f"{constants.CACHE['STATISTICS']}_{constants.STATS['PLAYER_WEEKLY_STATS']}"
+
+
+def _load_weekly_frame(source_db: str) -> pd.DataFrame:
+    """Read the real weekly table when present, else flatten synthetic weekly records."""
+    if Path(source_db).exists():
+        manager = SQLiteCacheManager(source_db)
+        try:
+            if manager.table_exists(_WEEKLY_TABLE):
+                print(f"Using {_WEEKLY_TABLE} from {source_db}")
+                return manager.load_table(_WEEKLY_TABLE)
+        finally:
+            manager.close()
+    print(f"No {_WEEKLY_TABLE} at {source_db}; using synthetic {constants.SEASONS[0]}-{constants.SEASONS[-1]} weekly table")
+    weekly = build_statistics_cache(constants.SEASONS)[constants.STATS["PLAYER_WEEKLY_STATS"]]
+    return pd.DataFrame([{"__player_key": player, **week} for player, weeks in weekly.items() for week in weeks])
+
+
+def _per_cell_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """The previous decoding: one pd.isna call per cell."""
+    return [{key: (None if pd.isna(value) else value) for key, value in rec.items()} for rec in df.to_dict("records")]
+
+
+def _best_time(decode: Callable[[pd.DataFrame], List[Dict[str, Any]]], df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        decode(df)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source-db", default=DB_PATH, help="Database to read the weekly table from")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per decoder; the best run is reported")
+    args = parser.parse_args()
+
+    df = _load_weekly_frame(args.source_db)
+    if _per_cell_records(df) != frame_to_records(df):
+        raise SystemExit("Decoders disagree; aborting benchmark")
+
+    before = _best_time(_per_cell_records, df, args.repeat)
+    after = _best_time(frame_to_records, df, args.repeat)
+
+    print(f"rows={len(df)} columns={len(df.columns)} missing cells={int(df.isna().to_numpy().sum())}")
+    print(f"{'decoder':<28}{'time (s)':>10}")
+    print(f"{'per-cell pd.isna':<28}{before:>10.3f}")
+    print(f"{'column-wise masks':<28}{after:>10.3f}")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
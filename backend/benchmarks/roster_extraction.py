@@ -0,0 +1,103 @@
+"""Benchmark roster extraction: the previous per-row itertuples loop vs column operations.
+
+Usage:
+    uv run python -m backend.benchmarks.roster_extraction [--seasons 2018-2025] [--players N] [--repeat N]
+
+Rosters are synthetic (shaped like nflreadpy load_rosters() output: one row per player per season), so
+the benchmark runs offline; the stage scales with seasons x roster size.
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, Dict, List, cast
+
+import pandas as pd
+
+from backend.benchmarks.synthetic import build_rosters
+from backend.statistics.statistics import RosterData, Statistics
+from backend.util import constants
+
+
+def _row_loop_roster_data(rosters: pd.DataFrame) -> RosterData:
+    """The previous extraction: one Python iteration with getattr/pd.notna/pd.to_datetime per roster row."""
+    current_season = constants.CURRENT_SEASON
+    today = pd.Timestamp.now().normalize()
+    player_positions: Dict[str, str] = {}
+    player_ages: Dict[str, int] = {}
+    eligible_players: set[str] = set()
+    headshot_tracker: Dict[str, tuple[int, str]] = {}
+    player_teams: Dict[str, str] = {}
+    rookies: Dict[str, bool] = {}
+    for row in rosters.itertuples(index=False):
+        name = getattr(row, "full_name", None)
+        if not isinstance(name, str) or not name:
+            continue
+        season_raw = getattr(row, "season", None)
+        season_int: int | None = None
+        if pd.notna(season_raw):
+            try:
+                season_int = int(cast(int | float | str, season_raw))
+            except (TypeError, ValueError):
+                season_int = None
+        position = getattr(row, "position", None)
+        if not isinstance(position, str) or position not in constants.POSITIONS:
+            continue
+        player_positions[name] = position
+        if pd.notna(birth_date := getattr(row, "birth_date", None)):
+            age = (today - pd.to_datetime(birth_date)).days // 365
+            if age > 0:
+                player_ages[name] = int(age)
+        if isinstance(headshot := getattr(row, "headshot_url", None), str) and headshot and season_int is not None:
+            prev = headshot_tracker.get(name)
+            if not prev or season_int > prev[0]:
+                headshot_tracker[name] = (season_int, headshot)
+        if season_int == current_season:
+            if getattr(row, "status", None) != "RET":
+                eligible_players.add(name)
+            if isinstance(team := getattr(row, "team", None), str) and team:
+                player_teams[name] = team
+            if (entry_year := getattr(row, "entry_year", None)) == current_season and pd.notna(entry_year):
+                rookies[name] = True
+    player_headshots = {name: headshot for name, (_, headshot) in headshot_tracker.items()}
+    return RosterData(player_positions, player_ages, eligible_players, player_headshots, player_teams, rookies)
+
+
+def _best_time(extract: Callable[[pd.DataFrame], RosterData], rosters: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        extract(rosters)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def _parse_seasons(value: str) -> List[int]:
+    first, _, last = value.partition("-")
+    return list(range(int(first), int(last or first) + 1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=_parse_seasons, default=constants.SEASONS, help="Season range, e.g. 2018-2025")
+    parser.add_argument("--players", type=int, default=3000, help="Roster rows per season")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation; the best run is reported")
+    args = parser.parse_args()
+
+    rosters = build_rosters(args.seasons, args.players)
+    vectorized = Statistics(args.seasons)._extract_all_roster_data
+    before_data, after_data = _row_loop_roster_data(rosters), vectorized(rosters)
+    if before_data != after_data or [list(part) for part in before_data if isinstance(part, dict)] != [list(part) for part in after_data if isinstance(part, dict)]:
+        raise SystemExit("Implementations disagree; aborting benchmark")
+
+    before = _best_time(_row_loop_roster_data, rosters, args.repeat)
+    after = _best_time(vectorized, rosters, args.repeat)
+
+    print(f"seasons={args.seasons[0]}-{args.seasons[-1]} rows={len(rosters)} players={len(after_data.positions)}")
+    print(f"{'implementation':<28}{'time (s)':>10}")
+    print(f"{'itertuples loop':<28}{before:>10.3f}")
+    print(f"{'column operations':<28}{after:>10.3f}")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark SQLService save/load round trips per cache family and storage backend, written as JSON.
+
+Usage:
+    uv run python -m backend.benchmarks.storage_roundtrip [--seasons N] [--players N] [--stat-columns N]
+        [--weeks N] [--backend sqlite|parquet|arrow ...] [--repeat N] [--output PATH]
+
+Each family is saved into a fresh store (inside `bulk_write()`, as a refresh does) and loaded back eagerly
+by a new service, so timings, peak memory, and on-disk size are measured per family in isolation.
+Caches are synthetic (`backend/benchmarks/synthetic.py`), so runs at the same scale are comparable
+across storage changes.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+import pyarrow as pa
+
+from backend.benchmarks.synthetic import build_app_caches
+from backend.database.DAO.arrow_dao import ArrowCacheManager
+from backend.database.DAO.base_dao import BaseCacheManager
+from backend.database.DAO.sqlite_dao import SQLiteCacheManager
+from backend.database.service.sqlite_service import SQLService
+from backend.util import constants
+
+_BACKENDS = ["sqlite", "parquet", "arrow"]
+
+
+def _seasons(count: int) -> List[int]:
+    """Return the latest `count` seasons ending at the current season."""
+    last = constants.SEASONS[-1]
+    return list(range(last - count + 1, last + 1))
+
+
+def _row_count(name: str, cache: Any) -> int:
+    """Count the rows a family persists: frames by length, record lists by entry."""
+    if name == constants.CACHE["STATISTICS"]:
+        return (len(cache[constants.STATS["ALL_PLAYERS"]])
+                + sum(len(df) for position_map in cache[constants.STATS["BY_YEAR"]].values() for df in position_map.values())
+                + sum(len(weeks) for weeks in cache[constants.STATS["PLAYER_WEEKLY_STATS"]].values()))
+    if name == constants.CACHE["SCHEDULES"]:
+        return sum(len(df) for team_map in cache.values() for df in team_map.values())
+    return sum(len(df) for df in cache.values())
+
+
+def _open_store(backend: str, root: Path) -> BaseCacheManager:
+    if backend == "sqlite":
+        return SQLiteCacheManager(str(root / "cache.db"))
+    return ArrowCacheManager(str(root / "cache"), file_format=backend)
+
+
+def _disk_bytes(root: Path) -> int:
+    return sum(path.stat().st_size for path in root.rglob("*") if path.is_file())
+
+
+def _measure(operation: Callable[[], Any], trace_memory: bool) -> tuple[float, int]:
+    """Run operation once; return elapsed seconds and, when traced, peak traced bytes."""
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        start = perf_counter()
+        operation()
+        elapsed = perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return elapsed, peak
+
+
+def _round_trip(backend: str, name: str, cache: Any, trace_memory: bool) -> Dict[str, Any]:
+    """Save one family into a fresh store, then load it back with a new service."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        writer = SQLService(_open_store(backend, root), lazy=False)
+        try:
+            def save() -> None:
+                with writer.bulk_write():
+                    writer.save_to_db(cache, name)
+            save_s, save_peak = _measure(save, trace_memory)
+        finally:
+            writer.close()
+        disk_bytes = _disk_bytes(root)
+
+        reader = SQLService(_open_store(backend, root), lazy=False)
+        try:
+            loaded: Dict[str, Any] = {}
+            load_s, load_peak = _measure(lambda: loaded.update(cache=reader.load_from_db(name)), trace_memory)
+        finally:
+            reader.close()
+    if _row_count(name, loaded["cache"]) != _row_count(name, cache):
+        raise SystemExit(f"{backend}/{name}: loaded row count differs from saved; aborting benchmark")
+    return {"save_s": save_s, "load_s": load_s, "save_peak_bytes": save_peak, "load_peak_bytes": load_peak, "disk_bytes": disk_bytes}
+
+
+def _benchmark(backend: str, name: str, cache: Any, repeat: int) -> Dict[str, Any]:
+    """Best-of-repeat timings from untraced runs, plus one tracemalloc run for peak memory."""
+    runs = [_round_trip(backend, name, cache, trace_memory=False) for _ in range(repeat)]
+    traced = _round_trip(backend, name, cache, trace_memory=True)
+    rows = _row_count(name, cache)
+    save_s = min(run["save_s"] for run in runs)
+    load_s = min(run["load_s"] for run in runs)
+    return {"backend": backend,
+            "family": name,
+            "rows": rows,
+            "save_s": round(save_s, 4),
+            "load_s": round(load_s, 4),
+            "save_rows_per_s": round(rows / save_s),
+            "load_rows_per_s": round(rows / load_s),
+            "save_peak_mb": round(traced["save_peak_bytes"] / 2**20, 1),
+            "load_peak_mb": round(traced["load_peak_bytes"] / 2**20, 1),
+            "disk_mb": round(runs[-1]["disk_bytes"] / 2**20, 2)}
+
+
+def _environment() -> Dict[str, Any]:
+    return {"python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "pandas": pd.__version__,
+            "pyarrow": pa.__version__,
+            "sqlite": sqlite3.sqlite_version}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=int, default=len(constants.SEASONS), help="Number of seasons, ending at the current season")
+    parser.add_argument("--players", type=int, default=600, help="Players per season")
+    parser.add_argument("--stat-columns", type=int, default=200, help="Stat columns per seasonal and weekly row")
+    parser.add_argument("--weeks", type=int, default=10, help="Weekly game logs per player and season")
+    parser.add_argument("--backend", action="append", choices=_BACKENDS, help="Backend to benchmark (repeatable; default all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per family; the best run is reported")
+    parser.add_argument("--output", default="storage_roundtrip.json", help="Path of the JSON results file")
+    args = parser.parse_args()
+
+    scale = {"seasons": _seasons(args.seasons), "players_per_season": args.players, "stat_columns": args.stat_columns, "weeks_per_player": args.weeks}
+    caches = build_app_caches(scale["seasons"], args.players, args.stat_columns, args.weeks)
+    results = [_benchmark(backend, name, cache, args.repeat) for backend in args.backend or _BACKENDS for name, cache in caches.items()]
+
+    report = {"benchmark": "storage_roundtrip",
+              "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+              "environment": _environment(),
+              "scale": scale,
+              "repeat": args.repeat,
+              "results": results}
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"{'backend':<9}{'family':<12}{'rows':>9}{'save (s)':>10}{'load (s)':>10}{'save rows/s':>13}{'load rows/s':>13}{'save MB':>9}{'load MB':>9}{'disk MB':>9}")
+    for row in results:
+        print(f"{row['backend']:<9}{row['family']:<12}{row['rows']:>9}{row['save_s']:>10.3f}{row['load_s']:>10.3f}{row['save_rows_per_s']:>13}"
+              f"{row['load_rows_per_s']:>13}{row['save_peak_mb']:>9.1f}{row['load_peak_mb']:>9.1f}{row['disk_mb']:>9.2f}")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Synthetic caches shaped like Statistics, Schedules, and NRPDepthChart output for storage benchmarks."""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from backend.statistics import stats_config
+from backend.util import constants
+
+_DEPTH_SLOTS = ["QB", "RB", "WR", "WR", "WR", "TE"]
+
+
+def _player_name(index: int) -> str:
+    return f"Synthetic Player {index:05d}"
+
+
+def build_statistics_cache(seasons: List[int], players_per_season: int = 600, stat_columns: int = 200, weeks_per_player: int = 10, seed: int = 0) -> Dict[str, Any]:
+    """Build a Statistics.get_cache()-shaped dict: all_players, by_year frames, and weekly record lists."""
+    rng = np.random.default_rng(seed)
+    stat_names = [f"stat_{column:03d}" for column in range(stat_columns)]
+    positions = constants.POSITIONS
+
+    by_year: Dict[int, Dict[str, pd.DataFrame]] = {}
+    weekly: Dict[str, List[Dict[str, Any]]] = {}
+    for season in seasons:
+        names = [_player_name(index) for index in range(players_per_season)]
+        frame = pd.DataFrame(rng.random((players_per_season, stat_columns)).round(3) * 100, columns=stat_names)
+        frame.insert(0, "player_display_name", names)
+        frame.insert(1, "team", rng.choice(list(constants.TEAM_METADATA), players_per_season))
+        frame["__pos"] = [positions[index % len(positions)] for index in range(players_per_season)]
+        by_year[season] = {position: group.drop(columns="__pos").set_index("player_display_name") for position, group in frame.groupby("__pos")}
+
+        week_values = rng.random((players_per_season * weeks_per_player, stat_columns)).round(2) * 30
+        for row_index, values in enumerate(week_values):
+            player_index, week = divmod(row_index, weeks_per_player)
+            record: Dict[str, Any] = {"season": season, "week": week + 1, "opponent_team": "KC"}
+            record.update(zip(stat_names, values.tolist()))
+            weekly.setdefault(names[player_index], []).append(record)
+
+    all_players = [{"name": _player_name(index),
+                    "position": positions[index % len(positions)],
+                    "age": int(22 + index % 15),
+                    "headshot_url": None if index % 7 == 0 else f"https://example.com/{index}.png",
+                    "team": list(constants.TEAM_METADATA)[index % len(constants.TEAM_METADATA)],
+                    "is_rookie": index % 11 == 0,
+                    "is_eligible": index % 9 != 0} for index in range(players_per_season)]
+
+    return {constants.STATS["ALL_PLAYERS"]: all_players,
+            constants.STATS["BY_YEAR"]: by_year,
+            constants.STATS["PLAYER_WEEKLY_STATS"]: weekly}
+
+
+def build_rosters(seasons: List[int], players_per_season: int = 3000, seed: int = 0) -> pd.DataFrame:
+    """Build an nflreadpy load_rosters()-shaped table: one row per player per season, with realistic gaps.
+
+    Players carry over between seasons, some rows have other positions, missing birth dates or headshots,
+    retired statuses, and rookies enter in each season.
+    """
+    rng = np.random.default_rng(seed)
+    positions = [*constants.POSITIONS, "OL", "DL", "LB", "CB", "S", "K"]
+    teams = list(constants.TEAM_METADATA)
+    frames = []
+    for offset, season in enumerate(seasons):
+        # Each season drops the oldest players and adds new ones, so names overlap across seasons.
+        player_ids = np.arange(offset * players_per_season // 5, offset * players_per_season // 5 + players_per_season)
+        birth_days = rng.integers(21 * 365, 38 * 365, players_per_season)
+        frames.append(pd.DataFrame({
+            "season": season,
+            "team": rng.choice(teams, players_per_season),
+            "position": [positions[player_id % len(positions)] for player_id in player_ids],
+            "full_name": [_player_name(int(player_id)) for player_id in player_ids],
+            "birth_date": np.where(rng.random(players_per_season) < 0.05, None,
+                                   (pd.Timestamp(f"{season}-09-01") - pd.to_timedelta(birth_days, unit="D")).strftime("%Y-%m-%d")),
+            "headshot_url": [None if player_id % 7 == 0 else f"https://example.com/{season}/{player_id}.png" for player_id in player_ids],
+            "status": rng.choice(["ACT", "RES", "RET", "INA"], players_per_season, p=[0.8, 0.1, 0.05, 0.05]),
+            "entry_year": np.where(player_ids >= offset * players_per_season // 5 + players_per_season * 4 // 5, season, season - 3),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+_WEEKLY_SOURCE_COLUMN_MAPS = {
+    "snap_counts": stats_config.SNAP_COUNTS_COLUMN_MAP,
+    "ff_opp_weekly": stats_config.FF_OPP_WEEKLY_COLUMN_MAP,
+    "nextgen_pass_weekly": stats_config.NEXTGEN_PASS_COLUMN_MAP,
+    "nextgen_rec_weekly": stats_config.NEXTGEN_REC_COLUMN_MAP,
+    "nextgen_rush_weekly": stats_config.NEXTGEN_RUSH_COLUMN_MAP,
+    "pfr_pass_weekly": stats_config.PFR_PASS_WEEKLY_COLUMN_MAP,
+    "pfr_rush_weekly": stats_config.PFR_RUSH_WEEKLY_COLUMN_MAP,
+    "pfr_rec_weekly": stats_config.PFR_REC_WEEKLY_COLUMN_MAP,
+}
+
+
+def build_weekly_sources(seasons: List[int], players_per_season: int = 600, weeks: int = 17, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """Build loader-shaped weekly source tables: player_weekly plus the eight sources merged onto it.
+
+    Each source covers a random subset of player-weeks plus a few duplicate and unmatched rows; base game_ids
+    are sometimes missing, and PFR sources use names without suffixes so name alignment has work to do.
+    """
+    rng = np.random.default_rng(seed)
+    teams = list(constants.TEAM_METADATA)
+    player_index = np.tile(np.repeat(np.arange(players_per_season), weeks), len(seasons))
+    keys = pd.DataFrame({
+        "season": np.repeat(seasons, players_per_season * weeks),
+        "week": np.tile(np.arange(1, weeks + 1), players_per_season * len(seasons)),
+        "player_id": [f"00-{index:07d}" for index in player_index],
+        "player_display_name": [_player_name(int(index)) + (" Jr." if index % 10 == 0 else "") for index in player_index],
+        "position": [constants.POSITIONS[index % len(constants.POSITIONS)] for index in player_index],
+        "team": [teams[index % len(teams)] for index in player_index],
+    })
+    keys.insert(2, "game_id", keys["season"].astype(str) + "_" + keys["week"].astype(str).str.zfill(2) + "_" + keys["team"] + "_OPP")
+
+    def frame(column_map: Dict[str, str], rows: pd.DataFrame) -> pd.DataFrame:
+        columns = {}
+        for column in column_map.values():
+            columns[column] = rows[column] if column in rows.columns else rng.random(len(rows)).round(3) * 100
+        return pd.DataFrame(columns)
+
+    base = keys.assign(player_name=keys["player_display_name"], position_group=keys["position"], opponent_team="OPP")
+    sources = {"player_weekly": frame(stats_config.PLAYER_WEEKLY_COLUMN_MAP, base)}
+    sources["player_weekly"].loc[rng.random(len(base)) < 0.05, "game_id"] = None
+    for source_key, column_map in _WEEKLY_SOURCE_COLUMN_MAPS.items():
+        rows = keys.loc[rng.random(len(keys)) < 0.8]
+        rows = pd.concat([rows, rows.sample(frac=0.02, random_state=seed), keys.sample(frac=0.02, random_state=seed + 1).assign(week=99)], ignore_index=True)
+        if source_key.startswith("pfr_"):
+            rows = rows.assign(player_display_name=rows["player_display_name"].str.removesuffix(" Jr."))
+        sources[source_key] = frame(column_map, rows)
+    return sources
+
+
+def build_schedules_cache(seasons: List[int], weeks: int = 18, seed: int = 0) -> Dict[int, Dict[str, pd.DataFrame]]:
+    """Build a Schedules.get_cache()-shaped dict: season -> team -> week-indexed schedule frame."""
+    rng = np.random.default_rng(seed)
+    teams = list(constants.TEAM_METADATA)
+    schedules: Dict[int, Dict[str, pd.DataFrame]] = {}
+    for season in seasons:
+        for team_index, team in enumerate(teams):
+            bye_week = 5 + team_index % 10
+            rows = [{"week": week,
+                     "opponent": "BYE" if week == bye_week else teams[(team_index + week) % len(teams)],
+                     "home_away": None if week == bye_week else ("HOME" if week % 2 else "AWAY"),
+                     "team_score": None if week == bye_week else float(rng.integers(0, 45)),
+                     "opponent_score": None if week == bye_week else float(rng.integers(0, 45))} for week in range(1, weeks + 1)]
+            schedules.setdefault(season, {})[team] = pd.DataFrame(rows).set_index("week")
+    return schedules
+
+
+def build_depth_chart_cache() -> Dict[str, pd.DataFrame]:
+    """Build an NRPDepthChart.get_cache()-shaped dict: team -> position-indexed depth chart frame."""
+    charts: Dict[str, pd.DataFrame] = {}
+    for team in constants.TEAM_METADATA:
+        rows = [{"position": position,
+                 "starter": f"{team} {position}{slot} Starter",
+                 "2nd": f"{team} {position}{slot} Backup",
+                 "3rd": None,
+                 "4th": None} for slot, position in enumerate(_DEPTH_SLOTS)]
+        charts[team] = pd.DataFrame(rows).set_index("position").rename_axis(team)
+    return charts
+
+
+def build_app_caches(seasons: List[int], players_per_season: int = 600, stat_columns: int = 200, weeks_per_player: int = 10) -> Dict[str, Any]:
+    """Build a full App.caches-shaped dict for all three cache families."""
+    return {constants.CACHE["DEPTH_CHART"]: build_depth_chart_cache(),
+            constants.CACHE["SCHEDULES"]: build_schedules_cache(seasons),
+            constants.CACHE["STATISTICS"]: build_statistics_cache(seasons, players_per_season, stat_columns, weeks_per_player)}
@@ -0,0 +1,87 @@
+"""Benchmark the weekly source merge: chained pandas left merges vs the single-pass factorized join.
+
+Usage:
+    uv run python -m backend.benchmarks.weekly_merge [--seasons 2018-2025] [--players N] [--weeks N] [--repeat N]
+
+Sources are synthetic (loader-shaped player_weekly plus the eight weekly sources), so the benchmark runs offline.
+"""
+
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from backend.benchmarks.roster_extraction import _parse_seasons
+from backend.benchmarks.synthetic import build_weekly_sources
+from backend.statistics.statistics import Statistics
+from backend.statistics.util import stats_helpers
+from backend.util import constants
+
+Merge = Callable[[Dict[str, pd.DataFrame]], pd.DataFrame]
+
+
+def _chained_merge_weekly(sources: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """The previous merge: one left merge per source, each copying the widened weekly frame."""
+    weekly_df = sources["player_weekly"]
+    weekly_join_specs: List[tuple[str, List[str]]] = [
+        ("snap_counts", ["season", "week", "player_display_name", "position", "team"]),
+        ("ff_opp_weekly", ["season", "week", "player_id", "player_display_name", "position", "team"]),
+        ("nextgen_pass_weekly", ["season", "week", "player_display_name", "position", "team"]),
+        ("nextgen_rec_weekly", ["season", "week", "player_display_name", "position", "team"]),
+        ("nextgen_rush_weekly", ["season", "week", "player_display_name", "position", "team"]),
+        ("pfr_pass_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
+        ("pfr_rush_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
+        ("pfr_rec_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
+    ]
+    for source_key, join_candidates in weekly_join_specs:
+        source_df = stats_helpers.align_pfr_seasonal_names(sources[source_key], weekly_df)
+        join_keys = [key for key in join_candidates if key in weekly_df.columns and key in source_df.columns]
+        if join_keys:
+            weekly_df = weekly_df.merge(source_df.drop_duplicates(subset=join_keys), on=join_keys, how="left")
+    return weekly_df
+
+
+def _measure(merge: Merge, sources: Dict[str, pd.DataFrame], repeat: int) -> tuple[float, int]:
+    """Best-of-repeat seconds from untraced runs, plus peak traced bytes from one tracemalloc run."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        merge(sources)
+        best = min(best, perf_counter() - start)
+    tracemalloc.start()
+    try:
+        merge(sources)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=_parse_seasons, default=constants.SEASONS, help="Season range, e.g. 2018-2025")
+    parser.add_argument("--players", type=int, default=600, help="Players per season")
+    parser.add_argument("--weeks", type=int, default=17, help="Weeks per player and season")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation; the best run is reported")
+    args = parser.parse_args()
+
+    sources = build_weekly_sources(args.seasons, args.players, args.weeks)
+    single_pass = Statistics(args.seasons)._merge_weekly_statistics_data
+    expected = _chained_merge_weekly(sources)
+    try:
+        pd.testing.assert_frame_equal(single_pass(sources), expected)
+    except AssertionError as e:
+        raise SystemExit(f"Implementations disagree; aborting benchmark\n{e}") from e
+
+    print(f"rows={len(expected)} columns={len(expected.columns)} sources={len(sources) - 1}")
+    print(f"{'implementation':<28}{'time (s)':>10}{'peak MiB':>10}")
+    results = {name: _measure(merge, sources, args.repeat) for name, merge in (("chained merges", _chained_merge_weekly), ("single-pass join", single_pass))}
+    for name, (seconds, peak) in results.items():
+        print(f"{name:<28}{seconds:>10.3f}{peak / 2**20:>10.1f}")
+    print(f"speedup: {results['chained merges'][0] / results['single-pass join'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
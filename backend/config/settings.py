@@ -20,6 +20,45 @@ CORS_ALLOW_CREDENTIALS: bool = (os.getenv("CORS_ALLOW_CREDENTIALS", "false").str
 
 # Database
 DB_PATH: str = os.getenv("DB_PATH", "backend/database/data/nfl_cache.db")
+# API process: read a complete SQLite cache through a pool of immutable read-only connections, all opened at startup
+# so every read sees the generation that was live then
+DB_READ_ONLY: bool = os.getenv("DB_READ_ONLY", "true").strip().lower() in {"1", "true", "yes", "on"}
+DB_READ_CONNECTIONS: int = int(os.getenv("DB_READ_CONNECTIONS", "8"))
+DB_MMAP_SIZE_MB: int = int(os.getenv("DB_MMAP_SIZE_MB", "256"))
+DB_CACHE_SIZE_MB: int = int(os.getenv("DB_CACHE_SIZE_MB", "64"))
+
+# Cache storage backend: "sqlite" (DB_PATH) or "parquet"/"arrow" snapshot files (CACHE_DIR)
+CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "sqlite").strip().lower()
+CACHE_DIR: str = os.getenv("CACHE_DIR", "backend/database/data/cache")
+CACHE_MEMORY_MAP: bool = os.getenv("CACHE_MEMORY_MAP", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+# Lazy loading: materialize season frames and per-player weekly logs on first access, keeping at most
+# CACHE_LRU_SEASONS seasons (and, when CACHE_LRU_MAX_MB > 0, at most that many MiB of frames) and
+# CACHE_LRU_PLAYERS weekly logs resident per process
+CACHE_LAZY_LOAD: bool = os.getenv("CACHE_LAZY_LOAD", "false").strip().lower() in {"1", "true", "yes", "on"}
+CACHE_LRU_SEASONS: int = int(os.getenv("CACHE_LRU_SEASONS", "4"))
+CACHE_LRU_MAX_MB: int = int(os.getenv("CACHE_LRU_MAX_MB", "0"))
+CACHE_LRU_PLAYERS: int = int(os.getenv("CACHE_LRU_PLAYERS", "512"))
+# Worker threads used to load cache tables concurrently at startup (<=1 loads sequentially); defaults to min(4, CPUs)
+CACHE_LOAD_WORKERS: int = int(os.getenv("CACHE_LOAD_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Number of immutable cache generations kept for ?version= reads (<=0 keeps none)
+CACHE_GENERATIONS: int = int(os.getenv("CACHE_GENERATIONS", "3"))
+# Whole-cache snapshot written after each refresh; startup rehydrates from it when it matches the cache data version
+CACHE_SNAPSHOT: bool = os.getenv("CACHE_SNAPSHOT", "true").strip().lower() in {"1", "true", "yes", "on"}
+CACHE_SNAPSHOT_PATH: str = os.getenv("CACHE_SNAPSHOT_PATH", "backend/database/data/cache_snapshot.arrows")
+# Pre-render gzip JSON player detail responses (default view plus one per season) into the cache on refresh
+CACHE_PLAYER_RESPONSES: bool = os.getenv("CACHE_PLAYER_RESPONSES", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+# Raw-source cache: nflreadpy downloads stored per source and season as Parquet; seasons before the current one
+# never expire, the current season is re-fetched after RAW_SOURCE_TTL_HOURS, and RAW_SOURCE_OFFLINE never fetches
+RAW_SOURCE_CACHE: bool = os.getenv("RAW_SOURCE_CACHE", "false").strip().lower() in {"1", "true", "yes", "on"}
+RAW_SOURCE_CACHE_DIR: str = os.getenv("RAW_SOURCE_CACHE_DIR", "backend/database/data/raw_sources")
+RAW_SOURCE_TTL_HOURS: float = float(os.getenv("RAW_SOURCE_TTL_HOURS", "6"))
+RAW_SOURCE_OFFLINE: bool = os.getenv("RAW_SOURCE_OFFLINE", "false").strip().lower() in {"1", "true", "yes", "on"}
+
+# Statistics refresh: worker processes for the CPU-bound merge and payload-build stages, with frames shipped between
+# processes as Arrow IPC buffers and weekly logs partitioned by player (<=1 keeps the in-process thread pools)
+STATS_PROCESS_WORKERS: int = int(os.getenv("STATS_PROCESS_WORKERS", "0"))
 
 # Logging
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "DEBUG").upper()
@@ -0,0 +1,314 @@
+"""Arrow/Parquet snapshot data access object for cache management"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from backend.config.settings import CACHE_DIR, CACHE_MEMORY_MAP
+from backend.database.DAO.base_dao import BaseCacheManager
+
+_MANIFEST_FILE = "manifest.json"
+_PREVIOUS_MANIFEST_FILE = "manifest.prev.json"
+_STAGING_MANIFEST_FILE = "manifest.staging.json"
+_GENERATION_MANIFEST_PREFIX = "manifest.gen-"
+_LEASE_MANIFEST_PREFIX = "manifest.lease-"
+_MANIFEST_VERSION = 1
+_FILE_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+class ArrowCacheManager(BaseCacheManager):
+    """Columnar snapshot storage: one Parquet or Arrow IPC file per table plus a JSON manifest.
+
+    Table files are immutable and uniquely named; the manifest is the only file that is replaced in place,
+    so the live, previous, and staging generations can share one directory. A leased manager (read_only_view)
+    also records the manifest it serves in a lease file, so garbage collection keeps those table files until it closes.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, file_format: str = "parquet", memory_map: bool = CACHE_MEMORY_MAP, manifest_name: str = _MANIFEST_FILE,
+                 lease: bool = False) -> None:
+        if file_format not in _FILE_EXTENSIONS:
+            raise ValueError(f"Unsupported snapshot format: {file_format!r}")
+        self.cache_dir: Path = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.file_format: str = file_format
+        self.memory_map: bool = memory_map
+        self.manifest_name: str = manifest_name
+        self.manifest: Dict[str, Any] = self._read_manifest(self._manifest_path())
+        self._lease_path: Path | None = self._take_lease() if lease else None
+
+    def _manifest_path(self, manifest_name: str | None = None) -> Path:
+        return self.cache_dir / (manifest_name or self.manifest_name)
+
+    @staticmethod
+    def _read_manifest(path: Path) -> Dict[str, Any]:
+        """Load a table manifest, starting a new one when none exists."""
+        if not path.exists():
+            return {"version": _MANIFEST_VERSION, "tables": {}}
+        with path.open("r", encoding="utf-8") as handle:
+            return dict(json.load(handle))
+
+    @staticmethod
+    def _write_manifest_file(path: Path, manifest: Dict[str, Any]) -> None:
+        """Atomically replace a manifest file so readers never see a half-written file."""
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _write_manifest(self) -> None:
+        self._write_manifest_file(self._manifest_path(), self.manifest)
+
+    def _take_lease(self) -> Path:
+        """Record the manifest this process serves in a lease file that garbage collection honours.
+
+        A refresh may collect garbage between reading the live manifest and writing the lease, so the live
+        manifest is re-read until every file the leased manifest lists still exists.
+        """
+        lease_path = self._manifest_path(f"{_LEASE_MANIFEST_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:8]}.json")
+        while True:
+            self._write_manifest_file(lease_path, self.manifest)
+            if all((self.cache_dir / entry["file"]).exists() for entry in self.manifest["tables"].values()):
+                return lease_path
+            self.manifest = self._read_manifest(self._manifest_path())
+
+    @staticmethod
+    def _lease_is_held(path: Path) -> bool:
+        """Return False for a lease whose process has exited (it crashed without closing its manager)."""
+        pid = path.name[len(_LEASE_MANIFEST_PREFIX):].split("-", 1)[0]
+        if not pid.isdigit() or os.name == "nt":
+            return True
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _leased_manifests(self) -> List[str]:
+        """Return the lease manifests of live readers, deleting leases left behind by exited processes."""
+        held: List[str] = []
+        for path in self.cache_dir.glob(f"{_LEASE_MANIFEST_PREFIX}*.json"):
+            if self._lease_is_held(path):
+                held.append(path.name)
+            else:
+                path.unlink(missing_ok=True)
+        return held
+
+    def _referenced_files(self) -> Set[str]:
+        """Return table files referenced by any manifest generation or reader lease in the directory."""
+        referenced: Set[str] = set()
+        archived = [path.name for path in self.cache_dir.glob(f"{_GENERATION_MANIFEST_PREFIX}*.json")]
+        for manifest_name in (_MANIFEST_FILE, _PREVIOUS_MANIFEST_FILE, _STAGING_MANIFEST_FILE, *archived, *self._leased_manifests()):
+            manifest = self.manifest if manifest_name == self.manifest_name else self._read_manifest(self._manifest_path(manifest_name))
+            referenced.update(entry["file"] for entry in manifest["tables"].values())
+        return referenced
+
+    def _collect_garbage(self) -> None:
+        """Delete table files that no manifest generation references anymore."""
+        referenced = self._referenced_files()
+        for extension in _FILE_EXTENSIONS.values():
+            for path in self.cache_dir.glob(f"*{extension}"):
+                if path.name not in referenced:
+                    path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _to_arrow_table(df: pd.DataFrame, index: bool) -> pa.Table:
+        """Convert a DataFrame to Arrow, stringifying mixed-type object columns Arrow cannot infer."""
+        try:
+            return pa.Table.from_pandas(df, preserve_index=index)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            object_cols = df.select_dtypes(include="object").columns
+            coerced = df.astype({col: "string" for col in object_cols})
+            return pa.Table.from_pandas(coerced, preserve_index=index)
+
+    def save_table(self, table_name: str, df: pd.DataFrame, if_exists: str = "replace", index: bool = True) -> None:
+        """Write a DataFrame to a new table file and point the manifest at it."""
+        safe_name = self._validate_table_name(table_name)
+        if safe_name in self.manifest["tables"]:
+            if if_exists == "fail":
+                raise ValueError(f"Table '{safe_name}' already exists.")
+            if if_exists == "append":
+                df = pd.concat([self.load_table(safe_name), df.reset_index() if index else df], ignore_index=True)
+                index = False
+
+        table = self._to_arrow_table(df, index)
+        file_name = f"{safe_name}-{uuid.uuid4().hex[:12]}{_FILE_EXTENSIONS[self.file_format]}"
+        path = self.cache_dir / file_name
+        tmp_path = path.with_name(f"{file_name}.tmp")
+        if self.file_format == "parquet":
+            pq.write_table(table, tmp_path)
+        else:
+            with ipc.new_file(str(tmp_path), table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+        replaced = self.manifest["tables"].get(safe_name)
+        self.manifest["tables"][safe_name] = {"file": file_name, "format": self.file_format, "rows": table.num_rows, "columns": table.column_names}
+        self._write_manifest()
+        if replaced is not None and replaced["file"] not in self._referenced_files():
+            (self.cache_dir / replaced["file"]).unlink(missing_ok=True)
+
+    def load_table(self, table_name: str) -> pd.DataFrame:
+        """Read an entire table file into a DataFrame, memory-mapping it when enabled."""
+        return self._read_frame(table_name)
+
+    def _read_frame(self, table_name: str, columns: List[str] | None = None, filters: List[Tuple[str, str, Any]] | None = None) -> pd.DataFrame:
+        """Read a table file, pushing column selection and equality filters into Parquet reads."""
+        safe_name = self._validate_table_name(table_name)
+        entry = self.manifest["tables"].get(safe_name)
+        if entry is None:
+            raise FileNotFoundError(f"no such table: {safe_name}")
+        path = self.cache_dir / entry["file"]
+        if entry["format"] == "parquet":
+            return pq.read_table(path, columns=columns, filters=filters or None, memory_map=self.memory_map).to_pandas()
+        source = pa.memory_map(str(path), "r") if self.memory_map else pa.OSFile(str(path), "rb")
+        with source:
+            table = ipc.open_file(source).read_all()
+            if columns is not None:
+                table = table.select(columns)
+            for column, op, value in filters or []:
+                table = table.filter(pc.is_in(table[column], value_set=pa.array(value)) if op == "in" else pc.equal(table[column], value))
+            return table.to_pandas()
+
+    def load_rows(self, table_name: str, where: Dict[str, Any]) -> pd.DataFrame:
+        """Read only the matching rows; Parquet skips row groups whose statistics rule them out."""
+        filters: List[Tuple[str, str, Any]] = []
+        for column, value in where.items():
+            safe_column = self._validate_identifier(column, "column name")
+            if isinstance(value, (list, tuple)):
+                filters.append((safe_column, "in", [item.item() if hasattr(item, "item") else item for item in value]))
+            else:
+                filters.append((safe_column, "=", value.item() if hasattr(value, "item") else value))
+        return self._read_frame(table_name, filters=filters)
+
+    def load_columns(self, table_name: str, columns: List[str]) -> pd.DataFrame:
+        """Read only the given columns; Parquet skips the other column chunks entirely."""
+        return self._read_frame(table_name, columns=[self._validate_identifier(column, "column name") for column in columns])
+
+    def value_counts(self, table_name: str, column: str) -> Dict[Any, int]:
+        """Return the row count per distinct non-null value of one column, reading only that column."""
+        values = self._read_frame(table_name, columns=[self._validate_identifier(column, "column name")]).iloc[:, 0]
+        return {value: int(count) for value, count in values.value_counts().sort_index().items()}
+
+    def create_index(self, table_name: str, columns: List[str]) -> None:
+        """No-op: snapshot files are always scanned whole."""
+        self._validate_table_name(table_name)
+
+    def table_exists(self, table_name: str) -> bool:
+        """Check whether a table is listed in the manifest."""
+        safe_name = self._validate_table_name(table_name)
+        return safe_name in self.manifest["tables"]
+
+    def list_tables(self) -> List[str]:
+        """Return the names of all tables in the manifest."""
+        return list(self.manifest["tables"])
+
+    def drop_table(self, table_name: str) -> None:
+        """Remove a table's manifest entry and its file when no other generation uses it."""
+        safe_name = self._validate_table_name(table_name)
+        entry = self.manifest["tables"].pop(safe_name, None)
+        if entry is None:
+            return
+        self._write_manifest()
+        if entry["file"] not in self._referenced_files():
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+
+    @property
+    def supports_concurrent_reads(self) -> bool:
+        """Table files are opened per read, so threads never share a handle."""
+        return True
+
+    @property
+    def pins_generation(self) -> bool:
+        """The manifest is read once and table files are immutable, so reads stay on the generation it listed."""
+        return True
+
+    def read_only_view(self) -> BaseCacheManager:
+        """Return a manager on the live manifest that holds a lease on its table files until closed."""
+        if self._lease_path is not None or self.manifest_name != _MANIFEST_FILE:
+            return self
+        return ArrowCacheManager(str(self.cache_dir), self.file_format, self.memory_map, lease=True)
+
+    @property
+    def supports_staging(self) -> bool:
+        return self.manifest_name == _MANIFEST_FILE
+
+    def open_staging(self) -> BaseCacheManager:
+        """Start a staging generation that shares this directory under its own manifest, seeded with the live tables."""
+        self._manifest_path(_STAGING_MANIFEST_FILE).unlink(missing_ok=True)
+        self._collect_garbage()
+        # Table files are immutable, so copying the manifest is enough for staging to start from the live tables.
+        self._write_manifest_file(self._manifest_path(_STAGING_MANIFEST_FILE), self.manifest)
+        return ArrowCacheManager(str(self.cache_dir), self.file_format, self.memory_map, manifest_name=_STAGING_MANIFEST_FILE)
+
+    def promote_staging(self, staging: BaseCacheManager) -> None:
+        """Keep the live manifest as the previous generation, then atomically rename the staging manifest over it."""
+        if not isinstance(staging, ArrowCacheManager) or staging.cache_dir != self.cache_dir:
+            raise ValueError("Staging store does not belong to this cache directory")
+        live_path = self._manifest_path()
+        if live_path.exists():
+            self._write_manifest_file(self._manifest_path(_PREVIOUS_MANIFEST_FILE), self._read_manifest(live_path))
+        os.replace(staging._manifest_path(), live_path)
+        self.manifest = self._read_manifest(live_path)
+        self._collect_garbage()
+
+    def discard_staging(self, staging: BaseCacheManager) -> None:
+        """Drop the staging manifest and any files only it referenced."""
+        staging.close()
+        self._manifest_path(_STAGING_MANIFEST_FILE).unlink(missing_ok=True)
+        self._collect_garbage()
+
+    def rollback(self) -> bool:
+        """Swap the live and previous manifests."""
+        previous_path = self._manifest_path(_PREVIOUS_MANIFEST_FILE)
+        if not previous_path.exists():
+            return False
+        live_path = self._manifest_path()
+        previous = self._read_manifest(previous_path)
+        current = self._read_manifest(live_path)
+        self._write_manifest_file(live_path, previous)
+        self._write_manifest_file(previous_path, current)
+        self.manifest = previous
+        return True
+
+    @staticmethod
+    def _generation_manifest(generation: int) -> str:
+        return f"{_GENERATION_MANIFEST_PREFIX}{generation}.json"
+
+    def archive_generation(self, generation: int) -> None:
+        """Copy the live manifest as a generation manifest; the table files it lists are immutable."""
+        self._write_manifest_file(self._manifest_path(self._generation_manifest(generation)), self.manifest)
+
+    def list_generations(self) -> List[int]:
+        """Return archived generation numbers from the manifest file names, oldest first."""
+        names = (path.name[len(_GENERATION_MANIFEST_PREFIX):-len(".json")] for path in self.cache_dir.glob(f"{_GENERATION_MANIFEST_PREFIX}*.json"))
+        return sorted(int(name) for name in names if name.isdigit())
+
+    def open_generation(self, generation: int) -> BaseCacheManager:
+        """Open an archived generation through its manifest."""
+        manifest_name = self._generation_manifest(generation)
+        if not self._manifest_path(manifest_name).exists():
+            raise KeyError(generation)
+        return ArrowCacheManager(str(self.cache_dir), self.file_format, self.memory_map, manifest_name=manifest_name)
+
+    def prune_generations(self, keep: int) -> None:
+        """Delete the oldest generation manifests beyond keep, then the table files nothing references anymore."""
+        generations = self.list_generations()
+        for generation in generations[:max(0, len(generations) - keep)]:
+            self._manifest_path(self._generation_manifest(generation)).unlink(missing_ok=True)
+        self._collect_garbage()
+
+    def close(self) -> None:
+        """Release the lease, if any; files themselves are opened per read."""
+        if self._lease_path is not None:
+            self._lease_path.unlink(missing_ok=True)
+            self._lease_path = None
@@ -0,0 +1,179 @@
+"""Abstract base class for cache storage backends"""
+
+import re
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import pandas as pd
+
+_TABLE_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a DataFrame to record dicts of Python scalars with missing values as None.
+
+    Missing values are replaced column by column with one vectorized mask, instead of a pd.isna call per cell.
+    """
+    columns = [str(column) for column in df.columns]
+    column_values: List[List[Any]] = []
+    for pos in range(len(columns)):
+        column = df.iloc[:, pos]
+        missing = column.isna().to_numpy()
+        if missing.any():
+            values = column.to_numpy(dtype=object, copy=True)
+            values[missing] = None
+            column_values.append(values.tolist())
+        else:
+            column_values.append(column.tolist())
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
+
+
+class BaseCacheManager(ABC):
+    """Table-level storage operations shared by all cache backends (SQLite, Arrow/Parquet)"""
+
+    @staticmethod
+    def _validate_identifier(identifier: str, kind: str = "identifier") -> str:
+        """Reject identifiers that aren't safe SQL identifiers."""
+        if not isinstance(identifier, str) or not _TABLE_NAME_PATTERN.fullmatch(identifier):
+            raise ValueError(f"Invalid {kind}: {identifier!r}")
+        return identifier
+
+    @classmethod
+    def _validate_table_name(cls, table_name: str) -> str:
+        """Reject table names that aren't safe SQL identifiers."""
+        return cls._validate_identifier(table_name, "table name")
+
+    @contextmanager
+    def bulk_write(self) -> Iterator[None]:
+        """Group all writes made inside the block into one unit of work when the backend supports it."""
+        yield
+
+    @property
+    def supports_concurrent_reads(self) -> bool:
+        """Return True when reads may be issued from several threads at once."""
+        return False
+
+    @property
+    def pins_generation(self) -> bool:
+        """Return True when reads keep returning the generation that was live when the store opened, even after a promotion."""
+        return False
+
+    @property
+    def supports_staging(self) -> bool:
+        """Return True when the backend can build a staging store and atomically promote it."""
+        return False
+
+    def open_staging(self) -> "BaseCacheManager":
+        """Return a store seeded with the live generation that can later replace this one via promote_staging()."""
+        raise NotImplementedError(f"{type(self).__name__} does not support staged writes")
+
+    def promote_staging(self, staging: "BaseCacheManager") -> None:
+        """Atomically make a staging store live, keeping the current generation for rollback()."""
+        raise NotImplementedError(f"{type(self).__name__} does not support staged writes")
+
+    def discard_staging(self, staging: "BaseCacheManager") -> None:
+        """Close and delete a staging store without touching the live one."""
+        raise NotImplementedError(f"{type(self).__name__} does not support staged writes")
+
+    def read_only_view(self) -> "BaseCacheManager":
+        """Return a manager tuned for concurrent reads of the same store; backends without one return self."""
+        return self
+
+    def rollback(self) -> bool:
+        """Swap the previous generation back in; return False when there is none."""
+        return False
+
+    def archive_generation(self, generation: int) -> None:
+        """Keep an immutable copy of the live store under a generation number."""
+        raise NotImplementedError(f"{type(self).__name__} does not keep generations")
+
+    def list_generations(self) -> List[int]:
+        """Return the archived generation numbers, oldest first."""
+        return []
+
+    def open_generation(self, generation: int) -> "BaseCacheManager":
+        """Return a read-only store over one archived generation."""
+        raise KeyError(generation)
+
+    def prune_generations(self, keep: int) -> None:
+        """Delete all but the newest keep archived generations."""
+        return None
+
+    @abstractmethod
+    def save_table(self, table_name: str, df: pd.DataFrame, if_exists: str = "replace", index: bool = True) -> None:
+        """Write a DataFrame to the given table."""
+
+    def replace_partitions(self, table_name: str, key_columns: List[str], partitions: Sequence[Tuple[Any, ...]], rows: pd.DataFrame) -> None:
+        """Replace the given partitions with rows, which hold the new contents of exactly those partitions.
+
+        The default reads the table once and writes the merged table once; backends with row-level deletes override it.
+        """
+        if not self.table_exists(table_name):
+            self.save_table(table_name, rows, index=False)
+            return
+        df = self.load_table(table_name)
+        doomed = pd.MultiIndex.from_frame(df[key_columns]).isin(list(partitions))
+        self.save_table(table_name, pd.concat([df.loc[~doomed], rows], ignore_index=True), index=False)
+
+    def load_rows(self, table_name: str, where: Dict[str, Any]) -> pd.DataFrame:
+        """Read the rows whose columns equal the given values; a list or tuple value matches any of its items.
+
+        The default filters a full table read; backends that can push the filter down override it.
+        """
+        df = self.load_table(table_name)
+        mask = pd.Series(True, index=df.index)
+        for column, value in where.items():
+            values = df[self._validate_identifier(column, "column name")]
+            mask &= values.isin(value) if isinstance(value, (list, tuple)) else values == value
+        return df.loc[mask].reset_index(drop=True)
+
+    def load_records(self, table_name: str, where: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Read the matching rows as record dicts with missing values as None."""
+        return frame_to_records(self.load_rows(table_name, where))
+
+    def load_columns(self, table_name: str, columns: List[str]) -> pd.DataFrame:
+        """Read only the given columns of every row; backends with columnar or projected reads override it."""
+        return self.load_table(table_name)[[self._validate_identifier(column, "column name") for column in columns]]
+
+    def value_counts(self, table_name: str, column: str) -> Dict[Any, int]:
+        """Return the row count per distinct non-null value of one column, ordered by value."""
+        counts = self.load_table(table_name)[self._validate_identifier(column, "column name")].value_counts().sort_index()
+        return {value: int(count) for value, count in counts.items()}
+
+    @property
+    def supports_text_search(self) -> bool:
+        """Return True when the backend can build and query full-text indexes."""
+        return False
+
+    def build_text_index(self, index_name: str, source_table: str, text_column: str) -> None:
+        """(Re)build a full-text index over text_column that also stores every other column of source_table."""
+        raise NotImplementedError(f"{type(self).__name__} does not support full-text search")
+
+    def search_text(self, index_name: str, text_column: str, query: str, where: Dict[str, Any], limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Return up to limit ranked records whose text_column contains query, plus the total match count."""
+        raise NotImplementedError(f"{type(self).__name__} does not support full-text search")
+
+    @abstractmethod
+    def load_table(self, table_name: str) -> pd.DataFrame:
+        """Read an entire table into a DataFrame."""
+
+    @abstractmethod
+    def create_index(self, table_name: str, columns: List[str]) -> None:
+        """Index the given columns when the backend supports secondary indexes."""
+
+    @abstractmethod
+    def table_exists(self, table_name: str) -> bool:
+        """Check whether a table exists in the store."""
+
+    @abstractmethod
+    def list_tables(self) -> List[str]:
+        """Return the names of all tables in the store."""
+
+    @abstractmethod
+    def drop_table(self, table_name: str) -> None:
+        """Drop a table if it exists."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release any open handles."""
@@ -1,67 +1,475 @@
 """SQLite data access object for cache management"""
 
-import re
+import functools
+import os
+import queue
+import shutil
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 
 import pandas as pd
 
-from backend.config.settings import DB_PATH
+from backend.config.settings import DB_CACHE_SIZE_MB, DB_MMAP_SIZE_MB, DB_PATH, DB_READ_CONNECTIONS
+from backend.database.DAO.base_dao import BaseCacheManager
 
-_TABLE_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# Pragmas applied for the duration of a bulk write (refresh): the rollback journal lives in memory for the single
+# refresh transaction, NORMAL sync avoids an fsync per statement, and a 256 MiB page cache keeps index builds in memory.
+_BULK_WRITE_PRAGMAS: Dict[str, Any] = {"journal_mode": "MEMORY", "synchronous": "NORMAL", "cache_size": -262144, "temp_store": "MEMORY"}
+_DEFAULT_PRAGMAS: Dict[str, Any] = {"journal_mode": "DELETE", "synchronous": "FULL"}
+# Pragmas for read-only API connections: memory-map the file, keep a larger page cache, and reject writes.
+_READ_ONLY_PRAGMAS: Dict[str, Any] = {"mmap_size": DB_MMAP_SIZE_MB * 1024 * 1024, "cache_size": -DB_CACHE_SIZE_MB * 1024, "query_only": 1}
+# FTS5 stores each index in these <index>_<suffix> shadow tables.
+_FTS5_SHADOW_SUFFIXES = ("data", "idx", "content", "docsize", "config")
 
 
-class SQLiteCacheManager:
-    """Low-level SQLite operations for cache tables"""
+@functools.cache
+def _fts5_trigram_available() -> bool:
+    """Probe the linked SQLite library once for FTS5 with the trigram tokenizer (SQLite >= 3.34)."""
+    probe = sqlite3.connect(":memory:")
+    try:
+        probe.execute("CREATE VIRTUAL TABLE probe USING fts5(x, tokenize='trigram')")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        probe.close()
+
+
+class SQLiteCacheManager(BaseCacheManager):
+    """Low-level SQLite operations for cache tables
+
+    In read-only mode a fixed pool of immutable, memory-mapped connections is opened up front and each call checks
+    one out, so lazy cache loaders running in FastAPI's threadpool read concurrently, and always from the generation
+    that was live when the pool opened.
+    """
     
-    def __init__(self, db_path: str = DB_PATH) -> None:
+    def __init__(self, db_path: str = DB_PATH, read_only: bool = False, read_connections: int = DB_READ_CONNECTIONS) -> None:
         self.db_path: Path = Path(db_path)
-        if str(self.db_path) != ":memory:":
+        self.read_only: bool = read_only and str(self.db_path) != ":memory:"
+        if str(self.db_path) != ":memory:" and not self.read_only:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        self.cursor: sqlite3.Cursor = self.conn.cursor()
+        self._bulk_depth: int = 0
+        self._read_connections = max(1, read_connections)
+        self._pool: List[sqlite3.Connection] = []
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._connect()
 
-    @staticmethod
-    def _validate_table_name(table_name: str) -> str:
-        """Reject table names that aren't safe SQL identifiers."""
-        if not isinstance(table_name, str) or not _TABLE_NAME_PATTERN.fullmatch(table_name):
-            raise ValueError(f"Invalid table name: {table_name!r}")
-        return table_name
+    def _connect(self) -> None:
+        """Open the writer connection, or the whole read-only pool."""
+        if self.read_only:
+            self._open_read_pool()
+            return
+        # Lazy cache mappings may read from FastAPI's worker threads, so every statement runs on its own cursor.
+        self._conn: sqlite3.Connection = sqlite3.connect(self.db_path, check_same_thread=False)
+
+    def _open_read_pool(self) -> None:
+        """Open every read-only connection against the file db_path names right now.
+
+        immutable=1 skips file locking and change detection. That is safe because refreshes never modify the
+        live file in place: they rename a new file over it, and open connections keep reading the old one.
+        db_path is never re-opened afterwards, since by then it may name a newer generation than the caches
+        this process serves; if a refresh renames a file in while the pool opens, the pool is opened again.
+        """
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro&immutable=1"
+        while True:
+            inode = self.db_path.stat().st_ino
+            pool = [sqlite3.connect(uri, uri=True, check_same_thread=False) for _ in range(self._read_connections)]
+            if self.db_path.stat().st_ino == inode:
+                break
+            for conn in pool:
+                conn.close()
+        for conn in pool:
+            for pragma, value in _READ_ONLY_PRAGMAS.items():
+                conn.execute(f"PRAGMA {pragma}={value}")
+            self._idle.put(conn)
+        self._pool = pool
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the writer connection, or check a pooled read-only connection out for the duration of one call."""
+        if not self.read_only:
+            yield self._conn
+            return
+        if not self._pool:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The writer connection; read-only managers hand out pooled connections per call instead."""
+        if self.read_only:
+            raise sqlite3.ProgrammingError("Read-only managers have no single connection")
+        return self._conn
+
+    @property
+    def pool_size(self) -> int:
+        """Number of open read-only connections."""
+        return len(self._pool)
+
+    def read_only_view(self) -> BaseCacheManager:
+        """Return a read-only manager pinned to the generation that is live now."""
+        if self.read_only or str(self.db_path) == ":memory:":
+            return self
+        return SQLiteCacheManager(str(self.db_path), read_only=True)
+
+    @property
+    def staging_path(self) -> Path:
+        """Sibling file a refresh is built into before it is promoted over db_path."""
+        return self.db_path.with_name(f"{self.db_path.name}.staging")
+
+    @property
+    def previous_path(self) -> Path:
+        """Sibling file holding the generation replaced by the last promotion."""
+        return self.db_path.with_name(f"{self.db_path.stem}.prev{self.db_path.suffix}")
+
+    def generation_path(self, generation: int) -> Path:
+        """Sibling file holding one archived generation."""
+        return self.db_path.with_name(f"{self.db_path.stem}.gen-{generation}{self.db_path.suffix}")
 
     @staticmethod
     def _quote_identifier(identifier: str) -> str:
         """Wrap an identifier in double quotes for SQL reserved-word safety."""
-        return f'"{identifier}"'
+        escaped = str(identifier).replace('"', '""')
+        return f'"{escaped}"'
+
+    @property
+    def in_bulk_write(self) -> bool:
+        """Return True while a bulk_write() transaction is open."""
+        return self._bulk_depth > 0
+
+    @contextmanager
+    def bulk_write(self) -> Iterator[None]:
+        """Run all writes inside one transaction with refresh-time pragmas and prepared inserts."""
+        if self.in_bulk_write:
+            self._bulk_depth += 1
+            try:
+                yield
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        for pragma, value in _BULK_WRITE_PRAGMAS.items():
+            self.conn.execute(f"PRAGMA {pragma}={value}")
+        self.conn.commit()
+        self.conn.execute("BEGIN")
+        self._bulk_depth = 1
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._bulk_depth = 0
+            for pragma, value in _DEFAULT_PRAGMAS.items():
+                self.conn.execute(f"PRAGMA {pragma}={value}")
+
+    def _commit(self) -> None:
+        """Commit immediately unless an enclosing bulk_write() owns the transaction."""
+        if not self.in_bulk_write:
+            self.conn.commit()
 
     def save_table(self, table_name: str, df: pd.DataFrame, if_exists: str = "replace", index: bool = True) -> None:
         """Write a DataFrame to the given table."""
         safe_name = self._validate_table_name(table_name)
-        df.to_sql(safe_name, self.conn, if_exists=if_exists, index=index)
+        if self.in_bulk_write:
+            self._bulk_insert(safe_name, df.reset_index() if index else df, if_exists)
+            return
+        with self._connection() as conn:
+            df.to_sql(safe_name, conn, if_exists=if_exists, index=index)
+
+    @staticmethod
+    def _column_sql_type(column: pd.Series) -> str:
+        """Map a pandas column to an explicit SQLite column type."""
+        if pd.api.types.is_bool_dtype(column) or pd.api.types.is_integer_dtype(column):
+            return "INTEGER"
+        if pd.api.types.is_float_dtype(column):
+            return "REAL"
+        if pd.api.types.is_object_dtype(column):
+            inferred = pd.api.types.infer_dtype(column, skipna=True)
+            if inferred in {"integer", "boolean"}:
+                return "INTEGER"
+            if inferred in {"floating", "mixed-integer-float", "decimal"}:
+                return "REAL"
+            if inferred == "bytes":
+                return "BLOB"
+        return "TEXT"
+
+    @staticmethod
+    def _column_values(column: pd.Series) -> List[Any]:
+        """Convert one column to Python scalars with missing values as None, without per-row pandas work."""
+        if pd.api.types.is_datetime64_any_dtype(column):
+            values = column.astype(str).where(column.notna(), None)
+        elif pd.api.types.is_bool_dtype(column) and not isinstance(column.dtype, pd.BooleanDtype):
+            values = column.astype(int)
+        elif (pd.api.types.is_integer_dtype(column) or pd.api.types.is_float_dtype(column)) and not isinstance(column.dtype, pd.api.extensions.ExtensionDtype):
+            # SQLite binds float NaN as NULL, so plain numpy columns need no per-value missing check.
+            values = column
+        else:
+            values = column.astype(object).where(column.notna(), None)
+        return list(values.tolist())
+
+    def _bulk_insert(self, table_name: str, df: pd.DataFrame, if_exists: str) -> None:
+        """Create the table with explicit column types and fill it with one prepared executemany."""
+        quoted_table = self._quote_identifier(table_name)
+        exists = self.table_exists(table_name)
+        if exists and if_exists == "fail":
+            raise ValueError(f"Table '{table_name}' already exists.")
+        if exists and if_exists == "replace":
+            self.conn.execute(f"DROP TABLE {quoted_table}")
+            exists = False
+
+        columns = [str(column) for column in df.columns]
+        if not exists:
+            column_defs = ", ".join(f"{self._quote_identifier(name)} {self._column_sql_type(df.iloc[:, pos])}" for pos, name in enumerate(columns))
+            self.conn.execute(f"CREATE TABLE {quoted_table} ({column_defs})")
+        if df.empty:
+            return
+
+        placeholders = ", ".join("?" for _ in columns)
+        column_sql = ", ".join(self._quote_identifier(name) for name in columns)
+        rows = zip(*(self._column_values(df.iloc[:, pos]) for pos in range(len(columns))))
+        self.conn.executemany(f"INSERT INTO {quoted_table} ({column_sql}) VALUES ({placeholders})", rows)
+
+    def _delete_partitions(self, table_name: str, key_columns: List[str], partitions: Sequence[Tuple[Any, ...]]) -> None:
+        """Delete the matching partitions with one prepared executemany over the partition-key index."""
+        safe_name = self._validate_table_name(table_name)
+        if not partitions or not self.table_exists(safe_name):
+            return
+        where_sql = " AND ".join(f"{self._quote_identifier(self._validate_identifier(column, 'column name'))} = ?" for column in key_columns)
+        params = [[value.item() if hasattr(value, "item") else value for value in partition] for partition in partitions]
+        self.conn.executemany(f"DELETE FROM {self._quote_identifier(safe_name)} WHERE {where_sql}", params)
+        self._commit()
+
+    def replace_partitions(self, table_name: str, key_columns: List[str], partitions: Sequence[Tuple[Any, ...]], rows: pd.DataFrame) -> None:
+        """Delete the partitions through the partition-key index, then append only the new rows."""
+        self._delete_partitions(table_name, key_columns, partitions)
+        if not rows.empty:
+            self.save_table(table_name, rows, if_exists="append", index=False)
 
     def load_table(self, table_name: str) -> pd.DataFrame:
         """Read an entire table into a DataFrame."""
         safe_name = self._validate_table_name(table_name)
-        return pd.read_sql(f"SELECT * FROM {self._quote_identifier(safe_name)}", self.conn)
+        with self._connection() as conn:
+            return pd.read_sql(f"SELECT * FROM {self._quote_identifier(safe_name)}", conn)
+
+    def _where_clause(self, where: Dict[str, Any]) -> tuple[str, List[Any]]:
+        """Build a parameterized WHERE clause and its bound values; list or tuple values become IN (...) tests."""
+        if not where:
+            return "", []
+        conditions: List[str] = []
+        params: List[Any] = []
+        for column, value in where.items():
+            safe_column = self._quote_identifier(self._validate_identifier(column, "column name"))
+            values = list(value) if isinstance(value, (list, tuple)) else [value]
+            conditions.append(f"{safe_column} IN ({', '.join('?' * len(values))})" if isinstance(value, (list, tuple)) else f"{safe_column} = ?")
+            params.extend(item.item() if hasattr(item, "item") else item for item in values)
+        return f" WHERE {' AND '.join(conditions)}", params
+
+    def load_rows(self, table_name: str, where: Dict[str, Any]) -> pd.DataFrame:
+        """Read only the matching rows, letting SQLite use the partition-key index."""
+        safe_name = self._validate_table_name(table_name)
+        where_sql, params = self._where_clause(where)
+        with self._connection() as conn:
+            return pd.read_sql(f"SELECT * FROM {self._quote_identifier(safe_name)}{where_sql}", conn, params=params)
+
+    def load_records(self, table_name: str, where: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Read the matching rows straight from the cursor; SQLite already returns NULL as None."""
+        safe_name = self._validate_table_name(table_name)
+        where_sql, params = self._where_clause(where)
+        # The statement text is identical per call, so sqlite3's statement cache reuses the prepared statement.
+        with self._connection() as conn:
+            cursor = conn.execute(f"SELECT * FROM {self._quote_identifier(safe_name)}{where_sql}", params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def load_columns(self, table_name: str, columns: List[str]) -> pd.DataFrame:
+        """Read only the given columns of every row."""
+        safe_name = self._validate_table_name(table_name)
+        column_sql = ", ".join(self._quote_identifier(self._validate_identifier(column, "column name")) for column in columns)
+        with self._connection() as conn:
+            return pd.read_sql(f"SELECT {column_sql} FROM {self._quote_identifier(safe_name)}", conn)
+
+    def value_counts(self, table_name: str, column: str) -> Dict[Any, int]:
+        """Return the row count per distinct non-null value of one column, counted from its index when present."""
+        safe_name = self._validate_table_name(table_name)
+        safe_column = self._quote_identifier(self._validate_identifier(column, "column name"))
+        with self._connection() as conn:
+            rows = conn.execute(f"SELECT {safe_column}, COUNT(*) FROM {self._quote_identifier(safe_name)} WHERE {safe_column} IS NOT NULL GROUP BY {safe_column} ORDER BY {safe_column}").fetchall()
+        return {value: count for value, count in rows}
+
+    @property
+    def supports_text_search(self) -> bool:
+        """SQLite indexes text with FTS5 and its trigram tokenizer, when the linked library provides them."""
+        return _fts5_trigram_available()
+
+    def build_text_index(self, index_name: str, source_table: str, text_column: str) -> None:
+        """Rebuild an FTS5 trigram table over text_column, storing the other source columns unindexed."""
+        safe_index = self._quote_identifier(self._validate_table_name(index_name))
+        safe_source = self._quote_identifier(self._validate_table_name(source_table))
+        columns = [row[1] for row in self.conn.execute(f"PRAGMA table_info({safe_source})").fetchall()]
+        if text_column not in columns:
+            raise ValueError(f"Column '{text_column}' not found in table '{source_table}'.")
+        column_defs = ", ".join(self._quote_identifier(column) if column == text_column else f"{self._quote_identifier(column)} UNINDEXED" for column in columns)
+        column_sql = ", ".join(self._quote_identifier(column) for column in columns)
+        self.conn.execute(f"DROP TABLE IF EXISTS {safe_index}")
+        self.conn.execute(f"CREATE VIRTUAL TABLE {safe_index} USING fts5({column_defs}, tokenize='trigram')")
+        self.conn.execute(f"INSERT INTO {safe_index} ({column_sql}) SELECT {column_sql} FROM {safe_source}")
+        self._commit()
+
+    def search_text(self, index_name: str, text_column: str, query: str, where: Dict[str, Any], limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Return prefix matches first, then the rest by name, with the total match count.
+
+        bm25 rank is deliberately not part of the ordering: results sort exactly as rank_search_results sorts the
+        in-memory fallback, so a query returns the same players whichever path answers it.
+        """
+        safe_index = self._quote_identifier(self._validate_table_name(index_name))
+        safe_column = self._quote_identifier(self._validate_identifier(text_column, "column name"))
+        where_sql, params = self._where_clause(where)
+        if len(query) >= 3:
+            # Trigram MATCH answers substring queries from the index; a quoted phrase disables FTS5 query syntax.
+            match_sql, match_param = f"{safe_column} MATCH ?", '"' + query.replace('"', '""') + '"'
+        else:
+            # Trigrams cannot index shorter queries, so scan the (small) index table instead.
+            match_sql, match_param = f"instr(lower({safe_column}), lower(?)) > 0", query
+        filter_sql = f"{where_sql} AND {match_sql}" if where_sql else f" WHERE {match_sql}"
+        with self._connection() as conn:
+            cursor = conn.execute(f"SELECT *, COUNT(*) OVER () FROM {safe_index}{filter_sql} "
+                                  f"ORDER BY instr(lower({safe_column}), lower(?)) = 1 DESC, {safe_column} COLLATE NOCASE LIMIT ?",
+                                  [*params, match_param, query, limit])
+            columns = [column[0] for column in cursor.description][:-1]
+            rows = cursor.fetchall()
+        return [dict(zip(columns, row[:-1])) for row in rows], (rows[0][-1] if rows else 0)
+
+    def create_index(self, table_name: str, columns: List[str]) -> None:
+        """Create a (non-unique) index over the given columns if it does not exist."""
+        safe_name = self._validate_table_name(table_name)
+        safe_columns = [self._validate_identifier(column, "column name") for column in columns]
+        index_name = self._validate_identifier(f"idx_{safe_name}_{'_'.join(column.strip('_') for column in safe_columns)}", "index name")
+        column_sql = ", ".join(self._quote_identifier(column) for column in safe_columns)
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {self._quote_identifier(index_name)} ON {self._quote_identifier(safe_name)} ({column_sql})")
+        self._commit()
 
     def table_exists(self, table_name: str) -> bool:
         """Check whether a table exists in the database."""
         safe_name = self._validate_table_name(table_name)
-        self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", [safe_name])
-        return self.cursor.fetchone() is not None
+        with self._connection() as conn:
+            return conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", [safe_name]).fetchone() is not None
 
     def list_tables(self) -> List[str]:
-        """Return the names of all tables in the database."""
-        self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        return [row[0] for row in self.cursor.fetchall()]
+        """Return the names of all tables in the database, leaving out FTS5 shadow tables."""
+        with self._connection() as conn:
+            rows = conn.execute("SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'").fetchall()
+        virtual = [name for name, sql in rows if (sql or "").upper().startswith("CREATE VIRTUAL TABLE")]
+        shadows = {f"{name}_{suffix}" for name in virtual for suffix in _FTS5_SHADOW_SUFFIXES}
+        return [name for name, _ in rows if name not in shadows]
 
     def drop_table(self, table_name: str) -> None:
         """Drop a table if it exists."""
         safe_name = self._validate_table_name(table_name)
-        self.cursor.execute(f"DROP TABLE IF EXISTS {self._quote_identifier(safe_name)}")
-        self.conn.commit()
+        self.conn.execute(f"DROP TABLE IF EXISTS {self._quote_identifier(safe_name)}")
+        self._commit()
 
-    def close(self) -> None:
-        """Close the database connection."""
+    @property
+    def supports_concurrent_reads(self) -> bool:
+        """Read-only managers check a pooled connection out per call."""
+        return self.read_only
+
+    @property
+    def pins_generation(self) -> bool:
+        """The read-only pool never re-opens db_path, so it keeps reading the file it opened."""
+        return self.read_only
+
+    @property
+    def supports_staging(self) -> bool:
+        return str(self.db_path) != ":memory:" and not self.read_only
+
+    def open_staging(self) -> BaseCacheManager:
+        """Create a staging database next to the live file, seeded with a consistent copy of it."""
+        self.staging_path.unlink(missing_ok=True)
+        staging = SQLiteCacheManager(str(self.staging_path))
+        self.conn.backup(staging.conn)
+        return staging
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        """Hard-link source to target (copy when links are unsupported), replacing target."""
+        target.unlink(missing_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def promote_staging(self, staging: BaseCacheManager) -> None:
+        """Keep the live file as the previous generation, then atomically rename the staging file over it."""
+        if not isinstance(staging, SQLiteCacheManager) or staging.db_path != self.staging_path:
+            raise ValueError("Staging store does not belong to this database")
+        staging.close()
+        has_live_generation = bool(self.list_tables())
         self.conn.close()
-        
+        try:
+            if has_live_generation:
+                # A hard link keeps the old generation without ever leaving db_path missing.
+                self._link_or_copy(self.db_path, self.previous_path)
+            os.replace(self.staging_path, self.db_path)
+        finally:
+            self._connect()
+
+    def discard_staging(self, staging: BaseCacheManager) -> None:
+        """Close and delete the staging database."""
+        staging.close()
+        self.staging_path.unlink(missing_ok=True)
+
+    def rollback(self) -> bool:
+        """Swap the live and previous database files."""
+        if not self.previous_path.exists():
+            return False
+        swap_path = self.db_path.with_name(f"{self.db_path.name}.rollback")
+        self.conn.close()
+        try:
+            self._link_or_copy(self.db_path, swap_path)
+            os.replace(self.previous_path, self.db_path)
+            os.replace(swap_path, self.previous_path)
+        finally:
+            self._connect()
+        return True
+
+    def archive_generation(self, generation: int) -> None:
+        """Hard-link the live file as a generation; promotion only ever renames over db_path, so the link stays unchanged."""
+        self._link_or_copy(self.db_path, self.generation_path(generation))
+
+    def list_generations(self) -> List[int]:
+        """Return archived generation numbers from the sibling file names, oldest first."""
+        prefix, suffix = f"{self.db_path.stem}.gen-", self.db_path.suffix
+        names = (path.name[len(prefix):len(path.name) - len(suffix)] for path in self.db_path.parent.glob(f"{prefix}*{suffix}"))
+        return sorted(int(name) for name in names if name.isdigit())
+
+    def open_generation(self, generation: int) -> BaseCacheManager:
+        """Open an archived generation through immutable read-only connections."""
+        path = self.generation_path(generation)
+        if not path.exists():
+            raise KeyError(generation)
+        return SQLiteCacheManager(str(path), read_only=True)
+
+    def prune_generations(self, keep: int) -> None:
+        """Delete the oldest archived generation files beyond keep."""
+        generations = self.list_generations()
+        for generation in generations[:max(0, len(generations) - keep)]:
+            self.generation_path(generation).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the database connection, or every pooled read-only connection."""
+        if not self.read_only:
+            self._conn.close()
+            return
+        pool, self._pool = self._pool, []
+        for conn in pool:
+            conn.close()
+        self._idle = queue.LifoQueue()
@@ -0,0 +1,149 @@
+"""Lazily materialized, LRU-bounded read-only mappings over cache tables."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Iterator, List, Mapping, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LazyLRUMapping(Mapping[K, V], Generic[K, V]):
+    """Read-only mapping whose values are loaded on first access and evicted least-recently-used first.
+
+    The key set is fixed at construction, so membership, iteration, and len() never touch storage.
+    Eviction keeps at most max_entries values resident, and when max_bytes > 0 also keeps the summed
+    sizeof() of resident values under that budget (the most recently used value always stays).
+    """
+
+    def __init__(self, keys: Sequence[K], loader: Callable[[K], V], max_entries: int, max_bytes: int = 0, sizeof: Callable[[V], int] | None = None, name: str = "cache") -> None:
+        self._keys: tuple[K, ...] = tuple(keys)
+        self._key_set: frozenset[K] = frozenset(self._keys)
+        self._loader = loader
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max(0, max_bytes)
+        self._sizeof = sizeof
+        self._name = name
+        self._resident: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._resident_bytes = 0
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: K) -> V:
+        if key not in self._key_set:
+            raise KeyError(key)
+        with self._lock:
+            cached = self._resident.get(key)
+            if cached is not None:
+                self._resident.move_to_end(key)
+                return cached[0]
+        # Load outside the lock so threads holding separate connections can read different keys concurrently.
+        value = self._loader(key)
+        size = self._sizeof(value) if self._max_bytes and self._sizeof is not None else 0
+        with self._lock:
+            cached = self._resident.get(key)
+            if cached is not None:
+                # Another thread loaded the same key meanwhile; keep one copy.
+                self._resident.move_to_end(key)
+                return cached[0]
+            self._resident[key] = (value, size)
+            self._resident_bytes += size
+            self._evict()
+        return value
+
+    def _evict(self) -> None:
+        """Drop least-recently-used values until both budgets hold."""
+        while len(self._resident) > 1 and (len(self._resident) > self._max_entries or (self._max_bytes and self._resident_bytes > self._max_bytes)):
+            key, (_, size) = self._resident.popitem(last=False)
+            self._resident_bytes -= size
+            logger.debug("Evicted %s entry %r from %s.", type(self).__name__, key, self._name)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_set
+
+    @property
+    def resident_keys(self) -> list[K]:
+        """Keys currently materialized, least recently used first."""
+        with self._lock:
+            return list(self._resident)
+
+    def clear(self) -> None:
+        """Drop every resident value; the next access reloads from storage."""
+        with self._lock:
+            self._resident.clear()
+            self._resident_bytes = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._name}, keys={len(self._keys)}, resident={len(self._resident)})"
+
+
+class LazySeasonMapping(LazyLRUMapping[int, Dict[str, Any]]):
+    """Lazy season -> position frames mapping that answers column and player-membership questions without loading seasons.
+
+    season_columns maps season -> position -> stat columns (None when the cache did not record them). The
+    player -> seasons index comes from player_seasons_loader, called once on first use.
+    """
+
+    def __init__(self, seasons: Sequence[int], loader: Callable[[int], Dict[str, Any]], player_seasons_loader: Callable[[], Dict[str, List[int]]], max_entries: int,
+                 max_bytes: int = 0, sizeof: Callable[[Dict[str, Any]], int] | None = None, name: str = "cache", season_columns: Mapping[int, Mapping[str, List[str]]] | None = None) -> None:
+        super().__init__(seasons, loader, max_entries=max_entries, max_bytes=max_bytes, sizeof=sizeof, name=name)
+        self.season_columns = season_columns
+        self._player_seasons_loader = player_seasons_loader
+        self._player_seasons: Dict[str, List[int]] | None = None
+        self._index_lock = threading.Lock()
+
+    def player_seasons(self, player_name: str) -> List[int]:
+        """Seasons (ascending) with a row for player_name."""
+        with self._index_lock:
+            if self._player_seasons is None:
+                self._player_seasons = self._player_seasons_loader()
+            return list(self._player_seasons.get(player_name, []))
+
+
+class LazyRecordListMapping(LazyLRUMapping[str, List[Dict[str, Any]]]):
+    """Lazy key -> record list mapping that knows each key's record count without loading it.
+
+    batch_loader(keys, where), when given, reads the matching records of several keys in one query.
+    """
+
+    def __init__(self, record_counts: Mapping[str, int], loader: Callable[[str], List[Dict[str, Any]]], max_entries: int, name: str = "cache",
+                 batch_loader: Callable[[List[str], Dict[str, Any]], Dict[str, List[Dict[str, Any]]]] | None = None) -> None:
+        super().__init__(list(record_counts), loader, max_entries=max_entries, name=name)
+        self.record_counts: Dict[str, int] = dict(record_counts)
+        self._batch_loader = batch_loader
+
+    def records_where(self, keys: Sequence[str], where: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Return each known key's records whose fields equal where, reading all non-resident keys in one batch.
+
+        Batched records are partial, so they are returned without becoming resident.
+        """
+        with self._lock:
+            resident = {key: self._resident[key][0] for key in keys if key in self._resident}
+        missing = [key for key in dict.fromkeys(keys) if key in self._key_set and key not in resident]
+        if self._batch_loader is None:
+            return select_records(self, keys, where)
+        selected = select_records(resident, list(resident), where)
+        if missing:
+            selected.update(self._batch_loader(missing, where))
+        return selected
+
+    @property
+    def total_records(self) -> int:
+        """Total records across all keys, resident or not."""
+        return sum(self.record_counts.values())
+
+
+def select_records(records_by_key: Mapping[str, List[Dict[str, Any]]], keys: Sequence[str], where: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Return each present key's records whose fields equal where."""
+    return {key: [rec for rec in records_by_key[key] if all(rec.get(field) == value for field, value in where.items())]
+            for key in keys if key in records_by_key}
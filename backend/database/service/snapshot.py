@@ -0,0 +1,159 @@
+"""Whole-cache snapshot: the assembled App.caches structure in one memory-mappable file.
+
+Layout: magic, an 8-byte little-endian header length, a JSON header, then one Arrow IPC stream per leaf.
+The header lists every leaf by key path with its byte range and kind:
+- frame: a DataFrame, written with its index and dtypes as Arrow pandas metadata
+- records: a list of record dicts, stored as columns
+- record_groups: a key -> record list mapping (weekly logs), stored as one table with per-key row ranges
+- empty: an empty mapping
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from backend.config.settings import CACHE_LRU_PLAYERS
+from backend.database.service.lazy_cache import LazyRecordListMapping
+from backend.util.timing import timed
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"NFLSNAP1"
+# Bump when the layout changes so older snapshots are ignored.
+_SNAPSHOT_FORMAT_VERSION = 1
+
+KeyPath = Tuple[Any, ...]
+
+
+def _records_table(records: List[Mapping[str, Any]]) -> pa.Table:
+    """Build a table from record dicts, one column per key seen in any record (missing keys become null)."""
+    columns: Dict[str, None] = {}
+    for record in records:
+        columns.update(dict.fromkeys(record))
+    return pa.table({column: pa.array([record.get(column) for record in records]) for column in columns})
+
+
+def _is_record_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, Mapping) for item in value)
+
+
+def _leaves(node: Mapping[Any, Any], path: KeyPath = ()) -> Iterator[Tuple[KeyPath, str, Any]]:
+    """Walk the cache tree and yield (key path, kind, value) for every serializable leaf."""
+    for key, value in node.items():
+        key_path = (*path, key.item() if hasattr(key, "item") else key)
+        if isinstance(value, pd.DataFrame):
+            yield key_path, "frame", value
+        elif _is_record_list(value):
+            yield key_path, "records", value
+        elif isinstance(value, Mapping) and not value:
+            yield key_path, "empty", value
+        elif isinstance(value, Mapping) and all(_is_record_list(item) for item in value.values()):
+            yield key_path, "record_groups", value
+        elif isinstance(value, Mapping):
+            yield from _leaves(value, key_path)
+        else:
+            raise TypeError(f"Cannot snapshot {type(value).__name__} at {key_path!r}")
+
+
+def _ipc_bytes(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue().to_pybytes())
+
+
+@timed("snapshot.write_snapshot")
+def write_snapshot(caches: Mapping[str, Any], path: str, data_version: str) -> None:
+    """Serialize the assembled caches to path, tagged with the cache data version, via an atomic rename."""
+    entries: List[Dict[str, Any]] = []
+    blobs: List[bytes] = []
+    offset = 0
+    for key_path, kind, value in _leaves(caches):
+        entry: Dict[str, Any] = {"path": list(key_path), "kind": kind}
+        if kind == "frame":
+            table = pa.Table.from_pandas(value, preserve_index=True)
+        elif kind in {"records", "empty"}:
+            table = _records_table(list(value))
+        else:
+            entry["keys"] = list(value)
+            entry["counts"] = [len(records) for records in value.values()]
+            table = _records_table([record for records in value.values() for record in records])
+        blob = _ipc_bytes(table)
+        entry.update(offset=offset, length=len(blob))
+        entries.append(entry)
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({"format_version": _SNAPSHOT_FORMAT_VERSION, "data_version": data_version, "entries": entries}).encode()
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(_MAGIC + len(header).to_bytes(8, "little") + header)
+        for blob in blobs:
+            handle.write(blob)
+    os.replace(tmp_path, target)
+    logger.info("Wrote cache snapshot %s (%d leaves, %.1f MiB).", target, len(entries), target.stat().st_size / 2**20)
+
+
+def _read_header(source: pa.MemoryMappedFile) -> Optional[Dict[str, Any]]:
+    if source.read(len(_MAGIC)) != _MAGIC:
+        return None
+    header_length = int.from_bytes(source.read(8), "little")
+    header: Dict[str, Any] = json.loads(source.read(header_length))
+    return header
+
+
+def _record_groups(table: pa.Table, keys: List[Any], counts: List[int], name: str) -> LazyRecordListMapping:
+    """Expose grouped records lazily: each key decodes only its own row range of the mapped table."""
+    starts: Dict[Any, Tuple[int, int]] = {}
+    offset = 0
+    for key, count in zip(keys, counts):
+        starts[key] = (offset, count)
+        offset += count
+
+    def load(key: Any) -> List[Dict[str, Any]]:
+        start, count = starts[key]
+        return list(table.slice(start, count).to_pylist())
+
+    return LazyRecordListMapping(dict(zip(keys, counts)), load, max_entries=CACHE_LRU_PLAYERS, name=name)
+
+
+@timed("snapshot.read_snapshot")
+def read_snapshot(path: str, data_version: str) -> Optional[Dict[str, Any]]:
+    """Rehydrate caches from a memory-mapped snapshot, or return None when it is missing, unreadable, or stale."""
+    if not Path(path).is_file():
+        return None
+    try:
+        source = pa.memory_map(path)
+        header = _read_header(source)
+        if header is None or header.get("format_version") != _SNAPSHOT_FORMAT_VERSION or header.get("data_version") != data_version:
+            logger.info("Cache snapshot %s is stale or from another format; ignoring it.", path)
+            return None
+        body = source.read_buffer()
+        caches: Dict[str, Any] = {}
+        for entry in header["entries"]:
+            # Slices share the mapped file, so leaves are read without copying it.
+            table = ipc.open_stream(body.slice(entry["offset"], entry["length"])).read_all()
+            *parents, leaf = entry["path"]
+            node = caches
+            for key in parents:
+                node = node.setdefault(key, {})
+            if entry["kind"] == "frame":
+                node[leaf] = table.to_pandas()
+            elif entry["kind"] == "records":
+                node[leaf] = table.to_pylist()
+            elif entry["kind"] == "empty":
+                node[leaf] = {}
+            else:
+                node[leaf] = _record_groups(table, entry["keys"], entry["counts"], name="/".join(map(str, entry["path"])))
+        return caches
+    except (OSError, ValueError, KeyError, pa.ArrowException) as e:
+        logger.warning("Could not read cache snapshot %s: %s", path, e)
+        return None
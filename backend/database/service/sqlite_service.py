@@ -1,50 +1,293 @@
-"""SQLite cache service for Statistics, Schedules, and depth charts."""
+"""Cache persistence service for Statistics, Schedules, and depth charts."""
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 import pandas as pd
-
+import pyarrow as pa
+
+from backend.config.settings import (
+    CACHE_BACKEND,
+    CACHE_GENERATIONS,
+    CACHE_LAZY_LOAD,
+    CACHE_LOAD_WORKERS,
+    CACHE_LRU_MAX_MB,
+    CACHE_LRU_PLAYERS,
+    CACHE_LRU_SEASONS,
+    CACHE_SNAPSHOT_PATH,
+)
+from backend.database.DAO.arrow_dao import ArrowCacheManager
+from backend.database.DAO.base_dao import BaseCacheManager, frame_to_records
 from backend.database.DAO.sqlite_dao import SQLiteCacheManager
+from backend.database.service.lazy_cache import LazyRecordListMapping, LazySeasonMapping
+from backend.database.service.snapshot import read_snapshot, write_snapshot
 from backend.util import constants
+from backend.util.exceptions import DataProcessingError
 from backend.util.timing import timed
 
 logger = logging.getLogger(__name__)
 
 
+# Internal partition-key columns used by the consolidated long-format family tables.
+_SEASON_KEY = "__season"
+_POSITION_KEY = "__position"
+_TEAM_KEY = "__team"
+_PLAYER_KEY = "__player_key"
+
+_ALL_PLAYERS_TABLE = f"{constants.CACHE['STATISTICS']}_{constants.STATS['ALL_PLAYERS']}"
+_BY_YEAR_TABLE = f"{constants.CACHE['STATISTICS']}_{constants.STATS['BY_YEAR']}"
+_WEEKLY_TABLE = f"{constants.CACHE['STATISTICS']}_{constants.STATS['PLAYER_WEEKLY_STATS']}"
+_SCHEDULES_TABLE = f"{constants.CACHE['SCHEDULES']}_by_team"
+_DEPTH_CHART_TABLE = f"{constants.CACHE['DEPTH_CHART']}_by_team"
+_PLAYER_SEARCH_TABLE = f"{constants.CACHE['STATISTICS']}_player_search"
+_PLAYER_RESPONSES_TABLE = f"{constants.CACHE['STATISTICS']}_player_responses"
+# __season value of a player's default (latest season) response.
+_DEFAULT_RESPONSE_SEASON = 0
+
+_MANIFEST_TABLE = "Cache_manifest"
+# columns: JSON list of a family-table partition's own columns (null for tables stacked from one frame).
+_MANIFEST_COLUMNS = ["table_name", "partition", "content_hash", "schema_hash", "row_count", "columns"]
+_BUILD_TABLE = "Cache_build"
+_ROW_HASHES_TABLE = "Cache_row_hashes"
+_CHANGES_TABLE = "Cache_changes"
+# Key columns whose values name the players, seasons, and teams a change touches.
+_CHANGE_ENTITIES = {"name": "players", "player_display_name": "players", _PLAYER_KEY: "players", _SEASON_KEY: "seasons", _TEAM_KEY: "teams"}
+_CHANGE_KINDS = ("players", "seasons", "teams")
+# Bump when the stored table layout changes so older caches fail validation and are rebuilt.
+_CACHE_SCHEMA_VERSION = 1
+
+_REQUIRED_TABLES = (_ALL_PLAYERS_TABLE, _BY_YEAR_TABLE, _WEEKLY_TABLE, _SCHEDULES_TABLE, _DEPTH_CHART_TABLE)
+
+
+def _season_frame(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    """Shape one by-year partition as the player-indexed frame Statistics builds.
+
+    Positions share one long table, so only the partition's recorded columns are kept; stat columns that are
+    all-null in a season stay. Caches written before columns were recorded drop every all-null column instead.
+    """
+    if columns is None:
+        return df.dropna(axis=1, how="all").set_index("player_display_name")
+    return df[columns].set_index("player_display_name")
+
+
+def _season_nbytes(positions: Dict[str, pd.DataFrame]) -> int:
+    """Approximate resident size of one season's position frames."""
+    return int(sum(df.memory_usage(deep=True).sum() for df in positions.values()))
+
+
+def build_cache_manager(backend: str = CACHE_BACKEND) -> BaseCacheManager:
+    """Return the storage backend selected by the CACHE_BACKEND setting."""
+    if backend == "sqlite":
+        return SQLiteCacheManager()
+    if backend in {"parquet", "arrow"}:
+        return ArrowCacheManager(file_format=backend)
+    raise ValueError(f"Unsupported cache backend: {backend!r}")
+
+
 class SQLService:
-    """Persist and load the three supported cache types."""
+    """Persist and load the three supported cache types through a pluggable storage backend."""
 
-    def __init__(self) -> None:
-        self.db: SQLiteCacheManager = SQLiteCacheManager()
+    def __init__(self, db: Optional[BaseCacheManager] = None, lazy: bool = CACHE_LAZY_LOAD) -> None:
+        self.db: BaseCacheManager = db if db is not None else build_cache_manager()
+        self.lazy: bool = lazy
+        # Changed players/seasons/teams collected while a staged_write() is open.
+        self._changes: Optional[Dict[str, set]] = None
+        # Generation every read returns, set by use_read_only() when the store pins one; None while reads follow the live store.
+        self.pinned_generation: Optional[int] = None
 
     @timed("SQLService.has_cached_data")
     def has_cached_data(self) -> bool:
-        """Return True when all required cache families exist."""
-        tables = set(self.db.list_tables())
-        if not tables:
+        """Return True when the build record describes a complete cache with the current schema version.
+
+        Caches written before the build record existed fall back to checking that every family table exists.
+        """
+        build = self._load_build_record()
+        if build is None:
+            tables = set(self.db.list_tables())
+            return all(table in tables for table in _REQUIRED_TABLES)
+        if build["schema_version"] != _CACHE_SCHEMA_VERSION:
+            logger.warning("Cache schema version %s does not match %s.", build["schema_version"], _CACHE_SCHEMA_VERSION)
             return False
-        return (self._has_statistics_tables(tables) and self._has_family_tables(tables, constants.CACHE["SCHEDULES"]) and self._has_family_tables(tables, constants.CACHE["DEPTH_CHART"]))
-
-    @staticmethod
-    def _has_family_tables(tables: set[str], family_name: str) -> bool:
-        """Return True when at least one table exists for the given cache family prefix."""
-        return any(table.startswith(f"{family_name}_") for table in tables)
-
-    @staticmethod
-    def _has_statistics_tables(tables: set[str]) -> bool:
-        """Return True when core statistics tables are present."""
-        prefix = constants.CACHE["STATISTICS"]
-        all_players = f"{prefix}_{constants.STATS['ALL_PLAYERS']}"
-        weekly = f"{prefix}_{constants.STATS['PLAYER_WEEKLY_STATS']}"
-        if all_players not in tables or weekly not in tables:
+        return all(table in build["tables"] for table in _REQUIRED_TABLES)
+
+    def cache_build_info(self) -> Optional[Dict[str, Any]]:
+        """Return the build record of the live cache: schema_version, data_version, generation, built_at, and tables."""
+        return self._load_build_record()
+
+    def _load_build_record(self) -> Optional[Dict[str, Any]]:
+        """Read the single-row build record, or None when the cache predates it."""
+        build = self._load_table_safe(_BUILD_TABLE)
+        if build is None or build.empty:
+            return None
+        record = build.iloc[0].to_dict()
+        return {"schema_version": int(record["schema_version"]),
+                "data_version": str(record["data_version"]),
+                # Caches built before generations were numbered count as generation 0.
+                "generation": int(record.get("generation") or 0),
+                "built_at": str(record["built_at"]),
+                "tables": json.loads(record["tables"])}
+
+    def _write_build_record(self, generation: int) -> None:
+        """Record the schema version, a content-derived data version, the generation, the build time, and the tables present."""
+        manifest = self._load_manifest().sort_values(["table_name", "partition"])
+        digest = hashlib.sha1()
+        for table_name, partition, content_hash in zip(manifest["table_name"], manifest["partition"], manifest["content_hash"]):
+            digest.update(f"{table_name}\0{partition}\0{content_hash}\n".encode())
+        tables = sorted(set(manifest["table_name"]))
+        self.db.save_table(_BUILD_TABLE, pd.DataFrame([{"schema_version": _CACHE_SCHEMA_VERSION,
+                                                        "data_version": digest.hexdigest()[:16],
+                                                        "generation": generation,
+                                                        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                                                        "tables": json.dumps(tables)}]), index=False)
+
+    def write_snapshot(self, caches: Mapping[str, Any], path: str = CACHE_SNAPSHOT_PATH) -> bool:
+        """Write the assembled caches as a snapshot tagged with the live data version; False when skipped or failed."""
+        build = self.cache_build_info()
+        if build is None:
+            return False
+        try:
+            write_snapshot(caches, path, build["data_version"])
+        except (OSError, TypeError, ValueError, pa.ArrowException) as e:
+            # The snapshot only speeds up startup; the table path still serves a complete cache.
+            logger.warning("Could not write cache snapshot %s: %s", path, e)
+            Path(f"{path}.tmp").unlink(missing_ok=True)
             return False
+        return True
+
+    def load_snapshot(self, path: str = CACHE_SNAPSHOT_PATH) -> Optional[Dict[str, Any]]:
+        """Rehydrate all caches from the snapshot when it matches the live data version, else None."""
+        build = self.cache_build_info()
+        return read_snapshot(path, build["data_version"]) if build is not None else None
+
+    def use_read_only(self) -> None:
+        """Switch to the backend's read-only view (a pinned pool of immutable connections on SQLite) for serving."""
+        view = self.db.read_only_view()
+        if view is not self.db:
+            self.db.close()
+            self.db = view
+        if self.db.pins_generation:
+            build = self.cache_build_info()
+            self.pinned_generation = build["generation"] if build else 0
+
+    @contextmanager
+    def bulk_write(self) -> Iterator[None]:
+        """Persist every save_to_db call made inside the block as one transaction."""
+        with self.db.bulk_write():
+            yield
+
+    @contextmanager
+    def staged_write(self) -> Iterator[None]:
+        """Build every save_to_db call made inside the block into a staging store, then atomically promote it.
+
+        Readers of the live store keep seeing the previous, complete generation until promotion, and the
+        replaced generation is kept so rollback() can restore it.
+        """
+        build = self.cache_build_info()
+        previous = build["generation"] if build else 0
+        generation = self._next_generation()
+        if not self.db.supports_staging:
+            with self.bulk_write(), self._tracking_changes():
+                yield
+                self._write_changes(generation, previous)
+                self._write_build_record(generation)
+            return
 
-        stats_prefix = f"{prefix}_"
-        seasonal_tables = [table for table in tables if table.startswith(stats_prefix) and table not in {all_players, weekly}]
-        return bool(seasonal_tables)
+        live = self.db
+        staging = live.open_staging()
+        self.db = staging
+        try:
+            with staging.bulk_write(), self._tracking_changes():
+                yield
+                self._write_changes(generation, previous)
+                self._write_build_record(generation)
+            missing = [table for table in _REQUIRED_TABLES if not staging.table_exists(table)]
+            if missing:
+                raise DataProcessingError(f"Staged cache is missing tables: {', '.join(missing)}", source="SQLService")
+        except BaseException:
+            self.db = live
+            live.discard_staging(staging)
+            raise
+        self.db = live
+        live.promote_staging(staging)
+        logger.info("Promoted staged cache generation %d.", generation)
+        if CACHE_GENERATIONS > 0:
+            live.archive_generation(generation)
+            live.prune_generations(CACHE_GENERATIONS)
+
+    @contextmanager
+    def _tracking_changes(self) -> Iterator[None]:
+        self._changes = {kind: set() for kind in _CHANGE_KINDS}
+        try:
+            yield
+        finally:
+            self._changes = None
+
+    def _record_changes(self, keys: pd.DataFrame) -> None:
+        """Add the players, seasons, and teams named by changed row or partition keys to the open change set."""
+        if self._changes is None:
+            return
+        for column, kind in _CHANGE_ENTITIES.items():
+            if column in keys.columns:
+                self._changes[kind].update(keys[column].dropna().tolist())
+
+    def _write_changes(self, generation: int, previous: int) -> None:
+        """Append this generation's change set, relative to the previous live generation, to the change history."""
+        changes = self._changes or {}
+        self.db.save_table(_CHANGES_TABLE, pd.DataFrame([{"generation": generation,
+                                                          "previous": previous,
+                                                          **{kind: json.dumps(sorted(changes.get(kind, ()), key=str)) for kind in _CHANGE_KINDS}}]),
+                           if_exists="append", index=False)
+
+    def changes_since(self, since: int, until: int) -> Dict[str, Any]:
+        """Return the players, seasons, and teams that differ between generation since and generation until.
+
+        The history is walked back from until through each generation's predecessor; full_refresh is True
+        when that chain does not lead to since (a rollback in between, or history older than the cache keeps).
+        """
+        changes: Dict[str, set] = {kind: set() for kind in _CHANGE_KINDS}
+        history = self._load_table_safe(_CHANGES_TABLE)
+        rows = {} if history is None else {int(row["generation"]): row for row in history.to_dict("records")}
+        generation = until
+        while generation > since and generation in rows:
+            row = rows[generation]
+            for kind in _CHANGE_KINDS:
+                changes[kind].update(json.loads(row[kind]))
+            generation = int(row["previous"])
+        return {"full_refresh": generation != since, **{kind: sorted(values, key=str) for kind, values in changes.items()}}
+
+    def _next_generation(self) -> int:
+        """Return a generation number above the live one and every archived one, so numbers never repeat after a rollback."""
+        build = self.cache_build_info()
+        return max([build["generation"] if build else 0, *self.db.list_generations()]) + 1
+
+    def generations(self) -> List[int]:
+        """Return the kept generation numbers, oldest first."""
+        return self.db.list_generations()
+
+    def open_generation(self, generation: int) -> SQLService:
+        """Return an eagerly loading read-only service over one kept generation; raises KeyError when it is not kept.
+
+        Eager loads let callers close the service right after load_many().
+        """
+        return SQLService(self.db.open_generation(generation), lazy=False)
+
+    def rollback(self) -> bool:
+        """Restore the previous cache generation; return False when none is kept."""
+        restored = self.db.rollback()
+        if restored:
+            logger.info("Rolled back to the previous cache generation.")
+        else:
+            logger.warning("No previous cache generation to roll back to.")
+        return restored
 
     @timed("SQLService.save_to_db")
     def save_to_db(self, cache: Dict[Any, Any], cls_name: str) -> None:
@@ -78,107 +321,332 @@ class SQLService:
         logger.warning("Unsupported cache class '%s'; returning empty cache.", cls_name)
         return {}
 
+    @timed("SQLService.load_many")
+    def load_many(self, cls_names: List[str], workers: int = CACHE_LOAD_WORKERS) -> Dict[str, Dict[Any, Any]]:
+        """Load several cache objects, fanning their table reads out over a thread pool when the backend allows it.
+
+        Statistics is split into its three component tables, so up to five family tables load concurrently.
+        Each worker reads through its own pooled connection (see BaseCacheManager.supports_concurrent_reads).
+        """
+        if workers <= 1 or not self.db.supports_concurrent_reads:
+            return {cls_name: self.load_from_db(cls_name) for cls_name in cls_names}
+
+        statistics = constants.CACHE["STATISTICS"]
+        tasks: Dict[Tuple[str, str], Callable[[], Any]] = {}
+        for cls_name in cls_names:
+            if cls_name == statistics:
+                tasks.update({(cls_name, component): loader for component, loader in self._statistics_loaders().items()})
+            else:
+                tasks[(cls_name, "")] = functools.partial(self.load_from_db, cls_name)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cache-load") as pool:
+            futures = {key: pool.submit(task) for key, task in tasks.items()}
+            results = {key: future.result() for key, future in futures.items()}
+
+        caches: Dict[str, Dict[Any, Any]] = {}
+        for cls_name in cls_names:
+            if cls_name == statistics:
+                caches[cls_name] = {component: results[(cls_name, component)] for component in self._statistics_loaders()}
+            else:
+                caches[cls_name] = results[(cls_name, "")]
+        return caches
+
     @timed("SQLService._save_statistics")
     def _save_statistics(self, cache: Dict[str, Any]) -> None:
-        prefix = constants.CACHE["STATISTICS"]
-
         all_players = cache.get(constants.STATS["ALL_PLAYERS"], [])
         if all_players:
-            self.db.save_table(f"{prefix}_{constants.STATS['ALL_PLAYERS']}", pd.DataFrame(all_players), index=False)
+            written = self._save_partitioned_table(_ALL_PLAYERS_TABLE, pd.DataFrame(all_players), [], row_key="name")
+            if self.db.supports_text_search and (written or not self.db.table_exists(_PLAYER_SEARCH_TABLE)):
+                self.db.build_text_index(_PLAYER_SEARCH_TABLE, _ALL_PLAYERS_TABLE, "name")
 
         by_year = cache.get(constants.STATS["BY_YEAR"], {})
-        for season, position_map in by_year.items():
-            if not isinstance(position_map, dict):
-                continue
-            for position, df in position_map.items():
-                self.db.save_table(f"{prefix}_{season}_{position}", df.reset_index(), index=False)
+        season_frames = {(int(season), position): df.reset_index()
+                         for season, position_map in by_year.items() if isinstance(position_map, dict)
+                         for position, df in position_map.items()}
+        if season_frames:
+            self._save_family_table(_BY_YEAR_TABLE, season_frames, [_SEASON_KEY, _POSITION_KEY], row_key="player_display_name")
 
         weekly = cache.get(constants.STATS["PLAYER_WEEKLY_STATS"], {})
         if weekly:
-            weekly_rows = [{"__player_key": player_name, **week_stats} for player_name, week_list in weekly.items() for week_stats in week_list]
+            weekly_rows = [{_PLAYER_KEY: player_name, **week_stats} for player_name, week_list in weekly.items() for week_stats in week_list]
             if weekly_rows:
-                self.db.save_table(f"{prefix}_{constants.STATS['PLAYER_WEEKLY_STATS']}", pd.DataFrame(weekly_rows), index=False)
+                weekly_df = pd.DataFrame(weekly_rows)
+                # Per-player reads filter on the player key, optionally narrowed to one season.
+                index_columns = [_PLAYER_KEY, "season"] if "season" in weekly_df.columns else None
+                self._save_partitioned_table(_WEEKLY_TABLE, weekly_df, [_PLAYER_KEY], index_columns)
 
     @timed("SQLService._load_statistics")
     def _load_statistics(self) -> Dict[str, Any]:
-        prefix = constants.CACHE["STATISTICS"]
-        seasons = constants.SEASONS
-
-        all_players_df = self._load_table_safe(f"{prefix}_{constants.STATS['ALL_PLAYERS']}")
-        all_players = [{key: (None if pd.isna(value) else value) for key, value in rec.items()} for rec in all_players_df.to_dict("records")] if all_players_df is not None and not all_players_df.empty else []
-
+        return {component: loader() for component, loader in self._statistics_loaders().items()}
+
+    def _statistics_loaders(self) -> Dict[str, Callable[[], Any]]:
+        """Return one independent loader per Statistics cache component."""
+        return {constants.STATS["ALL_PLAYERS"]: self._load_all_players,
+                constants.STATS["BY_YEAR"]: self._load_by_year,
+                constants.STATS["PLAYER_WEEKLY_STATS"]: self._load_weekly}
+
+    @timed("SQLService._load_all_players")
+    def _load_all_players(self) -> List[Dict[str, Any]]:
+        all_players_df = self._load_family_frame(_ALL_PLAYERS_TABLE)
+        return frame_to_records(all_players_df) if all_players_df is not None else []
+
+    @timed("SQLService._load_by_year")
+    def _load_by_year(self) -> Mapping[int, Dict[str, pd.DataFrame]]:
+        if self.lazy:
+            seasons = self._partition_key_counts(_BY_YEAR_TABLE, _SEASON_KEY)
+            return LazySeasonMapping([int(season) for season in seasons], self._load_season, self._load_player_seasons, max_entries=CACHE_LRU_SEASONS,
+                                     max_bytes=CACHE_LRU_MAX_MB * 1024 * 1024, sizeof=_season_nbytes, name=_BY_YEAR_TABLE,
+                                     season_columns=self._season_stat_columns())
+        columns = self._partition_columns(_BY_YEAR_TABLE)
         by_year: Dict[int, Dict[str, pd.DataFrame]] = {}
-        for season in seasons:
-            season_map: Dict[str, pd.DataFrame] = {}
-            for position in constants.POSITIONS:
-                df = self._load_table_safe(f"{prefix}_{season}_{position}")
-                if df is None or df.empty:
-                    continue
-                season_map[position] = df.set_index("player_display_name")
-            if season_map:
-                by_year[int(season)] = season_map
-
-        weekly_df = self._load_table_safe(f"{prefix}_{constants.STATS['PLAYER_WEEKLY_STATS']}")
+        for (season, position), df in self._split_family_table(_BY_YEAR_TABLE, [_SEASON_KEY, _POSITION_KEY]):
+            by_year.setdefault(int(season), {})[str(position)] = _season_frame(df, columns.get((season, position)))
+        return by_year
+
+    @timed("SQLService._load_weekly")
+    def _load_weekly(self) -> Mapping[str, List[Dict[str, Any]]]:
+        if self.lazy:
+            counts = self._partition_key_counts(_WEEKLY_TABLE, _PLAYER_KEY)
+            return LazyRecordListMapping(counts, self._load_player_weekly, max_entries=CACHE_LRU_PLAYERS, name=_WEEKLY_TABLE, batch_loader=self._load_weekly_batch)
+        return self._load_all_weekly()
+
+    def _partition_key_counts(self, table_name: str, key: str) -> Dict[Any, int]:
+        """Return row counts per value of a table's leading partition key, from the manifest when available."""
+        partitions = self._manifest_partitions(table_name)
+        if partitions is None:
+            return self.db.value_counts(table_name, key) if self.db.table_exists(table_name) else {}
+        counts: Dict[Any, int] = {}
+        for partition, row_count in sorted(partitions.items()):
+            counts[partition[0]] = counts.get(partition[0], 0) + row_count
+        return counts
+
+    def _load_all_weekly(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the whole weekly table and group its records by player."""
+        weekly_df = self._load_family_frame(_WEEKLY_TABLE)
         weekly_stats: Dict[str, List[Dict[str, Any]]] = {}
         if weekly_df is not None and not weekly_df.empty:
-            for rec in [{key: (None if pd.isna(value) else value) for key, value in row.items()} for row in weekly_df.to_dict("records")]:
+            for rec in frame_to_records(weekly_df):
                 # Prefer the dedicated cache key; fall back to legacy table shape.
-                player_name = rec.pop("__player_key", rec.pop("player_name", None))
+                player_name = rec.pop(_PLAYER_KEY, rec.pop("player_name", None))
                 if player_name:
                     weekly_stats.setdefault(player_name, []).append(rec)
-
-        return {constants.STATS["ALL_PLAYERS"]: all_players,
-                constants.STATS["BY_YEAR"]: by_year,
-                constants.STATS["PLAYER_WEEKLY_STATS"]: weekly_stats}
+        return weekly_stats
+
+    def _load_player_weekly(self, player_name: str, season: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read one player's weekly records, optionally for one season, through the (player key, season) index."""
+        where: Dict[str, Any] = {} if season is None else {"season": season}
+        return self._load_weekly_batch([player_name], where).get(player_name, [])
+
+    def _load_weekly_batch(self, player_names: List[str], where: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Read several players' weekly records narrowed by where in one IN (...) query, grouped by player."""
+        weekly: Dict[str, List[Dict[str, Any]]] = {}
+        for rec in self.db.load_records(_WEEKLY_TABLE, {_PLAYER_KEY: list(player_names), **where}):
+            player_name = rec.pop(_PLAYER_KEY, None)
+            rec.pop("player_name", None)
+            weekly.setdefault(player_name, []).append(rec)
+        return weekly
+
+    def _season_stat_columns(self) -> Optional[Dict[int, Dict[str, List[str]]]]:
+        """Return season -> position -> stat columns from the manifest, or None unless every partition recorded them."""
+        columns = self._partition_columns(_BY_YEAR_TABLE)
+        partitions = self._manifest_partitions(_BY_YEAR_TABLE)
+        if not columns or (partitions is not None and not set(partitions) <= set(columns)):
+            return None
+        season_columns: Dict[int, Dict[str, List[str]]] = {}
+        for (season, position), partition_columns in columns.items():
+            season_columns.setdefault(int(season), {})[str(position)] = [column for column in partition_columns if column != "player_display_name"]
+        return season_columns
+
+    def _load_player_seasons(self) -> Dict[str, List[int]]:
+        """Index player -> seasons (ascending) from a two-column read of the by-year table."""
+        if not self.db.table_exists(_BY_YEAR_TABLE):
+            return {}
+        df = self.db.load_columns(_BY_YEAR_TABLE, ["player_display_name", _SEASON_KEY]).drop_duplicates()
+        return {str(player): sorted(int(season) for season in seasons) for player, seasons in df.groupby("player_display_name")[_SEASON_KEY]}
+
+    @timed("SQLService._load_season")
+    def _load_season(self, season: int) -> Dict[str, pd.DataFrame]:
+        """Read one season's position frames from the by-year family table."""
+        df = self.db.load_rows(_BY_YEAR_TABLE, {_SEASON_KEY: season})
+        columns = self._partition_columns(_BY_YEAR_TABLE, season)
+        return {str(position): _season_frame(frame, columns.get((season, position)))
+                for (position,), frame in self._split_frame(df.drop(columns=_SEASON_KEY), [_POSITION_KEY])}
 
     @timed("SQLService._save_schedules")
     def _save_schedules(self, cache: Dict[str, Any]) -> None:
-        prefix = constants.CACHE["SCHEDULES"]
-
-        for season, season_map in cache.items():
-            if not isinstance(season_map, dict):
-                continue
-            for team, df in season_map.items():
-                self.db.save_table(f"{prefix}_{season}_{team}", df)
+        team_frames = {(int(season), team): df.rename_axis("week").reset_index()
+                       for season, season_map in cache.items() if isinstance(season_map, dict)
+                       for team, df in season_map.items()}
+        if team_frames:
+            self._save_family_table(_SCHEDULES_TABLE, team_frames, [_SEASON_KEY, _TEAM_KEY])
 
     @timed("SQLService._load_schedules")
     def _load_schedules(self) -> Dict[int, Dict[str, pd.DataFrame]]:
-        prefix = constants.CACHE["SCHEDULES"]
-        seasons = constants.SEASONS
         nested: Dict[int, Dict[str, pd.DataFrame]] = {}
-
-        for season in seasons:
-            season_map: Dict[str, pd.DataFrame] = {}
-            for team in constants.TEAM_METADATA:
-                df = self._load_table_safe(f"{prefix}_{season}_{team}")
-                if df is None or df.empty:
-                    continue
-                index_col = "week" if "week" in df.columns else df.columns[0]
-                season_map[team] = df.set_index(index_col)
-            if season_map:
-                nested[int(season)] = season_map
-
+        for (season, team), df in self._split_family_table(_SCHEDULES_TABLE, [_SEASON_KEY, _TEAM_KEY]):
+            nested.setdefault(int(season), {})[str(team)] = df.set_index("week")
         return nested
 
     @timed("SQLService._save_depth_charts")
     def _save_depth_charts(self, cache: Dict[str, Any]) -> None:
-        prefix = constants.CACHE["DEPTH_CHART"]
-        for team, df in cache.items():
-            self.db.save_table(f"{prefix}_{team}", df)
+        team_frames = {(team,): df.rename_axis("position").reset_index() for team, df in cache.items()}
+        if team_frames:
+            self._save_family_table(_DEPTH_CHART_TABLE, team_frames, [_TEAM_KEY])
 
     @timed("SQLService._load_depth_charts")
     def _load_depth_charts(self) -> Dict[str, pd.DataFrame]:
-        prefix = constants.CACHE["DEPTH_CHART"]
         charts: Dict[str, pd.DataFrame] = {}
+        for (team,), df in self._split_family_table(_DEPTH_CHART_TABLE, [_TEAM_KEY]):
+            charts[str(team)] = df.set_index("position").rename_axis(str(team))
+        return charts
 
-        for team in constants.TEAM_METADATA:
-            df = self._load_table_safe(f"{prefix}_{team}")
-            if df is None or df.empty:
-                continue
-            index_col = team if team in df.columns else df.columns[0]
-            charts[team] = df.set_index(index_col)
+    def _save_family_table(self, table_name: str, partitions: Dict[Tuple[Any, ...], pd.DataFrame], partition_keys: List[str], row_key: Optional[str] = None) -> None:
+        """Stack partition frames into one long-format family table and persist the partitions that changed.
+
+        Each partition's own columns are recorded in the manifest, so loads can drop the columns the stacking union added.
+        """
+        stacked = pd.concat(partitions, names=[*partition_keys, None]).reset_index(level=partition_keys).reset_index(drop=True)
+        partition_columns = {partition: [str(column) for column in df.columns] for partition, df in partitions.items()}
+        self._save_partitioned_table(table_name, stacked, partition_keys, row_key=row_key, partition_columns=partition_columns)
+
+    def _save_partitioned_table(self, table_name: str, stacked: pd.DataFrame, partition_keys: List[str], index_columns: Optional[List[str]] = None, row_key: Optional[str] = None,
+                                partition_columns: Optional[Dict[Tuple[Any, ...], List[str]]] = None) -> bool:
+        """Rewrite only partitions whose content hash differs from the manifest; rewrite the table when its columns change.
+
+        Changed partitions are recorded as changes; with a row_key, changes are narrowed to the rows whose hash moved.
+        Returns False when the stored table was already up to date and nothing was written.
+        """
+        row_hashes = self._row_hashes(stacked)
+        hashes = self._partition_hashes(stacked, partition_keys, row_hashes, partition_columns)
+        schema_hash = self._schema_hash(stacked.columns)
+        manifest = self._load_manifest()
+        stored = manifest.loc[manifest["table_name"] == table_name]
+        stored_hashes = {tuple(json.loads(label)): content_hash for label, content_hash in zip(stored["partition"], stored["content_hash"])}
+
+        table_exists = self.db.table_exists(table_name)
+        schema_changed = stored.empty or bool((stored["schema_hash"] != schema_hash).any())
+        if table_exists and not schema_changed and stored_hashes == hashes:
+            logger.info("%s unchanged; skipping write.", table_name)
+            return False
 
-        return charts
+        changed = [partition for partition, content_hash in hashes.items() if stored_hashes.get(partition) != content_hash]
+        removed = [partition for partition in stored_hashes if partition not in hashes]
+        if row_key is not None:
+            self._record_changes(self._save_row_hashes(table_name, stacked, [*partition_keys, row_key], row_hashes))
+        elif partition_keys:
+            self._record_changes(pd.DataFrame(changed + removed, columns=partition_keys))
+
+        if not partition_keys or not table_exists or schema_changed:
+            self.db.save_table(table_name, stacked, index=False)
+            logger.info("%s rewritten (%d partitions).", table_name, len(hashes))
+        else:
+            is_changed = pd.MultiIndex.from_frame(stacked[partition_keys]).isin(changed)
+            self.db.replace_partitions(table_name, partition_keys, changed + removed, stacked.loc[is_changed])
+            logger.info("%s: rewrote %d of %d partitions, removed %d.", table_name, len(changed), len(hashes), len(removed))
+        if partition_keys:
+            self.db.create_index(table_name, index_columns or partition_keys)
+
+        row_counts: Dict[Tuple[Any, ...], int] = {(): len(stacked)}
+        if partition_keys:
+            row_counts = {(keys if isinstance(keys, tuple) else (keys,)): int(count) for keys, count in stacked.groupby(partition_keys, sort=False).size().items()}
+        entries = pd.DataFrame({"table_name": table_name,
+                                "partition": [json.dumps([self._to_builtin(value) for value in partition]) for partition in hashes],
+                                "content_hash": list(hashes.values()),
+                                "schema_hash": schema_hash,
+                                "row_count": [row_counts[partition] for partition in hashes],
+                                "columns": [json.dumps(partition_columns[partition]) if partition_columns else None for partition in hashes]})
+        self.db.save_table(_MANIFEST_TABLE, pd.concat([manifest.loc[manifest["table_name"] != table_name], entries], ignore_index=True), index=False)
+        self.db.create_index(_MANIFEST_TABLE, ["table_name"])
+        return True
+
+    @staticmethod
+    def _to_builtin(value: Any) -> Any:
+        """Convert NumPy scalars to Python scalars so partition keys serialize to JSON."""
+        return value.item() if hasattr(value, "item") else value
+
+    @staticmethod
+    def _schema_hash(columns: pd.Index) -> str:
+        """Hash the sorted column names of a family table."""
+        return hashlib.sha1(json.dumps(sorted(str(column) for column in columns)).encode()).hexdigest()
+
+    @staticmethod
+    def _row_hashes(stacked: pd.DataFrame) -> pd.Series:
+        """Return one vectorized content hash per row."""
+        # Sorted columns keep hashes stable when the union of partition columns is concatenated in another order.
+        return pd.util.hash_pandas_object(stacked[sorted(stacked.columns, key=str)], index=False)
+
+    @staticmethod
+    def _partition_hashes(stacked: pd.DataFrame, partition_keys: List[str], row_hashes: pd.Series,
+                          partition_columns: Optional[Dict[Tuple[Any, ...], List[str]]] = None) -> Dict[Tuple[Any, ...], str]:
+        """Return a content hash per partition, built from the row hashes in row order and any recorded column list."""
+        if not partition_keys:
+            return {(): hashlib.sha1(row_hashes.to_numpy().tobytes()).hexdigest()}
+        hashes: Dict[Tuple[Any, ...], str] = {}
+        for keys, group in row_hashes.groupby([stacked[key] for key in partition_keys], sort=False):
+            partition = keys if isinstance(keys, tuple) else (keys,)
+            digest = hashlib.sha1(group.to_numpy().tobytes())
+            if partition_columns:
+                # An all-null column added or dropped leaves the row hashes unchanged, so the column list is hashed too.
+                digest.update(json.dumps(partition_columns[partition]).encode())
+            hashes[partition] = digest.hexdigest()
+        return hashes
+
+    def _save_row_hashes(self, table_name: str, stacked: pd.DataFrame, key_columns: List[str], row_hashes: pd.Series) -> pd.DataFrame:
+        """Replace a table's stored per-row hashes and return the keys of rows added, removed, or changed since the last save."""
+        keys = [json.dumps(list(key)) for key in zip(*(stacked[column].tolist() for column in key_columns))]
+        current = pd.DataFrame({"table_name": table_name, "row_key": keys, "row_hash": row_hashes.to_numpy().view("int64")})
+        stored = self.db.load_rows(_ROW_HASHES_TABLE, {"table_name": table_name}) if self.db.table_exists(_ROW_HASHES_TABLE) else current.iloc[:0]
+        moved = set(zip(current["row_key"], current["row_hash"])) ^ set(zip(stored["row_key"], stored["row_hash"].astype("int64")))
+
+        self.db.replace_partitions(_ROW_HASHES_TABLE, ["table_name"], [(table_name,)], current)
+        self.db.create_index(_ROW_HASHES_TABLE, ["table_name"])
+        return pd.DataFrame([json.loads(key) for key in sorted({key for key, _ in moved})], columns=key_columns)
+
+    def _load_manifest(self) -> pd.DataFrame:
+        """Return the stored partition manifest, or an empty one when none exists yet (or it predates row counts)."""
+        manifest = self._load_table_safe(_MANIFEST_TABLE)
+        if manifest is None or any(column not in manifest.columns for column in _MANIFEST_COLUMNS):
+            return pd.DataFrame(columns=_MANIFEST_COLUMNS)
+        return manifest
+
+    def _manifest_partitions(self, table_name: str) -> Optional[Dict[Tuple[Any, ...], int]]:
+        """Return {partition key tuple: row count} for one table, or None when the cache has no manifest to trust."""
+        if not self.db.table_exists(_BUILD_TABLE):
+            return None
+        rows = self.db.load_rows(_MANIFEST_TABLE, {"table_name": table_name})
+        return {tuple(json.loads(partition)): int(count) for partition, count in zip(rows["partition"], rows["row_count"])}
+
+    def _partition_columns(self, table_name: str, season: Optional[int] = None) -> Dict[Tuple[Any, ...], List[str]]:
+        """Return the recorded columns per partition of a family table (optionally one season), empty when none were recorded."""
+        if not self.db.table_exists(_MANIFEST_TABLE):
+            return {}
+        rows = self.db.load_rows(_MANIFEST_TABLE, {"table_name": table_name})
+        if "columns" not in rows.columns:
+            return {}
+        partitions = ((tuple(json.loads(partition)), columns) for partition, columns in zip(rows["partition"], rows["columns"]) if isinstance(columns, str))
+        return {partition: json.loads(columns) for partition, columns in partitions if season is None or partition[0] == season}
+
+    def _load_family_frame(self, table_name: str) -> Optional[pd.DataFrame]:
+        """Read a family table the manifest lists, skipping the read when it has no partitions."""
+        partitions = self._manifest_partitions(table_name)
+        if partitions is None:
+            return self._load_table_safe(table_name)
+        return self.db.load_table(table_name) if partitions else None
+
+    def _split_family_table(self, table_name: str, partition_keys: List[str]) -> List[Tuple[Tuple[Any, ...], pd.DataFrame]]:
+        """Read a long-format family table in one query and split it into partitions in memory."""
+        df = self._load_family_frame(table_name)
+        if df is None:
+            return []
+        return self._split_frame(df, partition_keys)
+
+    @staticmethod
+    def _split_frame(df: pd.DataFrame, partition_keys: List[str]) -> List[Tuple[Tuple[Any, ...], pd.DataFrame]]:
+        """Split a long-format frame into (partition key tuple, partition rows without key columns)."""
+        if df.empty:
+            return []
+        return [(keys if isinstance(keys, tuple) else (keys,), group.drop(columns=partition_keys).reset_index(drop=True))
+                for keys, group in df.groupby(partition_keys, sort=False)]
 
     def _load_table_safe(self, table_name: str) -> Optional[pd.DataFrame]:
         try:
@@ -189,5 +657,27 @@ class SQLService:
             logger.error("Error loading table '%s': %s", table_name, e)
             raise
 
+    @timed("SQLService.save_player_responses")
+    def save_player_responses(self, responses: Iterable[Tuple[str, Optional[int], bytes]]) -> None:
+        """Persist pre-rendered (player, season, body) responses, rewriting only players whose bodies changed."""
+        df = pd.DataFrame([(player, _DEFAULT_RESPONSE_SEASON if season is None else int(season), body) for player, season, body in responses],
+                          columns=[_PLAYER_KEY, _SEASON_KEY, "body"])
+        if not df.empty:
+            self._save_partitioned_table(_PLAYER_RESPONSES_TABLE, df, [_PLAYER_KEY], index_columns=[_PLAYER_KEY, _SEASON_KEY])
+
+    def load_player_response(self, player_name: str, season: Optional[int] = None) -> Optional[bytes]:
+        """Return a stored response body with one indexed lookup, or None when it was not pre-rendered."""
+        if not self.db.table_exists(_PLAYER_RESPONSES_TABLE):
+            return None
+        records = self.db.load_records(_PLAYER_RESPONSES_TABLE, {_PLAYER_KEY: player_name, _SEASON_KEY: _DEFAULT_RESPONSE_SEASON if season is None else season})
+        return bytes(records[0]["body"]) if records else None
+
+    @timed("SQLService.search_players")
+    def search_players(self, query: str, position: Optional[str] = None, limit: int = 20) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """Search the player name index; returns (top records, total matches), or None when no index is stored."""
+        if not self.db.supports_text_search or not self.db.table_exists(_PLAYER_SEARCH_TABLE):
+            return None
+        return self.db.search_text(_PLAYER_SEARCH_TABLE, "name", query, {"position": position} if position else {}, limit)
+
     def close(self) -> None:
         self.db.close()
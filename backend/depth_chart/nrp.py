@@ -9,6 +9,7 @@ import pandas as pd
 from backend.base_source import BaseSource
 from backend.util import constants
 from backend.util.exceptions import DataLoadError, DataProcessingError
+from backend.util.raw_source_cache import load_raw_source
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ class NRPDepthChart(BaseSource):
         """Load seasonal depth chart snapshots from nflreadpy."""
         try:
             required_columns = ["dt", "team", "pos_abb", "player_name", "pos_rank", "pos_slot"]
-            depth = nfl.load_depth_charts(seasons=self.seasons).to_pandas().loc[:, required_columns].copy()
+            depth = load_raw_source("depth_charts", lambda seasons: nfl.load_depth_charts(seasons=seasons).to_pandas(), self.seasons).loc[:, required_columns].copy()
             depth["team"] = depth["team"].replace(constants.TEAM_ABBR_NORMALIZATION)
             depth["dt"] = pd.to_datetime(depth["dt"], errors="coerce", utc=True)
             depth["pos_rank"] = pd.to_numeric(depth["pos_rank"], errors="coerce")
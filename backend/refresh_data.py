@@ -1,34 +1,55 @@
 """Refresh script to regenerate all data and save to database cache."""
 
+import argparse
+
 from backend.app import App
 from backend.config.logging_config import setup_logging
 
 setup_logging()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate all data and save it to the database cache.")
+    parser.add_argument("--rollback", action="store_true", help="Restore the previous cache generation instead of refreshing")
+    parser.add_argument("--incremental", action="store_true", help="Rebuild only the current season and reuse the cached older seasons")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Refreshing Fantasy Football Data Cache")
     print("=" * 60)
     print()
-    
+
     app = App()
-    
-    print(">> Downloading fresh data from all sources...")
+
+    if args.rollback:
+        print(">> Rolling back to the previous cache generation...")
+        restored = app.db.rollback()
+        app.db.close()
+        print(">> Previous generation restored!" if restored else ">> No previous generation found; cache unchanged.")
+        print()
+        print("=" * 60)
+        print("Done! Restart the API server to use the restored data." if restored else "Done!")
+        print("=" * 60)
+        raise SystemExit(0 if restored else 1)
+
+    print(">> Downloading fresh current-season data from all sources..." if args.incremental else ">> Downloading fresh data from all sources...")
     print("   - Depth Charts ")
     print("   - NFL Schedules ")
     print("   - Player Statistics ")
     print()
     print(">> Loading...")
     print()
-    
-    app.run()
-    
+
+    if args.incremental:
+        app.run_incremental()
+    else:
+        app.run()
+
     print(">> Data fetched successfully!")
     print()
-    print(">> Saving to database cache...")
-    
+    print(">> Building staged cache and swapping it in...")
+
     app.save()
-    
+
     print(">> Database cache updated!")
     print()
     print("=" * 60)
@@ -9,6 +9,7 @@ import pandas as pd
 from backend.base_source import BaseSource
 from backend.util import constants
 from backend.util.exceptions import DataLoadError, DataProcessingError
+from backend.util.raw_source_cache import load_raw_source
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ class Schedules(BaseSource):
     def _load_schedules(self) -> pd.DataFrame:
         """Load schedules from nflreadpy"""
         try:
-            df = nfl.load_schedules(seasons=self.seasons).to_pandas()
+            df = load_raw_source("schedules", lambda seasons: nfl.load_schedules(seasons=seasons).to_pandas(), self.seasons)
             reg_games = (df[df['game_type'] == 'REG'][['season', 'week', 'away_team', 'home_team', 'away_score', 'home_score']].replace(constants.TEAM_ABBR_NORMALIZATION))
             self.weeks_by_season = reg_games.groupby('season')['week'].nunique().to_dict()
             return reg_games
@@ -76,3 +77,9 @@ class Schedules(BaseSource):
             except Exception as e:
                 logger.warning("Skipping team '%s' season '%s': %s", team, season, e)
         self.set_cache(schedules_by_year)
+
+    def splice_into(self, persisted: Dict[int, Dict[str, pd.DataFrame]]) -> None:
+        """Replace this run's seasons inside a persisted schedules cache and keep the result as this cache."""
+        refreshed = set(self.seasons)
+        kept = {season: teams for season, teams in persisted.items() if season not in refreshed}
+        self.set_cache(dict(sorted({**kept, **self.cache}.items())))
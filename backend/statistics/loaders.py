@@ -10,6 +10,7 @@ import pandas as pd
 from backend.statistics import stats_config
 from backend.statistics.util import stats_helpers
 from backend.util.exceptions import DataLoadError
+from backend.util.raw_source_cache import load_raw_source
 from backend.util.timing import timed
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ class StatisticsSourceLoader:
     def load_rosters(self) -> pd.DataFrame:
         """Load roster data from nflreadpy."""
         try:
-            source = nfl.load_rosters(seasons=self.seasons).to_pandas()
+            source = load_raw_source("rosters", lambda seasons: nfl.load_rosters(seasons=seasons).to_pandas(), self.seasons)
             return stats_helpers.team_normalization(source)
         except Exception as e:
             logger.error("Failed to load rosters: %s", e)
@@ -35,7 +36,7 @@ class StatisticsSourceLoader:
     def load_player_weekly_stats(self) -> pd.DataFrame:
         """Load and normalize weekly regular-season player stats."""
         try:
-            source = nfl.load_player_stats(summary_level="week", seasons=self.seasons).to_pandas()
+            source = load_raw_source("player_weekly", lambda seasons: nfl.load_player_stats(summary_level="week", seasons=seasons).to_pandas(), self.seasons)
             source = stats_helpers.team_normalization(source)
             source = stats_helpers.filter_regular_and_position(source)
             return stats_helpers.select_columns(source, stats_config.PLAYER_WEEKLY_COLUMN_MAP, stats_config.PLAYER_WEEKLY_REQUIRED_COLUMNS, "player_weekly")
@@ -47,7 +48,7 @@ class StatisticsSourceLoader:
     def load_player_seasonal_stats(self) -> pd.DataFrame:
         """Load and normalize seasonal regular-season player stats."""
         try:
-            source = nfl.load_player_stats(summary_level="reg", seasons=self.seasons).to_pandas()
+            source = load_raw_source("player_seasonal", lambda seasons: nfl.load_player_stats(summary_level="reg", seasons=seasons).to_pandas(), self.seasons)
             source = stats_helpers.team_normalization(source)
             source = stats_helpers.filter_regular_and_position(source)
             return stats_helpers.select_columns(source, stats_config.PLAYER_SEASONAL_COLUMN_MAP, stats_config.PLAYER_SEASONAL_REQUIRED_COLUMNS, "player_seasonal")
@@ -59,7 +60,7 @@ class StatisticsSourceLoader:
     def load_ff_opportunity_weekly(self) -> pd.DataFrame:
         """Load weekly fantasy opportunity stats from nflreadpy."""
         try:
-            source = nfl.load_ff_opportunity(stat_type="weekly", seasons=self.seasons).to_pandas()
+            source = load_raw_source("ff_opp_weekly", lambda seasons: nfl.load_ff_opportunity(stat_type="weekly", seasons=seasons).to_pandas(), self.seasons)
             source = stats_helpers.team_normalization(source)
             source["season"] = pd.to_numeric(source["season"], errors="coerce")
             source["week"] = pd.to_numeric(source["week"], errors="coerce")
@@ -74,7 +75,7 @@ class StatisticsSourceLoader:
     def load_nextgen_passing_stats(self) -> pd.DataFrame:
         """Load Next Gen passing stats from nflreadpy."""
         try:
-            source = nfl.load_nextgen_stats(stat_type="passing", seasons=self.seasons).to_pandas()
+            source = load_raw_source("nextgen_pass_weekly", lambda seasons: nfl.load_nextgen_stats(stat_type="passing", seasons=seasons).to_pandas(), self.seasons)
             source = stats_helpers.team_normalization(source)
             source = stats_helpers.filter_regular_and_position(source)
             return stats_helpers.select_columns(source, stats_config.NEXTGEN_PASS_COLUMN_MAP, stats_config.NEXTGEN_PASS_REQUIRED_COLUMNS, "nextgen_pass_weekly")
@@ -86,7 +87,7 @@ class StatisticsSourceLoader:
     def load_nextgen_receiving_stats(self) -> pd.DataFrame:
         """Load Next Gen receiving stats from nflreadpy."""
         try:
-            source = nfl.load_nextgen_stats(stat_type="receiving", seasons=self.seasons).to_pandas()
+            source = load_raw_source("nextgen_rec_weekly", lambda seasons: nfl.load_nextgen_stats(stat_type="receiving", seasons=seasons).to_pandas(), self.seasons)
             source = stats_helpers.team_normalization(source)
             source = stats_helpers.filter_regular_and_position(source)
             return stats_helpers.select_columns(source, stats_config.NEXTGEN_REC_COLUMN_MAP, stats_config.NEXTGEN_REC_REQUIRED_COLUMNS, "nextgen_rec_weekly")
@@ -98,7 +99,7 @@ class StatisticsSourceLoader:
     def load_nextgen_rushing_stats(self) -> pd.DataFrame:
         """Load Next Gen rushing stats from nflreadpy."""
         try:
-            source = nfl.load_nextgen_stats(stat_type="rushing", seasons=self.seasons).to_pandas()
+            source = load_raw_source("nextgen_rush_weekly", lambda seasons: nfl.load_nextgen_stats(stat_type="rushing", seasons=seasons).to_pandas(), self.seasons)
             source = stats_helpers.team_normalization(source)
             source = stats_helpers.filter_regular_and_position(source)
             return stats_helpers.select_columns(source, stats_config.NEXTGEN_RUSH_COLUMN_MAP, stats_config.NEXTGEN_RUSH_REQUIRED_COLUMNS, "nextgen_rush_weekly")
@@ -110,7 +111,7 @@ class StatisticsSourceLoader:
     def load_pfr_adv_pass_weekly(self) -> pd.DataFrame:
         """Load weekly PFR advanced passing stats from nflreadpy."""
         try:
-            source = nfl.load_pfr_advstats(stat_type="pass", summary_level="week", seasons=stats_helpers.pfr_seasons(self.seasons)).to_pandas()
+            source = load_raw_source("pfr_pass_weekly", lambda seasons: nfl.load_pfr_advstats(stat_type="pass", summary_level="week", seasons=seasons).to_pandas(), stats_helpers.pfr_seasons(self.seasons))
             source = stats_helpers.team_normalization(source)
             return stats_helpers.select_columns(source, stats_config.PFR_PASS_WEEKLY_COLUMN_MAP, stats_config.PFR_PASS_WEEKLY_REQUIRED_COLUMNS, "pfr_pass_weekly")
         except Exception as e:
@@ -121,7 +122,7 @@ class StatisticsSourceLoader:
     def load_pfr_adv_rush_weekly(self) -> pd.DataFrame:
         """Load weekly PFR advanced rushing stats from nflreadpy."""
         try:
-            source = nfl.load_pfr_advstats(stat_type="rush", summary_level="week", seasons=stats_helpers.pfr_seasons(self.seasons)).to_pandas()
+            source = load_raw_source("pfr_rush_weekly", lambda seasons: nfl.load_pfr_advstats(stat_type="rush", summary_level="week", seasons=seasons).to_pandas(), stats_helpers.pfr_seasons(self.seasons))
             source = stats_helpers.team_normalization(source)
             return stats_helpers.select_columns(source, stats_config.PFR_RUSH_WEEKLY_COLUMN_MAP, stats_config.PFR_RUSH_WEEKLY_REQUIRED_COLUMNS, "pfr_rush_weekly")
         except Exception as e:
@@ -132,7 +133,7 @@ class StatisticsSourceLoader:
     def load_pfr_adv_rec_weekly(self) -> pd.DataFrame:
         """Load weekly PFR advanced receiving stats from nflreadpy."""
         try:
-            source = nfl.load_pfr_advstats(stat_type="rec", summary_level="week", seasons=stats_helpers.pfr_seasons(self.seasons)).to_pandas()
+            source = load_raw_source("pfr_rec_weekly", lambda seasons: nfl.load_pfr_advstats(stat_type="rec", summary_level="week", seasons=seasons).to_pandas(), stats_helpers.pfr_seasons(self.seasons))
             source = stats_helpers.team_normalization(source)
             return stats_helpers.select_columns(source, stats_config.PFR_REC_WEEKLY_COLUMN_MAP, stats_config.PFR_REC_WEEKLY_REQUIRED_COLUMNS, "pfr_rec_weekly")
         except Exception as e:
@@ -143,7 +144,7 @@ class StatisticsSourceLoader:
     def load_pfr_adv_pass_season(self) -> pd.DataFrame:
         """Load seasonal PFR advanced passing stats from nflreadpy."""
         try:
-            source = nfl.load_pfr_advstats(stat_type="pass", summary_level="season", seasons=stats_helpers.pfr_seasons(self.seasons)).to_pandas()
+            source = load_raw_source("pfr_pass_season", lambda seasons: nfl.load_pfr_advstats(stat_type="pass", summary_level="season", seasons=seasons).to_pandas(), stats_helpers.pfr_seasons(self.seasons))
             source = stats_helpers.team_normalization(source)
             return stats_helpers.select_columns(source, stats_config.PFR_PASS_SEASON_COLUMN_MAP, stats_config.PFR_PASS_SEASON_REQUIRED_COLUMNS, "pfr_pass_season")
         except Exception as e:
@@ -154,7 +155,7 @@ class StatisticsSourceLoader:
     def load_pfr_adv_rush_season(self) -> pd.DataFrame:
         """Load seasonal PFR advanced rushing stats from nflreadpy."""
         try:
-            source = nfl.load_pfr_advstats(stat_type="rush", summary_level="season", seasons=stats_helpers.pfr_seasons(self.seasons)).to_pandas()
+            source = load_raw_source("pfr_rush_season", lambda seasons: nfl.load_pfr_advstats(stat_type="rush", summary_level="season", seasons=seasons).to_pandas(), stats_helpers.pfr_seasons(self.seasons))
             source = stats_helpers.team_normalization(source)
             return stats_helpers.select_columns(source, stats_config.PFR_RUSH_SEASON_COLUMN_MAP, stats_config.PFR_RUSH_SEASON_REQUIRED_COLUMNS, "pfr_rush_season")
         except Exception as e:
@@ -165,7 +166,7 @@ class StatisticsSourceLoader:
     def load_pfr_adv_rec_season(self) -> pd.DataFrame:
         """Load seasonal PFR advanced receiving stats from nflreadpy."""
         try:
-            source = nfl.load_pfr_advstats(stat_type="rec", summary_level="season", seasons=stats_helpers.pfr_seasons(self.seasons)).to_pandas()
+            source = load_raw_source("pfr_rec_season", lambda seasons: nfl.load_pfr_advstats(stat_type="rec", summary_level="season", seasons=seasons).to_pandas(), stats_helpers.pfr_seasons(self.seasons))
             source = stats_helpers.team_normalization(source)
             return stats_helpers.select_columns(source, stats_config.PFR_REC_SEASON_COLUMN_MAP, stats_config.PFR_REC_SEASON_REQUIRED_COLUMNS, "pfr_rec_season")
         except Exception as e:
@@ -176,7 +177,7 @@ class StatisticsSourceLoader:
     def load_snap_counts(self) -> pd.DataFrame:
         """Load and normalize weekly regular-season snap counts."""
         try:
-            source = nfl.load_snap_counts(seasons=stats_helpers.pfr_seasons(self.seasons)).to_pandas()
+            source = load_raw_source("snap_counts", lambda seasons: nfl.load_snap_counts(seasons=seasons).to_pandas(), stats_helpers.pfr_seasons(self.seasons))
             source = stats_helpers.team_normalization(source)
             source = stats_helpers.filter_regular_and_position(source)
             source = stats_helpers.select_columns(source, stats_config.SNAP_COUNTS_COLUMN_MAP, stats_config.SNAP_COUNTS_REQUIRED_COLUMNS, "snap_counts")
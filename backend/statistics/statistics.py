@@ -1,14 +1,17 @@
 """Player statistics processing and cache generation."""
 
 import logging
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from typing import Dict, List, NamedTuple, Tuple, cast
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Mapping, NamedTuple, Tuple, cast
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from backend import base_source
+from backend.config.settings import STATS_PROCESS_WORKERS
 from backend.statistics.loaders import StatisticsSourceLoader
-from backend.statistics.util import stats_helpers
+from backend.statistics.util import process_pool, stats_helpers
 from backend.util import constants
 from backend.util.exceptions import DataProcessingError
 from backend.util.timing import timed
@@ -29,61 +32,94 @@ class RosterData(NamedTuple):
 class Statistics(base_source.BaseSource):
     """Processes player statistics and builds stat caches."""
 
-    def __init__(self, seasons: List[int]) -> None:
-        """Initialize with seasons"""
+    WEEKLY_JOIN_SPECS: List[Tuple[str, List[str]]] = [
+        ("snap_counts", ["season", "week", "player_display_name", "position", "team"]),
+        ("ff_opp_weekly", ["season", "week", "player_id", "player_display_name", "position", "team"]),
+        ("nextgen_pass_weekly", ["season", "week", "player_display_name", "position", "team"]),
+        ("nextgen_rec_weekly", ["season", "week", "player_display_name", "position", "team"]),
+        ("nextgen_rush_weekly", ["season", "week", "player_display_name", "position", "team"]),
+        ("pfr_pass_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
+        ("pfr_rush_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
+        ("pfr_rec_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
+    ]
+    SEASONAL_JOIN_SPECS: List[Tuple[str, List[str]]] = [
+        ("pfr_pass_season", ["season", "player_display_name", "team"]),
+        ("pfr_rush_season", ["season", "player_display_name", "position"]),
+        ("pfr_rec_season", ["season", "player_display_name", "position"]),
+    ]
+
+    def __init__(self, seasons: List[int], process_workers: int = STATS_PROCESS_WORKERS) -> None:
+        """Initialize with seasons; process_workers > 1 runs the merge and build stages on a process pool"""
         super().__init__(seasons)
         self._source_loader = StatisticsSourceLoader(self.seasons)
+        self.process_workers = process_workers
 
     @timed("Statistics._extract_all_roster_data")
     def _extract_all_roster_data(self, rosters: pd.DataFrame) -> RosterData:
-        """Extract all roster-based data in a single pass through the dataframe."""
+        """Extract all roster-based data with column operations over the whole multi-season table.
+
+        Rows need a non-empty full_name and a supported position. Later rows win for positions, ages, and
+        teams; headshots come from each player's latest season (the first such row on ties). Eligibility,
+        teams, and rookies only look at CURRENT_SEASON rows.
+        """
         current_season = constants.CURRENT_SEASON
         today = pd.Timestamp.now().normalize()
-        player_positions: Dict[str, str] = {}
-        player_ages: Dict[str, int] = {}
-        eligible_players: set[str] = set()
-        headshot_tracker: Dict[str, tuple[int, str]] = {}
-        player_headshots: Dict[str, str] = {}
-        player_teams: Dict[str, str] = {}
-        rookies: Dict[str, bool] = {}
-        for row in rosters.itertuples(index=False):
-            name = getattr(row, "full_name", None)
-            if not isinstance(name, str) or not name:
-                continue
-            season_raw = getattr(row, "season", None)
-            season_int: int | None = None
-            if pd.notna(season_raw):
-                try:
-                    season_int = int(cast(int | float | str, season_raw))
-                except (TypeError, ValueError):
-                    season_int = None
-            position = getattr(row, "position", None)
-            if not isinstance(position, str) or position not in constants.POSITIONS:
-                continue
-            player_positions[name] = position
-            if pd.notna(birth_date := getattr(row, "birth_date", None)):
-                birth_ts = pd.to_datetime(birth_date)
-                age = (today - birth_ts).days // 365
-                if age > 0:
-                    player_ages[name] = int(age)
-            if isinstance(headshot := getattr(row, "headshot_url", None), str) and headshot and season_int is not None:
-                prev = headshot_tracker.get(name)
-                if not prev or season_int > prev[0]:
-                    headshot_tracker[name] = (season_int, headshot)
-            if season_int == current_season:
-                if getattr(row, "status", None) != "RET":
-                    eligible_players.add(name)
-                if isinstance(team := getattr(row, "team", None), str) and team:
-                    player_teams[name] = team
-                if (entry_year := getattr(row, "entry_year", None)) == current_season and pd.notna(entry_year):
-                    rookies[name] = True
-        player_headshots = {name: headshot for name, (_, headshot) in headshot_tracker.items()}
+        rows = pd.DataFrame({"name": self._roster_column(rosters, "full_name"),
+                             "position": self._roster_column(rosters, "position"),
+                             "season": np.trunc(pd.to_numeric(self._roster_column(rosters, "season"), errors="coerce"))})
+        rows = rows.loc[self._nonempty_strings(rows["name"]) & rows["position"].isin(constants.POSITIONS)]
+        index = rows.index
+        by_name = rows.groupby("name", sort=False)
+        player_positions: Dict[str, str] = by_name["position"].last().to_dict()
+
+        birth_dates = pd.to_datetime(self._roster_column(rosters, "birth_date").loc[index], errors="coerce")
+        if isinstance(birth_dates.dtype, pd.DatetimeTZDtype):
+            birth_dates = birth_dates.dt.tz_localize(None)
+        ages = (today - birth_dates).dt.days // 365
+        has_age = ages.gt(0)
+        player_ages: Dict[str, int] = ages.loc[has_age].astype(int).groupby(rows.loc[has_age, "name"], sort=False).last().to_dict()
+
+        headshots = self._roster_column(rosters, "headshot_url").loc[index]
+        has_headshot = self._nonempty_strings(headshots) & rows["season"].notna()
+        latest = rows.loc[has_headshot].reset_index(drop=True).groupby("name", sort=False)["season"].idxmax()
+        player_headshots: Dict[str, str] = dict(zip(latest.index, headshots.loc[has_headshot].to_numpy()[latest.to_numpy()]))
+
+        current = rows["season"].eq(current_season)
+        not_retired = self._roster_column(rosters, "status").loc[index].ne("RET").fillna(True).astype(bool)
+        eligible_players = set(rows.loc[current & not_retired, "name"])
+        teams = self._roster_column(rosters, "team").loc[index]
+        has_team = current & self._nonempty_strings(teams)
+        player_teams: Dict[str, str] = teams.loc[has_team].groupby(rows.loc[has_team, "name"], sort=False).last().to_dict()
+        is_rookie = current & self._roster_column(rosters, "entry_year").loc[index].eq(current_season).fillna(False).astype(bool)
+        rookies: Dict[str, bool] = dict.fromkeys(rows.loc[is_rookie, "name"].drop_duplicates(), True)
+
         logger.info("Positions: %s | Ages: %s | Eligible: %s | Headshots: %s | Player-Teams: %s | Rookies: %s", len(player_positions), len(player_ages), len(eligible_players), len(player_headshots), len(player_teams), sum(1 for v in rookies.values() if v))
         return RosterData(player_positions, player_ages, eligible_players, player_headshots, player_teams, rookies)
 
+    @staticmethod
+    def _roster_column(rosters: pd.DataFrame, column: str) -> pd.Series:
+        """Return a roster column, or all-missing values when the source lacks it."""
+        return rosters[column] if column in rosters.columns else pd.Series(None, index=rosters.index, dtype=object)
+
+    @staticmethod
+    def _nonempty_strings(values: pd.Series) -> pd.Series:
+        """Mask of values that are non-empty strings."""
+        if isinstance(values.dtype, pd.StringDtype):
+            return values.str.len().gt(0).fillna(False).astype(bool)
+        if not pd.api.types.is_object_dtype(values):
+            return pd.Series(False, index=values.index)
+        # Object columns may mix strings with None/NaN or other scalars.
+        return values.map(lambda value: isinstance(value, str) and value != "").astype(bool)
+
     @timed("Statistics._merge_statistics_data")
-    def _merge_statistics_data(self, sources: Dict[str, pd.DataFrame]) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """Merge weekly and seasonal source tables into base dataframes."""
+    def _merge_statistics_data(self, sources: Dict[str, pd.DataFrame], pool: ProcessPoolExecutor | None = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Merge weekly and seasonal source tables into base dataframes, in two worker processes when a pool is given."""
+        if pool is not None:
+            source_keys = {"weekly": ["player_weekly", *(key for key, _ in self.WEEKLY_JOIN_SPECS)],
+                           "seasonal": ["player_seasonal", *(key for key, _ in self.SEASONAL_JOIN_SPECS)]}
+            merged = {kind: pool.submit(_merge_in_worker, kind, self.seasons, {key: process_pool.frame_to_arrow(sources[key]) for key in keys})
+                      for kind, keys in source_keys.items()}
+            return process_pool.frame_from_arrow(merged["weekly"].result()), process_pool.frame_from_arrow(merged["seasonal"].result())
         mergers = {
             "weekly": self._merge_weekly_statistics_data,
             "seasonal": self._merge_seasonal_statistics_data,
@@ -99,39 +135,24 @@ class Statistics(base_source.BaseSource):
     def _merge_weekly_statistics_data(self, sources: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """Merge weekly source tables into base weekly dataframe."""
         weekly_df = sources["player_weekly"]
-        weekly_join_specs: List[Tuple[str, List[str]]] = [
-            ("snap_counts", ["season", "week", "player_display_name", "position", "team"]),
-            ("ff_opp_weekly", ["season", "week", "player_id", "player_display_name", "position", "team"]),
-            ("nextgen_pass_weekly", ["season", "week", "player_display_name", "position", "team"]),
-            ("nextgen_rec_weekly", ["season", "week", "player_display_name", "position", "team"]),
-            ("nextgen_rush_weekly", ["season", "week", "player_display_name", "position", "team"]),
-            ("pfr_pass_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
-            ("pfr_rush_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
-            ("pfr_rec_weekly", ["season", "week", "game_id", "player_display_name", "team"]),
-        ]
-        for source_key, join_keys in weekly_join_specs:
-            source_df = stats_helpers.align_pfr_seasonal_names(sources[source_key], weekly_df)
-            weekly_df = stats_helpers.merge_source(weekly_df, source_df, join_keys)
-        return weekly_df
+        name_index = stats_helpers.NameIndex(weekly_df)
+        return stats_helpers.merge_sources(weekly_df, [(stats_helpers.align_pfr_seasonal_names(sources[source_key], weekly_df, name_index), join_keys)
+                                                       for source_key, join_keys in self.WEEKLY_JOIN_SPECS])
 
     @timed("Statistics._merge_seasonal_statistics_data")
     def _merge_seasonal_statistics_data(self, sources: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """Merge seasonal source tables into base seasonal dataframe."""
         seasonal_df = sources["player_seasonal"]
-        seasonal_join_specs: List[Tuple[str, List[str]]] = [
-            ("pfr_pass_season", ["season", "player_display_name", "team"]),
-            ("pfr_rush_season", ["season", "player_display_name", "position"]),
-            ("pfr_rec_season", ["season", "player_display_name", "position"]),
-        ]
-
-        for source_key, join_keys in seasonal_join_specs:
-            aligned = stats_helpers.align_pfr_seasonal_names(sources[source_key], seasonal_df)
+        name_index = stats_helpers.NameIndex(seasonal_df)
+        aligned_sources: List[Tuple[pd.DataFrame, List[str]]] = []
+        for source_key, join_keys in self.SEASONAL_JOIN_SPECS:
+            aligned = stats_helpers.align_pfr_seasonal_names(sources[source_key], seasonal_df, name_index)
             # Only seasonal PFR rush/rec need this: weekly rows stay team-specific, but seasonal rows can be 2TM/3TM for traded players.
             if "team" in aligned.columns and "team" not in join_keys:
                 aligned = aligned.drop(columns=["team"])
-            seasonal_df = stats_helpers.merge_source(seasonal_df, aligned, join_keys)
+            aligned_sources.append((aligned, join_keys))
 
-        return seasonal_df
+        return stats_helpers.merge_sources(seasonal_df, aligned_sources)
 
     @timed("Statistics._shape_statistics_data")
     def _shape_statistics_data(self, weekly_df: pd.DataFrame, seasonal_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -157,8 +178,16 @@ class Statistics(base_source.BaseSource):
         return names
 
     @timed("Statistics._build_statistics_data")
-    def _build_statistics_data(self, weekly_df: pd.DataFrame, seasonal_df: pd.DataFrame, roster_data: RosterData, stats_player_names: set[str]) -> Tuple[Dict[int, Dict[str, pd.DataFrame]], Dict[str, List[Dict]], List[Dict]]:
-        """Build seasonal stats, weekly stats, and all players in parallel."""
+    def _build_statistics_data(self, weekly_df: pd.DataFrame, seasonal_df: pd.DataFrame, roster_data: RosterData, stats_player_names: set[str],
+                               pool: ProcessPoolExecutor | None = None) -> Tuple[Dict[int, Dict[str, pd.DataFrame]], Dict[str, List[Dict]], List[Dict]]:
+        """Build seasonal stats, weekly stats, and all players in parallel, on worker processes when a pool is given."""
+        if pool is not None:
+            seasonal_future = pool.submit(_build_seasonal_in_worker, self.seasons, process_pool.frame_to_arrow(seasonal_df))
+            weekly_player_stats = self._build_weekly_player_stats(weekly_df, pool)
+            all_players = self._build_all_players(roster_data, stats_player_names)
+            seasonal_player_stats = {season: {position: process_pool.frame_from_arrow(buffer) for position, buffer in by_position.items()}
+                                     for season, by_position in seasonal_future.result().items()}
+            return seasonal_player_stats, weekly_player_stats, all_players
         results: Dict[str, object] = {}
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures: Dict[Future[object], str] = {
@@ -197,14 +226,37 @@ class Statistics(base_source.BaseSource):
         }
 
     @timed("Statistics._build_weekly_player_stats")
-    def _build_weekly_player_stats(self, weekly_df: pd.DataFrame) -> Dict[str, List[Dict]]:
-        """Build player -> weekly record list view for player modal."""
+    def _build_weekly_player_stats(self, weekly_df: pd.DataFrame, pool: ProcessPoolExecutor | None = None) -> Dict[str, List[Dict]]:
+        """Build player -> weekly record list view for player modal, partitioned by player across a pool when given."""
+        if pool is None:
+            return self._weekly_records(weekly_df)
+        parts = process_pool.partition_rows(weekly_df, "player_display_name", self.process_workers)
+        futures = [pool.submit(_build_weekly_in_worker, process_pool.frame_to_arrow(part)) for part in parts]
+        by_player: Dict[str, List[Dict]] = {}
+        for future in futures:
+            by_player.update(future.result())
+        # Keep the single-process key order: first appearance by season, week, then name.
+        order_keys = ["season", "week", "player_display_name"]
+        return {name: by_player[name] for name in weekly_df[order_keys].sort_values(order_keys)["player_display_name"].dropna().unique()}
+
+    @staticmethod
+    def _weekly_records(weekly_df: pd.DataFrame) -> Dict[str, List[Dict]]:
+        """Group cleaned weekly rows, ordered by season and week, into per-player record lists.
+
+        Records are built once for the whole frame column by column, then split by player, instead of a
+        to_dict("records") call (one column extraction per player and column) per player.
+        """
         ordered = weekly_df.sort_values(["season", "week", "player_display_name"])
         ordered = stats_helpers.clean_weekly_records(ordered)
-        return {
-            player_name: group.drop(columns=["player_display_name"], errors="ignore").to_dict("records")
-            for player_name, group in ordered.groupby("player_display_name", sort=False)
-        }
+        payload = ordered.drop(columns=["player_display_name"], errors="ignore")
+        columns = list(payload.columns)
+        records = [dict(zip(columns, row)) for row in zip(*(payload.iloc[:, pos].tolist() for pos in range(len(columns))))]
+        # Players in first-appearance order (as groupby(sort=False)); rows without a name (-1) are dropped.
+        codes, player_names = pd.factorize(ordered["player_display_name"])
+        positions = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[positions], np.arange(len(player_names) + 1))
+        return {player_name: [records[pos] for pos in positions[start:end]]
+                for player_name, start, end in zip(player_names, bounds[:-1], bounds[1:])}
 
     @timed("Statistics._build_all_players")
     def _build_all_players(self, roster_data: RosterData, valid_player_names: set[str] | None = None) -> List[Dict]:
@@ -221,9 +273,44 @@ class Statistics(base_source.BaseSource):
             } for player_name in roster_data.positions if valid_player_names is None or player_name in valid_player_names
         ]
 
+    @timed("Statistics.splice_into")
+    def splice_into(self, persisted: Mapping[str, Any]) -> None:
+        """Replace this run's seasons inside a persisted full Statistics cache and keep the result as this cache.
+
+        by_year and weekly logs keep every other season as persisted. all_players takes refreshed entries for
+        players on this run's rosters; persisted players missing from them are no longer on a current roster,
+        so they lose their team, rookie, and eligibility flags as a full rebuild would.
+        """
+        refreshed = set(self.seasons)
+        persisted_by_year = persisted.get(constants.STATS["BY_YEAR"], {})
+        by_year = {season: persisted_by_year[season] for season in persisted_by_year if season not in refreshed}
+        by_year.update(self.cache[constants.STATS["BY_YEAR"]])
+
+        new_weekly = self.cache[constants.STATS["PLAYER_WEEKLY_STATS"]]
+        persisted_weekly = persisted.get(constants.STATS["PLAYER_WEEKLY_STATS"], {})
+        weekly: Dict[str, List[Dict]] = {}
+        for player_name in persisted_weekly:
+            kept = [record for record in persisted_weekly[player_name] if record.get("season") not in refreshed]
+            if records := kept + new_weekly.get(player_name, []):
+                weekly[player_name] = records
+        weekly.update((player_name, records) for player_name, records in new_weekly.items() if player_name not in weekly)
+
+        new_players = {player["name"]: player for player in self.cache[constants.STATS["ALL_PLAYERS"]]}
+        all_players = [new_players.pop(player["name"], None) or {**player, "team": None, "is_rookie": False, "is_eligible": False}
+                       for player in persisted.get(constants.STATS["ALL_PLAYERS"], [])]
+        all_players.extend(new_players.values())
+
+        self.set_cache({constants.STATS["ALL_PLAYERS"]: all_players,
+                        constants.STATS["BY_YEAR"]: dict(sorted(by_year.items())),
+                        constants.STATS["PLAYER_WEEKLY_STATS"]: weekly})
+
     @timed("Statistics.run")
-    def run(self) -> None:
-        """Load data, process statistics, and store cache data."""
+    def run(self, known_players: set[str] | None = None) -> None:
+        """Load data, process statistics, and store cache data.
+
+        known_players extends the players kept in all_players beyond those with stats in these seasons, so an
+        incremental run still refreshes roster metadata for players whose stats are all in older seasons.
+        """
         loaders = {
             "rosters": self._source_loader.load_rosters,
             "sources": self._source_loader.load_statistics_sources,
@@ -243,20 +330,40 @@ class Statistics(base_source.BaseSource):
             logger.exception("Failed to extract roster data")
             raise DataProcessingError(f"Failed to extract roster data: {e}", source="Statistics") from e
 
-        try:
-            weekly_df, seasonal_df = self._merge_statistics_data(sources)
-            weekly_df, seasonal_df = self._shape_statistics_data(weekly_df, seasonal_df)
-        except Exception as e:
-            logger.exception("Failed to merge/shape statistics data")
-            raise DataProcessingError(f"Failed to merge/shape statistics data: {e}", source="Statistics") from e
+        with process_pool.stats_process_pool(self.process_workers) as pool:
+            try:
+                weekly_df, seasonal_df = self._merge_statistics_data(sources, pool)
+                weekly_df, seasonal_df = self._shape_statistics_data(weekly_df, seasonal_df)
+            except Exception as e:
+                logger.exception("Failed to merge/shape statistics data")
+                raise DataProcessingError(f"Failed to merge/shape statistics data: {e}", source="Statistics") from e
 
-        try:
-            stats_player_names = self._collect_stats_player_names(seasonal_df, weekly_df)
-            seasonal_player_stats, weekly_player_stats, all_players = self._build_statistics_data(weekly_df, seasonal_df, roster_data, stats_player_names)
-        except Exception as e:
-            logger.exception("Failed to build statistics payloads")
-            raise DataProcessingError(f"Failed to build statistics payloads: {e}", source="Statistics") from e
+            try:
+                stats_player_names = self._collect_stats_player_names(seasonal_df, weekly_df) | (known_players or set())
+                seasonal_player_stats, weekly_player_stats, all_players = self._build_statistics_data(weekly_df, seasonal_df, roster_data, stats_player_names, pool)
+            except Exception as e:
+                logger.exception("Failed to build statistics payloads")
+                raise DataProcessingError(f"Failed to build statistics payloads: {e}", source="Statistics") from e
 
         self.set_cache({constants.STATS["ALL_PLAYERS"]: all_players,
                         constants.STATS["BY_YEAR"]: seasonal_player_stats,
                         constants.STATS["PLAYER_WEEKLY_STATS"]: weekly_player_stats})
+
+
+def _merge_in_worker(kind: str, seasons: List[int], payload: Dict[str, pa.Buffer]) -> pa.Buffer:
+    """Process-pool task: run the weekly or seasonal merge on Arrow-shipped sources."""
+    statistics = Statistics(seasons, process_workers=0)
+    sources = {key: process_pool.frame_from_arrow(buffer) for key, buffer in payload.items()}
+    merge = statistics._merge_weekly_statistics_data if kind == "weekly" else statistics._merge_seasonal_statistics_data
+    return process_pool.frame_to_arrow(merge(sources))
+
+
+def _build_seasonal_in_worker(seasons: List[int], payload: pa.Buffer) -> Dict[int, Dict[str, pa.Buffer]]:
+    """Process-pool task: build the season -> position frames and ship each back as Arrow."""
+    by_year = Statistics(seasons, process_workers=0)._build_seasonal_player_stats(process_pool.frame_from_arrow(payload))
+    return {season: {position: process_pool.frame_to_arrow(frame) for position, frame in by_position.items()} for season, by_position in by_year.items()}
+
+
+def _build_weekly_in_worker(payload: pa.Buffer) -> Dict[str, List[Dict]]:
+    """Process-pool task: build weekly record lists for one player partition."""
+    return Statistics._weekly_records(process_pool.frame_from_arrow(payload))
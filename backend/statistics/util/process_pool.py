@@ -0,0 +1,44 @@
+"""Process-pool helpers for CPU-bound Statistics stages; frames cross process boundaries as Arrow IPC buffers."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+
+def frame_to_arrow(df: pd.DataFrame) -> pa.Buffer:
+    """Serialize a frame, with its index and pandas dtypes, to one Arrow IPC stream buffer."""
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def frame_from_arrow(buffer: pa.Buffer) -> pd.DataFrame:
+    """Rebuild a frame written by frame_to_arrow."""
+    return ipc.open_stream(buffer).read_all().to_pandas()
+
+
+def partition_rows(df: pd.DataFrame, column: str, parts: int) -> List[pd.DataFrame]:
+    """Split df into at most parts frames so that all rows sharing a column value land in the same frame, keeping row order."""
+    codes, _ = pd.factorize(df[column])
+    buckets = codes % max(parts, 1)
+    return [df.loc[buckets == bucket] for bucket in range(max(parts, 1)) if (buckets == bucket).any()]
+
+
+@contextmanager
+def stats_process_pool(workers: int) -> Iterator[ProcessPoolExecutor | None]:
+    """Yield a spawn-based process pool with workers processes, or None when workers <= 1 (stages then use threads).
+
+    Spawn avoids forking a parent that may already run API or loader threads.
+    """
+    if workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        yield pool
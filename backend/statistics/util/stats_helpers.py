@@ -2,8 +2,9 @@
 
 import logging
 import re
-from typing import Dict, List, Mapping
+from typing import Dict, List, Mapping, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backend.statistics import stats_config
@@ -49,58 +50,141 @@ def select_columns(source: pd.DataFrame, column_map: Mapping[str, str], required
             logger.warning("%s missing optional columns: %s", source_name, ", ".join(sorted(missing_optional)))
     return source[present].rename(columns=column_map)
 
-def merge_source(base: pd.DataFrame, source: pd.DataFrame, join_candidates: List[str]) -> pd.DataFrame:
-    """Left-join source onto base using available join keys."""
-    join_keys = [key for key in join_candidates if key in base.columns and key in source.columns]
-    if not join_keys:
-        return base
-    return base.merge(source.drop_duplicates(subset=join_keys), on=join_keys, how="left")
-
-def align_pfr_seasonal_names(pfr_df: pd.DataFrame, base_df: pd.DataFrame) -> pd.DataFrame:
-    """Map PFR seasonal short names to base full names for merge compatibility."""
+def merge_sources(base: pd.DataFrame, sources: List[Tuple[pd.DataFrame, List[str]]]) -> pd.DataFrame:
+    """Left-join each source onto base in order using its available join keys, in one pass.
+
+    Gives the result of chained base.merge(source.drop_duplicates(keys), how="left") calls, including
+    _x/_y suffixes and keys brought in by an earlier source, without copying the widening frame per source:
+    key columns are factorized once, each source becomes one row indexer, and one concat builds the result.
+    """
+    frames = [base.reset_index(drop=True), *(source for source, _ in sources)]
+    layout, indexers = _plan_merges(frames, [join_candidates for _, join_candidates in sources])
+    parts: List[pd.DataFrame] = []
+    for position, frame in enumerate(frames):
+        entries = [(name, column) for name, frame_position, column in layout if frame_position == position]
+        if not entries:
+            continue
+        part = frame[[column for _, column in entries]]
+        if position:
+            part = part.reset_index(drop=True).reindex(indexers[position]).reset_index(drop=True)
+        parts.append(part.set_axis([name for name, _ in entries], axis=1))
+    return pd.concat(parts, axis=1) if len(parts) > 1 else parts[0].copy()
+
+def _plan_merges(frames: List[pd.DataFrame], join_candidates: List[List[str]]) -> Tuple[List[Tuple[str, int, str]], List[np.ndarray]]:
+    """Resolve the output columns as (name, frame position, frame column) and one base-row indexer per frame (-1 = unmatched).
+
+    Frame 0 is the base; its indexer is the identity.
+    """
+    key_codes = _factorize_keys(frames, {key for candidates in join_candidates for key in candidates})
+    layout: List[Tuple[str, int, str]] = [(column, 0, column) for column in frames[0].columns]
+    base_rows = len(frames[0])
+    indexers: List[np.ndarray] = [np.arange(base_rows)]
+    for position, candidates in enumerate(join_candidates, start=1):
+        source = frames[position]
+        origins = {name: (frame, column) for name, frame, column in layout}
+        join_keys = [key for key in candidates if key in origins and key in source.columns]
+        if not join_keys:
+            indexers.append(np.full(base_rows, -1))
+            continue
+        # A key's codes for the current rows are its origin frame's codes taken through that frame's indexer.
+        base_codes = [np.append(key_codes[origins[key]], -1)[indexers[origins[key][0]]] for key in join_keys]
+        combined = _combine_codes([np.concatenate([codes, key_codes[(position, key)]]) for codes, key in zip(base_codes, join_keys)])
+        base_keys, source_keys = combined[:base_rows], combined[base_rows:]
+        first_rows = np.flatnonzero(~pd.Series(source_keys).duplicated().to_numpy())
+        hits = pd.Index(source_keys[first_rows]).get_indexer(base_keys)
+        indexers.append(np.append(first_rows, -1)[hits])
+
+        added = [column for column in source.columns if column not in join_keys]
+        overlap = set(origins) & set(added)
+        layout = [(f"{name}_x" if name in overlap else name, frame, column) for name, frame, column in layout]
+        layout += [(f"{column}_y" if column in overlap else column, position, column) for column in added]
+        names = pd.Index([name for name, _, _ in layout])
+        if overlap and names.has_duplicates:
+            raise pd.errors.MergeError(f"Passing 'suffixes' which cause duplicate columns {set(names[names.duplicated()])} is not allowed.")
+    return layout, indexers
+
+def _factorize_keys(frames: List[pd.DataFrame], keys: set[str]) -> Dict[Tuple[int, str], np.ndarray]:
+    """Factorize each key column across every frame carrying it, so equal values share a code (missing values are -1)."""
+    key_codes: Dict[Tuple[int, str], np.ndarray] = {}
+    for key in keys:
+        carriers = [position for position, frame in enumerate(frames) if key in frame.columns]
+        nonempty = [position for position in carriers if len(frames[position])]
+        key_codes.update({(position, key): np.empty(0, dtype=np.intp) for position in carriers})
+        if not nonempty:
+            continue
+        codes, _ = pd.factorize(pd.concat([frames[position][key] for position in nonempty], ignore_index=True))
+        bounds = np.cumsum([len(frames[position]) for position in nonempty])[:-1]
+        key_codes.update(zip(((position, key) for position in nonempty), np.split(codes, bounds)))
+    return key_codes
+
+def _combine_codes(codes: List[np.ndarray]) -> np.ndarray:
+    """Fold per-key codes into one int64 code per row, re-densifying before the mixed-radix product could overflow."""
+    combined = np.zeros(len(codes[0]), dtype=np.int64)
+    cardinality = 1
+    for key_codes in codes:
+        width = int(key_codes.max(initial=-1)) + 2
+        if cardinality * width >= 2**62:
+            combined, uniques = pd.factorize(combined)
+            cardinality = max(len(uniques), 1)
+        combined = combined * width + (key_codes + 1)
+        cardinality *= width
+    return combined
+
+class NameIndex:
+    """Normalized-name lookup over one base frame's player names, built once and shared by every source aligned to it."""
+
+    def __init__(self, base_df: pd.DataFrame, col: str = "player_display_name") -> None:
+        self._full_names = _build_unique_normalized_name_lookup(base_df[col]) if col in base_df.columns else {}
+        # Raw source name -> base full name (None when unmatched), so each distinct name is normalized once per run.
+        self._resolved: Dict[str, str | None] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._full_names)
+
+    def resolve(self, names: pd.Series) -> Dict[str, str]:
+        """Map each distinct raw name that differs from its base full name to that full name."""
+        unique = pd.Series(names.dropna().unique(), dtype=object)
+        unique = unique[unique.map(lambda name: isinstance(name, str))]
+        unseen = unique[~unique.isin(self._resolved.keys())]
+        if len(unseen):
+            matches = _normalize_names(unseen).map(self._full_names)
+            self._resolved.update(zip(unseen, matches.astype(object).where(matches.notna(), None)))
+        return {name: match for name in unique if (match := self._resolved[name]) is not None and match != name}
+
+def align_pfr_seasonal_names(pfr_df: pd.DataFrame, base_df: pd.DataFrame, name_index: NameIndex | None = None) -> pd.DataFrame:
+    """Map PFR seasonal short names to base full names for merge compatibility.
+
+    Pass a NameIndex built once over base_df when aligning several sources to the same base. Returns a shallow
+    copy: only the remapped name column is new, so aligning many sources at once stays cheap.
+    """
     col = "player_display_name"
     if col not in pfr_df.columns or col not in base_df.columns:
-        return pfr_df.copy()
-    
-    full_names = _build_unique_normalized_name_lookup(base_df[col])
-    if not full_names:
-        return pfr_df.copy()
+        return pfr_df.copy(deep=False)
 
-    name_map: Dict[str, str] = {}
-    for name in pfr_df[col].dropna().unique():
-        if not isinstance(name, str):
-            continue
-        match = full_names.get(_normalize_name(name))
-        if match:
-            name_map[name] = match
+    name_index = name_index if name_index is not None else NameIndex(base_df, col)
+    if not name_index:
+        return pfr_df.copy(deep=False)
 
+    name_map = name_index.resolve(pfr_df[col])
     if not name_map:
-        return pfr_df.copy()
+        return pfr_df.copy(deep=False)
 
-    aligned = pfr_df.copy()
+    aligned = pfr_df.copy(deep=False)
     aligned[col] = aligned[col].map(name_map).fillna(pfr_df[col])
     return aligned
 
 def _build_unique_normalized_name_lookup(base_names: pd.Series) -> Dict[str, str]:
     """Build normalized name lookup and remove ambiguous matches."""
-    full_names: Dict[str, str] = {}
-    ambiguous: set[str] = set()
-    for name in base_names.dropna().unique():
-        if not isinstance(name, str):
-            continue
-        normalized = _normalize_name(name)
-        if normalized in full_names and full_names[normalized] != name:
-            ambiguous.add(normalized)
-            continue
-        full_names[normalized] = name
-    for normalized in ambiguous:
-        full_names.pop(normalized, None)
-    return full_names
+    names = pd.Series(base_names.dropna().unique(), dtype=object)
+    names = names[names.map(lambda name: isinstance(name, str))]
+    normalized = _normalize_names(names)
+    unique = ~normalized.duplicated(keep=False)
+    return dict(zip(normalized[unique], names[unique]))
 
-def _normalize_name(name: str, suffix_re: re.Pattern[str] = re.compile(r"\s+(?:Jr\.?|Sr\.?|II|III|IV|V)$")) -> str:
-    """Reduce a player name to a normalized form for fuzzy matching."""
-    n = suffix_re.sub("", name.strip())
-    return n.replace("'", "").replace(".", "").lower()
+def _normalize_names(names: pd.Series, suffix_re: re.Pattern[str] = re.compile(r"\s+(?:Jr\.?|Sr\.?|II|III|IV|V)$")) -> pd.Series:
+    """Reduce player names to a normalized form for fuzzy matching."""
+    stripped = names.str.strip().str.replace(suffix_re, "", regex=True)
+    return stripped.str.replace("'", "", regex=False).str.replace(".", "", regex=False).str.lower()
 
 def add_derived_stats(df: pd.DataFrame) -> pd.DataFrame:
     """Add derived stats (Yds/Rec, Yds/Rush) from available base columns."""
@@ -118,13 +202,40 @@ def _safe_rate(df: pd.DataFrame, numerator: str, denominator: str) -> pd.Series:
     return (df[numerator].div(df[denominator]).replace([float("inf"), -float("inf")], 0).fillna(0).round(1))
 
 def combine_aliases(df: pd.DataFrame) -> pd.DataFrame:
-    """Fill each unified stat column with the first non-null value from prioritized source columns."""
-    interpreted = df.copy()
+    """Fill each unified stat column with the first non-null value from prioritized source columns.
+
+    All unified columns are computed first and written onto df together.
+    """
+    combined: Dict[str, pd.Series] = {}
     for out_col, sources in stats_config.INTERPRETED_METRIC_SOURCES.items():
-        cols = [col for col in sources if col in interpreted.columns]
+        cols = [col for col in sources if col in df.columns]
         if cols:
-            interpreted[out_col] = interpreted[cols].bfill(axis=1).iloc[:, 0]
-    return interpreted
+            combined[out_col] = _coalesce(df, cols)
+    return _with_columns(df, combined)
+
+def _with_columns(df: pd.DataFrame, columns: Mapping[str, pd.Series]) -> pd.DataFrame:
+    """Return df with the given columns set: new ones appended with one concat, existing ones replaced in place."""
+    added = {col: values for col, values in columns.items() if col not in df.columns}
+    result = pd.concat([df, pd.DataFrame(added, index=df.index)], axis=1) if added else df.copy(deep=False)
+    replaced = [col for col in columns if col in df.columns]
+    if replaced:
+        result[replaced] = pd.DataFrame({col: columns[col] for col in replaced}, index=df.index)
+    return result
+
+def _coalesce(df: pd.DataFrame, cols: List[str]) -> pd.Series:
+    """Return the first non-null value across cols per row, as df[cols].bfill(axis=1).iloc[:, 0] would."""
+    if len(cols) == 1:
+        return df[cols[0]]
+    dtypes = [df[col].dtype for col in cols]
+    if not all(isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in dtypes):
+        # Nullable, string, or object columns keep pandas' mixed-dtype backfill semantics.
+        return df[cols].bfill(axis=1).iloc[:, 0]
+    values = np.column_stack([df[col].to_numpy() for col in cols])
+    if values.dtype.kind != "f":
+        return pd.Series(values[:, 0], index=df.index)
+    # argmin finds the first non-null column per row; all-null rows pick column 0, which is null.
+    first = np.isnan(values).argmin(axis=1)
+    return pd.Series(values[np.arange(len(values)), first], index=df.index)
 
 def merge_weekly_aggregates_into_seasonal(seasonal_df: pd.DataFrame, weekly_df: pd.DataFrame) -> pd.DataFrame:
     """Merge weekly-derived season aggregates into seasonal rows, filling only missing values."""
@@ -176,19 +287,22 @@ def _merge_aggregates_and_fill_missing(seasonal_df: pd.DataFrame, aggregates_df:
     return merged.drop(columns=list(weekly_cols.values()))
 
 def add_group_ranks(df: pd.DataFrame, group_cols: List[str]) -> pd.DataFrame:
-    """Add positional rank columns for metrics within contextual groups (1 = best)."""
-    ranked = df.copy()
-
-    groups = [ranked[col] for col in group_cols if col in ranked.columns]
-    if not groups:
-        return ranked
-
-    for metric in stats_config.INTERPRETED_RANK_METRICS:
-        if metric not in ranked.columns:
-            continue
-        numeric = pd.to_numeric(ranked[metric], errors="coerce")
-        ranked[f"{metric}_rank"] = numeric.groupby(groups).rank(ascending=False, method="min").astype("Int64")
-    return ranked
+    """Add positional rank columns for metrics within contextual groups (1 = best).
+
+    Group codes are computed once and all metrics are ranked as one block; ranks are stored as nullable Int16.
+    """
+    groups = [df[col] for col in group_cols if col in df.columns]
+    metrics = [metric for metric in stats_config.INTERPRETED_RANK_METRICS if metric in df.columns]
+    if not groups or not metrics:
+        return df.copy(deep=False)
+
+    # Rows with a missing group key get no group code and therefore no ranks, as groupby(groups) drops them.
+    group_codes = df[metrics[0]].groupby(groups, sort=False).ngroup()
+    numeric = pd.DataFrame({metric: pd.to_numeric(df[metric], errors="coerce") for metric in metrics}, index=df.index)
+    ranks = numeric.groupby(group_codes, sort=False).rank(ascending=False, method="min")
+    # A rank never exceeds its group's size; only groups beyond the int16 range need wider storage.
+    rank_dtype = "Int32" if ranks.max().max() > np.iinfo(np.int16).max else "Int16"
+    return _with_columns(df, {f"{metric}_rank": ranks[metric].astype(rank_dtype) for metric in metrics})
 
 def clean_numeric_stats(df: pd.DataFrame) -> pd.DataFrame:
     """Replace non-finite numeric values with 0 for JSON-safe chart payloads."""
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -231,6 +232,15 @@ def app_caches(stats_cache: dict[str, Any], schedules_cache: dict[int, dict[str,
     }
 
 
+@pytest.fixture(autouse=True)
+def default_cache_in_tmp_path(tmp_path, monkeypatch) -> None:
+    """Point the default cache backends at tmp_path so App() and SQLService() never write into the repo."""
+    from backend.database.service import sqlite_service
+
+    monkeypatch.setattr(sqlite_service, "SQLiteCacheManager", partial(sqlite_service.SQLiteCacheManager, db_path=str(tmp_path / "default_cache.db")))
+    monkeypatch.setattr(sqlite_service, "ArrowCacheManager", partial(sqlite_service.ArrowCacheManager, cache_dir=str(tmp_path / "default_cache")))
+
+
 def _noop() -> None:
     return None
 
@@ -240,13 +250,13 @@ def client_factory(monkeypatch):
     import backend.api.api as api_module
 
     @contextmanager
-    def _factory(caches: dict[str, Any]):
+    def _factory(caches: dict[str, Any], db: Any = None):
         monkeypatch.setattr(
             api_module,
             "App",
             lambda: SimpleNamespace(
                 caches=caches,
-                db=SimpleNamespace(close=_noop),
+                db=db if db is not None else SimpleNamespace(close=_noop),
                 initialize=_noop,
             ),
         )
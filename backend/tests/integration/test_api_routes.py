@@ -2,7 +2,19 @@ from copy import deepcopy
 
 import pandas as pd
 import pytest
-
+from fastapi.testclient import TestClient
+
+import backend.api.api as api_module
+import backend.app as app_module
+from backend.api.util.player_response_helpers import accepts_gzip, render_player_responses
+from backend.app import App
+from backend.database.DAO.sqlite_dao import SQLiteCacheManager
+from backend.database.service.lazy_cache import (
+    LazyLRUMapping,
+    LazyRecordListMapping,
+    LazySeasonMapping,
+)
+from backend.database.service.sqlite_service import SQLService
 from backend.util import constants
 
 
@@ -257,3 +269,198 @@ def test_app_info_uses_max_stat_columns_across_all_positions(client_factory, app
     assert response.status_code == 200
     payload = response.json()
     assert payload["stat_columns"] == 5
+
+
+def test_routes_work_with_lazily_loaded_seasons_and_weekly_logs(client_factory, app_caches) -> None:
+    by_year = app_caches[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]]
+    weekly = app_caches[constants.CACHE["STATISTICS"]][constants.STATS["PLAYER_WEEKLY_STATS"]]
+    lazy_weekly = LazyRecordListMapping({name: len(weeks) for name, weeks in weekly.items()}, weekly.__getitem__, max_entries=1)
+    lazy_caches = deepcopy(app_caches)
+    lazy_caches[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]] = LazyLRUMapping(list(by_year), by_year.__getitem__, max_entries=1)
+    lazy_caches[constants.CACHE["STATISTICS"]][constants.STATS["PLAYER_WEEKLY_STATS"]] = lazy_weekly
+
+    with client_factory(lazy_caches) as client:
+        player = client.get("/api/player/Patrick%20Mahomes")
+        trend = client.get("/api/player-trend", params={"player_name": "Patrick Mahomes", "position": "QB", "stat": "Pass Yds"})
+        consistency = client.get("/api/consistency-data", params={"position": "QB", "season": 2025, "top_n": 5})
+        info = client.get("/api/app-info")
+
+    assert player.status_code == 200
+    assert player.json()["position"] == "QB"
+    assert player.json()["weekly_stats"] == weekly["Patrick Mahomes"]
+    assert consistency.status_code == 200
+    assert info.json()["total_game_logs"] == sum(len(weeks) for weeks in weekly.values())
+    assert trend.json()["points"] == [{"season": 2024, "value": 4065.0}, {"season": 2025, "value": 4280.0}]
+    assert info.json()["current_season_players"] == 2
+
+
+def test_player_routes_read_only_the_seasons_they_need(client_factory, app_caches) -> None:
+    by_year = app_caches[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]]
+    loads: list[int] = []
+
+    def load_season(season: int) -> dict:
+        loads.append(season)
+        return by_year[season]
+
+    season_columns = {season: {position: list(df.columns) for position, df in positions.items()} for season, positions in by_year.items()}
+    player_index = {"Patrick Mahomes": [2024, 2025], "JaMarr Chase": [2025]}
+    lazy_caches = deepcopy(app_caches)
+    lazy_caches[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]] = LazySeasonMapping(
+        list(by_year), load_season, lambda: player_index, max_entries=1, season_columns=season_columns)
+
+    with client_factory(lazy_caches) as client:
+        info = client.get("/api/app-info")
+        player = client.get("/api/player/JaMarr%20Chase")
+        trend = client.get("/api/player-trend", params={"player_name": "JaMarr Chase", "position": "WR", "stat": "Rec Yds"})
+        invalid = client.get("/api/player-trend", params={"player_name": "JaMarr Chase", "position": "WR", "stat": "Pass Yds"})
+
+    # app-info reads only the current season; the 2024 season is never loaded.
+    assert loads == [2025]
+    assert info.json()["stat_columns"] == max(len(columns) for positions in season_columns.values() for columns in positions.values())
+    assert player.json()["available_seasons"] == [2025]
+    assert trend.json()["points"] == [{"season": 2024, "value": None}, {"season": 2025, "value": 1462.0}]
+    assert invalid.status_code == 400
+
+
+def test_search_endpoint_queries_the_cache_name_index(tmp_path, monkeypatch, client_factory, app_caches) -> None:
+    import backend.api.routes.statistics_routes as statistics_routes
+
+    service = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    service.save_to_db(app_caches[constants.CACHE["STATISTICS"]], constants.CACHE["STATISTICS"])
+    service.use_read_only()
+    monkeypatch.setattr(statistics_routes, "filter_search_results", lambda *args: pytest.fail("search scanned all_players"))
+
+    with client_factory(app_caches, db=service) as client:
+        by_name = client.get("/api/search", params={"q": "maho"})
+        by_position = client.get("/api/search", params={"q": "ma", "position": "QB"})
+
+    service.close()
+    assert by_name.status_code == 200
+    assert by_name.json()["count"] == 1
+    assert by_name.json()["results"][0]["name"] == "Patrick Mahomes"
+    assert "redraft_rating" not in by_name.json()["results"][0]
+    assert [result["name"] for result in by_position.json()["results"]] == ["Patrick Mahomes"]
+
+
+def test_player_endpoint_streams_pre_rendered_responses(tmp_path, client_factory, app_caches) -> None:
+    service = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    service.save_player_responses(render_player_responses(app_caches))
+    service.use_read_only()
+
+    with client_factory(app_caches) as client:
+        live = [client.get("/api/player/Patrick%20Mahomes", params=params).json() for params in ({}, {"season": 2024})]
+    with client_factory(app_caches, db=service) as client:
+        stored = [client.get("/api/player/Patrick%20Mahomes", params=params) for params in ({}, {"season": 2024})]
+        plain = client.get("/api/player/Patrick%20Mahomes", headers={"Accept-Encoding": "identity"})
+        opted_out = client.get("/api/player/Patrick%20Mahomes", headers={"Accept-Encoding": "gzip;q=0, deflate"})
+        missing = client.get("/api/player/Patrick%20Mahomes", params={"season": 2019})
+    service.close()
+
+    assert [response.json() for response in stored] == live
+    assert stored[0].headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == live[0]
+    assert "content-encoding" not in opted_out.headers
+    assert opted_out.json() == live[0]
+    assert missing.status_code == 404
+
+
+@pytest.mark.parametrize(("accept_encoding", "expected"), [
+    ("gzip", True),
+    ("deflate, GZIP;q=0.5", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, *;q=1", False),
+    ("*;q=0", False),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip_honours_q_values(accept_encoding: str, expected: bool) -> None:
+    assert accepts_gzip(accept_encoding) is expected
+
+
+def test_player_responses_stay_on_the_served_generation_after_a_refresh(tmp_path, monkeypatch, app_caches) -> None:
+    monkeypatch.setattr(app_module, "CACHE_SNAPSHOT", False)
+    monkeypatch.setattr(app_module, "DB_READ_ONLY", True)
+    db_path = str(tmp_path / "cache.db")
+    writer = App()
+    writer.db.close()
+    writer.db = SQLService(SQLiteCacheManager(db_path))
+    writer.caches = deepcopy(app_caches)
+    writer.save()
+
+    app = App()
+    app.db.close()
+    app.db = SQLService(SQLiteCacheManager(db_path))
+    app.initialize()
+    monkeypatch.setattr(api_module, "App", lambda: app)
+
+    # Another process promotes a new generation while the API keeps serving the one it started on.
+    writer.caches[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]][2025]["QB"].loc["Patrick Mahomes", "Pass TD"] = 40
+    writer.save()
+    writer.db.close()
+
+    with TestClient(api_module.api) as client:
+        player = client.get("/api/player/Patrick%20Mahomes")
+
+    # Served from the stored blob of the pinned generation, not rebuilt from memory.
+    assert player.headers["content-encoding"] == "gzip"
+    assert player.headers["x-data-version"] == "1"
+    assert player.json()["stats"]["Pass TD"] == 32
+
+
+def test_responses_carry_the_data_version_and_accept_a_pinned_version(tmp_path, monkeypatch, app_caches) -> None:
+    monkeypatch.setattr(app_module, "CACHE_PLAYER_RESPONSES", False)
+    monkeypatch.setattr(app_module, "CACHE_SNAPSHOT", False)
+    app = App()
+    app.db.close()
+    app.db = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    app.caches = deepcopy(app_caches)
+    app.save()
+    stats = app.caches[constants.CACHE["STATISTICS"]]
+    stats[constants.STATS["ALL_PLAYERS"]] = stats[constants.STATS["ALL_PLAYERS"]][:-1]
+    app.save()
+    app.initialize = lambda: None
+    monkeypatch.setattr(api_module, "App", lambda: app)
+
+    with TestClient(api_module.api) as client:
+        live = client.get("/api/app-info")
+        pinned = client.get("/api/app-info", params={"version": 1})
+        current = client.get("/api/app-info", params={"version": 2})
+        unknown = client.get("/api/app-info", params={"version": 9})
+        searched = client.get("/api/search", params={"q": "maho", "version": 1})
+
+    assert live.headers["x-data-version"] == "2"
+    assert "immutable" not in live.headers.get("cache-control", "")
+    assert live.json()["total_players"] == len(app_caches[constants.CACHE["STATISTICS"]][constants.STATS["ALL_PLAYERS"]]) - 1
+    assert pinned.headers["x-data-version"] == "1"
+    assert "immutable" in pinned.headers["cache-control"]
+    assert pinned.json()["total_players"] == live.json()["total_players"] + 1
+    assert current.json() == live.json()
+    assert unknown.status_code == 404
+    assert unknown.headers["x-data-version"] == "9"
+    assert searched.json()["results"][0]["name"] == "Patrick Mahomes"
+
+
+def test_changes_endpoint_lists_what_changed_since_a_data_version(tmp_path, monkeypatch, app_caches) -> None:
+    monkeypatch.setattr(app_module, "CACHE_PLAYER_RESPONSES", False)
+    monkeypatch.setattr(app_module, "CACHE_SNAPSHOT", False)
+    app = App()
+    app.db.close()
+    app.db = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    app.caches = deepcopy(app_caches)
+    app.save()
+    app.caches[constants.CACHE["DEPTH_CHART"]]["KC"].loc["QB", "starter"] = "Carson Wentz"
+    app.save()
+    app.initialize = lambda: None
+    monkeypatch.setattr(api_module, "App", lambda: app)
+
+    with TestClient(api_module.api) as client:
+        latest = client.get("/api/changes", params={"since": 1})
+        pinned = client.get("/api/changes", params={"since": 1, "version": 1})
+        future = client.get("/api/changes", params={"since": 3})
+
+    assert latest.status_code == 200
+    assert latest.json() == {"since": 1, "version": 2, "full_refresh": False, "players": [], "seasons": [], "teams": ["KC"]}
+    assert pinned.json()["teams"] == []
+    assert future.status_code == 404
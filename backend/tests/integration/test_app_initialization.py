@@ -1,6 +1,15 @@
+import functools
+import gzip
+import json
 from unittest.mock import MagicMock
 
+import backend.app as app_module
 from backend.app import App
+from backend.database.DAO.sqlite_dao import SQLiteCacheManager
+from backend.database.service.sqlite_service import SQLService
+from backend.schedules.schedules import Schedules
+from backend.statistics.statistics import Statistics
+from backend.util import constants
 
 
 def test_app_initialize_loads_from_cache_when_available(monkeypatch) -> None:
@@ -20,8 +29,11 @@ def test_app_initialize_loads_from_cache_when_available(monkeypatch) -> None:
         app.db.close()
 
 
-def test_app_initialize_fetches_and_saves_when_cache_missing(monkeypatch) -> None:
+def test_app_initialize_fetches_and_saves_when_cache_missing(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(app_module, "DB_READ_ONLY", True)
     app = App()
+    app.db.close()
+    app.db = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
     try:
         monkeypatch.setattr(app.db, "has_cached_data", lambda: False)
         app.load = MagicMock()
@@ -33,5 +45,107 @@ def test_app_initialize_fetches_and_saves_when_cache_missing(monkeypatch) -> Non
         app.run.assert_called_once()
         app.save.assert_called_once()
         app.load.assert_not_called()
+        # After a first-boot rebuild, requests read through the read-only view, not the writer connection.
+        assert app.db.db.supports_concurrent_reads is True
+    finally:
+        app.db.close()
+
+
+def test_app_run_incremental_rebuilds_only_the_current_season(tmp_path, monkeypatch, app_caches) -> None:
+    monkeypatch.setattr(app_module, "CACHE_SNAPSHOT", False)
+    monkeypatch.setattr(app_module, "CACHE_PLAYER_RESPONSES", False)
+    app = App()
+    app.db.close()
+    app.db = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    app.caches = app_caches
+    app.save()
+
+    class _FakeDepthChart:
+        def run(self) -> None:
+            pass
+
+        def get_cache(self):
+            return app_caches[constants.CACHE["DEPTH_CHART"]]
+
+    class _FakeSchedules(Schedules):
+        def run(self) -> None:
+            self.set_cache({2025: {"KC": app_caches[constants.CACHE["SCHEDULES"]][2025]["KC"]}})
+
+    class _FakeStatistics(Statistics):
+        def run(self, known_players=None) -> None:
+            assert self.seasons == [constants.CURRENT_SEASON]
+            assert "Retired Veteran" in known_players
+            self.set_cache({"all_players": [], "by_year": {2025: {}}, "player_weekly_stats": {}})
+
+    monkeypatch.setattr(app_module, "NRPDepthChart", _FakeDepthChart)
+    monkeypatch.setattr(app_module, "Schedules", _FakeSchedules)
+    monkeypatch.setattr(app_module, "Statistics", _FakeStatistics)
+    try:
+        app.caches = {}
+        app.run_incremental()
+
+        assert sorted(app.caches[constants.CACHE["SCHEDULES"]]) == [2024, 2025]
+        assert list(app.caches[constants.CACHE["SCHEDULES"]][2025]) == ["KC"]
+        by_year = app.caches[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]]
+        assert by_year[2025] == {}
+        assert by_year[2024]["QB"].loc["Patrick Mahomes", "Pass TD"] == 30
+    finally:
+        app.db.close()
+
+
+def test_app_save_pre_renders_player_responses(tmp_path, monkeypatch, app_caches) -> None:
+    monkeypatch.setattr(app_module, "CACHE_SNAPSHOT", False)
+    app = App()
+    app.db.close()
+    app.db = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    app.caches = app_caches
+    try:
+        app.save()
+
+        stored = app.db.load_player_response("Patrick Mahomes")
+        assert stored is not None
+        assert json.loads(gzip.decompress(stored))["available_seasons"] == [2025, 2024]
+        assert app.db.load_player_response("Patrick Mahomes", 2024) is not None
+        assert app.db.load_player_response("Patrick Mahomes", 2019) is None
+    finally:
+        app.db.close()
+
+
+def _app_with_snapshot(db_path: str, snapshot_path: str, monkeypatch) -> App:
+    app = App()
+    app.db.close()
+    app.db = SQLService(SQLiteCacheManager(db_path))
+    monkeypatch.setattr(app.db, "write_snapshot", functools.partial(app.db.write_snapshot, path=snapshot_path))
+    monkeypatch.setattr(app.db, "load_snapshot", functools.partial(app.db.load_snapshot, path=snapshot_path))
+    app.load = MagicMock()
+    return app
+
+
+def test_app_initialize_warm_starts_from_a_current_snapshot(tmp_path, monkeypatch, app_caches) -> None:
+    db_path, snapshot_path = str(tmp_path / "cache.db"), str(tmp_path / "cache_snapshot.arrows")
+    monkeypatch.setattr(app_module, "CACHE_PLAYER_RESPONSES", False)
+    writer = _app_with_snapshot(db_path, snapshot_path, monkeypatch)
+    writer.caches = app_caches
+    writer.save()
+
+    app = _app_with_snapshot(db_path, snapshot_path, monkeypatch)
+    try:
+        app.initialize()
+
+        app.load.assert_not_called()
+        assert app.caches[constants.CACHE["STATISTICS"]][constants.STATS["ALL_PLAYERS"]][0]["name"] == "Patrick Mahomes"
+        assert app.caches[constants.CACHE["DEPTH_CHART"]]["KC"].loc["QB", "starter"] == "Patrick Mahomes"
+    finally:
+        app.db.close()
+
+    # A refresh that skips the snapshot leaves it stale, so startup falls back to the tables.
+    with writer.db.staged_write():
+        writer.db.save_to_db({"KC": app_caches[constants.CACHE["DEPTH_CHART"]]["KC"].iloc[:1]}, constants.CACHE["DEPTH_CHART"])
+    writer.db.close()
+    app = _app_with_snapshot(db_path, snapshot_path, monkeypatch)
+    try:
+        app.initialize()
+
+        app.load.assert_called_once()
     finally:
         app.db.close()
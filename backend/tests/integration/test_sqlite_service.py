@@ -1,9 +1,44 @@
+import json
+import subprocess
+import sys
+from copy import deepcopy
+
 import pandas as pd
 import pytest
 
+from backend.database.DAO import sqlite_dao
+from backend.database.DAO.arrow_dao import ArrowCacheManager
+from backend.database.DAO.base_dao import BaseCacheManager
 from backend.database.DAO.sqlite_dao import SQLiteCacheManager
-from backend.database.service.sqlite_service import SQLService
+from backend.database.service import sqlite_service
+from backend.database.service.lazy_cache import (
+    LazyLRUMapping,
+    LazyRecordListMapping,
+    LazySeasonMapping,
+)
+from backend.database.service.sqlite_service import SQLService, build_cache_manager
 from backend.util import constants
+from backend.util.exceptions import DataProcessingError
+
+
+@pytest.fixture(params=["sqlite", "parquet"])
+def backend(request) -> str:
+    return request.param
+
+
+@pytest.fixture
+def open_store(tmp_path, backend):
+    def _open() -> BaseCacheManager:
+        if backend == "sqlite":
+            return SQLiteCacheManager(str(tmp_path / "cache.db"))
+        return ArrowCacheManager(str(tmp_path / "cache"), file_format=backend)
+
+    return _open
+
+
+@pytest.fixture
+def store(open_store) -> BaseCacheManager:
+    return open_store()
 
 
 def test_sqlite_service_round_trip_for_all_cache_families(stats_cache, schedules_cache, depth_chart_cache) -> None:
@@ -39,46 +74,20 @@ def test_sqlite_service_round_trip_for_all_cache_families(stats_cache, schedules
         service.close()
 
 
-def test_has_cached_data_requires_core_statistics_tables() -> None:
+def test_has_cached_data_requires_all_family_tables(stats_cache, schedules_cache) -> None:
     service = SQLService()
     service.db.close()
     service.db = SQLiteCacheManager(":memory:")
 
-    stats_prefix = constants.CACHE["STATISTICS"]
-    schedules_prefix = constants.CACHE["SCHEDULES"]
-    depth_prefix = constants.CACHE["DEPTH_CHART"]
-
     try:
-        # Incomplete stats family: all_players only.
-        service.db.save_table(
-            f"{stats_prefix}_{constants.STATS['ALL_PLAYERS']}",
-            pd.DataFrame([{"name": "Patrick Mahomes", "position": "QB"}]),
-            index=False,
-        )
-        service.db.save_table(
-            f"{schedules_prefix}_2025_KC",
-            pd.DataFrame([{"week": 1, "opponent": "BAL", "home_away": "HOME"}]),
-            index=False,
-        )
-        service.db.save_table(
-            f"{depth_prefix}_KC",
-            pd.DataFrame([{"position": "QB", "starter": "Patrick Mahomes"}]),
-            index=False,
-        )
-        assert service.has_cached_data() is False
-
-        # Still incomplete without seasonal stats tables.
-        service.db.save_table(
-            f"{stats_prefix}_{constants.STATS['PLAYER_WEEKLY_STATS']}",
-            pd.DataFrame([{"__player_key": "Patrick Mahomes", "season": 2025, "week": 1}]),
-            index=False,
-        )
+        service.save_to_db(stats_cache, constants.CACHE["STATISTICS"])
+        service.save_to_db(schedules_cache, constants.CACHE["SCHEDULES"])
         assert service.has_cached_data() is False
 
-        # Ready only after at least one seasonal position table exists.
+        # Ready only once the depth chart family table exists as well.
         service.db.save_table(
-            f"{stats_prefix}_2025_QB",
-            pd.DataFrame([{"player_display_name": "Patrick Mahomes", "Pass Yds": 4280}]),
+            f"{constants.CACHE['DEPTH_CHART']}_by_team",
+            pd.DataFrame([{"position": "QB", "starter": "Patrick Mahomes", "__team": "KC"}]),
             index=False,
         )
         assert service.has_cached_data() is True
@@ -86,6 +95,62 @@ def test_has_cached_data_requires_core_statistics_tables() -> None:
         service.close()
 
 
+def test_save_to_db_writes_one_long_table_per_family(stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService()
+    service.db.close()
+    service.db = SQLiteCacheManager(":memory:")
+
+    try:
+        service.save_to_db(stats_cache, constants.CACHE["STATISTICS"])
+        service.save_to_db(schedules_cache, constants.CACHE["SCHEDULES"])
+        service.save_to_db(depth_chart_cache, constants.CACHE["DEPTH_CHART"])
+
+        assert set(service.db.list_tables()) == {
+            "Cache_manifest",
+            "Cache_row_hashes",
+            "Statistics_all_players",
+            "Statistics_player_search",
+            "Statistics_by_year",
+            "Statistics_player_weekly_stats",
+            "Schedules_by_team",
+            "DepthChart_by_team",
+        }
+
+        by_year = service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["BY_YEAR"]]
+        assert sorted(by_year) == [2024, 2025]
+        assert sorted(by_year[2025]) == ["QB", "WR"]
+        # Columns from other positions in the shared table are not leaked into a partition.
+        assert "Pass Yds" not in by_year[2025]["WR"].columns
+        assert by_year[2025]["WR"].loc["JaMarr Chase", "Rec Yds"] == 1462
+
+        depth = service.load_from_db(constants.CACHE["DEPTH_CHART"])
+        assert depth["CIN"].index.name == "CIN"
+        assert depth["CIN"].loc["WR", "starter"] == "JaMarr Chase"
+    finally:
+        service.close()
+
+
+def test_by_year_keeps_stat_columns_that_are_all_null_in_a_season(stats_cache) -> None:
+    stats = deepcopy(stats_cache)
+    stats[constants.STATS["BY_YEAR"]][2024]["QB"]["Fumbles"] = float("nan")
+    service = SQLService(SQLiteCacheManager(":memory:"))
+
+    try:
+        service.save_to_db(stats, constants.CACHE["STATISTICS"])
+        eager = service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["BY_YEAR"]]
+        service.lazy = True
+        lazy = service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["BY_YEAR"]]
+
+        for by_year in (eager, lazy):
+            assert list(by_year[2024]["QB"].columns) == list(stats[constants.STATS["BY_YEAR"]][2024]["QB"].columns)
+            assert by_year[2024]["QB"]["Fumbles"].isna().all()
+            # The union column only exists for 2024, so other partitions still leave it out.
+            assert "Fumbles" not in by_year[2025]["QB"].columns
+            assert "Pass Yds" not in by_year[2025]["WR"].columns
+    finally:
+        service.close()
+
+
 def test_load_table_safe_reraises_non_missing_table_errors() -> None:
     service = SQLService()
 
@@ -113,3 +178,410 @@ def test_load_table_safe_returns_none_for_missing_table() -> None:
         assert service._load_table_safe("Statistics_missing_table") is None
     finally:
         service.close()
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_arrow_backend_round_trip_for_all_cache_families(tmp_path, file_format, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService()
+    service.db.close()
+    service.db = ArrowCacheManager(str(tmp_path), file_format=file_format)
+
+    try:
+        assert service.has_cached_data() is False
+
+        service.save_to_db(stats_cache, constants.CACHE["STATISTICS"])
+        service.save_to_db(schedules_cache, constants.CACHE["SCHEDULES"])
+        service.save_to_db(depth_chart_cache, constants.CACHE["DEPTH_CHART"])
+
+        # A fresh manager reads the persisted manifest rather than in-process state.
+        service.db = ArrowCacheManager(str(tmp_path), file_format=file_format)
+        assert service.has_cached_data() is True
+
+        loaded_stats = service.load_from_db(constants.CACHE["STATISTICS"])
+        loaded_schedules = service.load_from_db(constants.CACHE["SCHEDULES"])
+        loaded_depth = service.load_from_db(constants.CACHE["DEPTH_CHART"])
+
+        assert loaded_stats[constants.STATS["BY_YEAR"]][2025]["QB"].loc["Patrick Mahomes", "Pass TD"] == 32
+        assert loaded_stats[constants.STATS["PLAYER_WEEKLY_STATS"]]["JaMarr Chase"][0]["Rec Yds"] == 112
+        assert loaded_schedules[2025]["KC"].loc[2, "opponent"] == "BYE"
+        assert loaded_depth["KC"].loc["QB", "starter"] == "Patrick Mahomes"
+    finally:
+        service.close()
+
+
+def test_build_cache_manager_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Unsupported cache backend"):
+        build_cache_manager("csv")
+
+
+def _staged_save(service: SQLService, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    with service.staged_write():
+        service.save_to_db(stats_cache, constants.CACHE["STATISTICS"])
+        service.save_to_db(schedules_cache, constants.CACHE["SCHEDULES"])
+        service.save_to_db(depth_chart_cache, constants.CACHE["DEPTH_CHART"])
+
+
+def _first_player_name(service: SQLService) -> str:
+    return service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["ALL_PLAYERS"]][0]["name"]
+
+
+def test_staged_write_promotes_atomically_and_keeps_previous_generation(open_store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(open_store())
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        assert _first_player_name(service) == "Patrick Mahomes"
+
+        refreshed = deepcopy(stats_cache)
+        refreshed[constants.STATS["ALL_PLAYERS"]].reverse()
+        with service.staged_write():
+            service.save_to_db(refreshed, constants.CACHE["STATISTICS"])
+            service.save_to_db(schedules_cache, constants.CACHE["SCHEDULES"])
+            service.save_to_db(depth_chart_cache, constants.CACHE["DEPTH_CHART"])
+            # Mid-refresh readers still see the complete previous generation.
+            reader = SQLService(open_store())
+            assert reader.has_cached_data() is True
+            assert _first_player_name(reader) == "Patrick Mahomes"
+            reader.close()
+
+        assert _first_player_name(service) == "Retired Veteran"
+        assert _first_player_name(SQLService(open_store())) == "Retired Veteran"
+
+        assert service.rollback() is True
+        assert _first_player_name(service) == "Patrick Mahomes"
+    finally:
+        service.close()
+
+
+def test_staged_write_numbers_archives_and_prunes_generations(monkeypatch, store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    monkeypatch.setattr(sqlite_service, "CACHE_GENERATIONS", 2)
+    service = SQLService(store)
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        assert service.cache_build_info()["generation"] == 1
+
+        refreshed = deepcopy(stats_cache)
+        refreshed[constants.STATS["ALL_PLAYERS"]].reverse()
+        _staged_save(service, refreshed, schedules_cache, depth_chart_cache)
+        _staged_save(service, refreshed, schedules_cache, depth_chart_cache)
+        assert service.cache_build_info()["generation"] == 3
+        assert service.generations() == [2, 3]
+
+        archived = service.open_generation(2)
+        try:
+            assert archived.cache_build_info()["generation"] == 2
+            assert _first_player_name(archived) == "Retired Veteran"
+        finally:
+            archived.close()
+        with pytest.raises(KeyError):
+            service.open_generation(1)
+
+        # Generation numbers keep rising after a rollback instead of reusing a kept one.
+        assert service.rollback() is True
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        assert service.cache_build_info()["generation"] == 4
+        assert service.generations() == [3, 4]
+    finally:
+        service.close()
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_arrow_reader_keeps_its_generation_files_until_it_closes(tmp_path, monkeypatch, file_format, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    monkeypatch.setattr(sqlite_service, "CACHE_GENERATIONS", 0)
+    cache_dir = str(tmp_path / "cache")
+    writer = SQLService(ArrowCacheManager(cache_dir, file_format=file_format))
+    _staged_save(writer, stats_cache, schedules_cache, depth_chart_cache)
+    reader = SQLService(ArrowCacheManager(cache_dir, file_format=file_format), lazy=True)
+    reader.use_read_only()
+    leases = list((tmp_path / "cache").glob("manifest.lease-*.json"))
+    try:
+        refreshed = deepcopy(stats_cache)
+        refreshed[constants.STATS["ALL_PLAYERS"]].reverse()
+        refreshed[constants.STATS["BY_YEAR"]][2025]["QB"].loc["Patrick Mahomes", "Pass Yds"] = 5000
+        _staged_save(writer, refreshed, schedules_cache, depth_chart_cache)
+        _staged_save(writer, refreshed, schedules_cache, depth_chart_cache)
+
+        # Both refreshes aged generation 1 out of every manifest, but the reader's lease kept its files.
+        stats = reader.load_from_db(constants.CACHE["STATISTICS"])
+        assert stats[constants.STATS["ALL_PLAYERS"]][0]["name"] == "Patrick Mahomes"
+        assert stats[constants.STATS["BY_YEAR"]][2025]["QB"].loc["Patrick Mahomes", "Pass Yds"] == 4280
+        assert len(leases) == 1
+    finally:
+        reader.close()
+
+    assert not leases[0].exists()
+    _staged_save(writer, refreshed, schedules_cache, depth_chart_cache)
+    referenced = writer.db._referenced_files()
+    assert sorted(path.name for path in (tmp_path / "cache").glob(f"*.{file_format}")) == sorted(referenced)
+    writer.close()
+
+
+def test_arrow_garbage_collection_drops_leases_of_exited_processes(tmp_path) -> None:
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    store = ArrowCacheManager(str(tmp_path), file_format="parquet")
+    store.save_table("players", pd.DataFrame({"name": ["A"]}), index=False)
+    stale = tmp_path / f"manifest.lease-{exited.pid}-deadbeef.json"
+    stale.write_text(json.dumps({"version": 1, "tables": {"players": {"file": "orphan.parquet", "format": "parquet"}}}))
+    (tmp_path / "orphan.parquet").write_bytes(b"")
+
+    store.prune_generations(keep=0)
+
+    assert not stale.exists()
+    assert not (tmp_path / "orphan.parquet").exists()
+    assert store.load_table("players")["name"].tolist() == ["A"]
+
+
+def test_staged_write_records_changed_players_seasons_and_teams(store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(store)
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        first = service.changes_since(0, 1)
+        assert first["full_refresh"] is False
+        assert set(first["players"]) >= {"Patrick Mahomes", "JaMarr Chase"}
+        assert first["teams"] == sorted(depth_chart_cache)
+
+        refreshed = deepcopy(stats_cache)
+        refreshed[constants.STATS["BY_YEAR"]][2025]["QB"].loc["Patrick Mahomes", "Pass TD"] = 40
+        depth = deepcopy(depth_chart_cache)
+        depth["KC"].loc["QB", "starter"] = "Carson Wentz"
+        _staged_save(service, refreshed, schedules_cache, depth)
+        _staged_save(service, refreshed, schedules_cache, depth)
+
+        expected = {"full_refresh": False, "players": ["Patrick Mahomes"], "seasons": [2025], "teams": ["KC"]}
+        assert service.changes_since(1, 2) == expected
+        assert service.changes_since(2, 3) == {"full_refresh": False, "players": [], "seasons": [], "teams": []}
+        assert service.changes_since(1, 3) == expected
+
+        # After a rollback, generation 4 is diffed against generation 2, so nothing links it to 3.
+        assert service.rollback() is True
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        assert service.changes_since(3, 4)["full_refresh"] is True
+        assert service.changes_since(2, 4) == expected
+    finally:
+        service.close()
+
+
+def test_staged_write_failure_leaves_live_cache_untouched(tmp_path, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    try:
+        # A first refresh that never writes the depth chart family is rejected before promotion.
+        with pytest.raises(DataProcessingError, match="DepthChart_by_team"):
+            with service.staged_write():
+                service.save_to_db(stats_cache, constants.CACHE["STATISTICS"])
+                service.save_to_db(schedules_cache, constants.CACHE["SCHEDULES"])
+        assert service.has_cached_data() is False
+
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        refreshed = deepcopy(stats_cache)
+        refreshed[constants.STATS["ALL_PLAYERS"]].reverse()
+        with pytest.raises(RuntimeError):
+            with service.staged_write():
+                service.save_to_db(refreshed, constants.CACHE["STATISTICS"])
+                raise RuntimeError("source download failed")
+
+        assert service.has_cached_data() is True
+        assert _first_player_name(service) == "Patrick Mahomes"
+        assert not (tmp_path / "cache.db.staging").exists()
+        assert service.rollback() is False
+    finally:
+        service.close()
+
+
+def test_save_to_db_rewrites_only_changed_partitions(monkeypatch, backend, store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(store)
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+
+        writes: list = []
+        save_table = SQLiteCacheManager.save_table if backend == "sqlite" else ArrowCacheManager.save_table
+
+        def recording_save_table(self, table_name, df, if_exists="replace", index=True):
+            writes.append((table_name, if_exists, len(df)))
+            return save_table(self, table_name, df, if_exists, index)
+
+        # Staging stores are new instances, so record writes at the class level.
+        monkeypatch.setattr(type(store), "save_table", recording_save_table)
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        # Only the single-row change set and build record are written when nothing changed.
+        assert [write[0] for write in writes] == ["Cache_changes", "Cache_build"]
+
+        refreshed = deepcopy(stats_cache)
+        refreshed[constants.STATS["BY_YEAR"]][2025]["QB"].loc["Patrick Mahomes", "Pass TD"] = 40
+        _staged_save(service, refreshed, schedules_cache, depth_chart_cache)
+
+        by_year_writes = [write for write in writes if write[0] == "Statistics_by_year"]
+        if backend == "sqlite":
+            assert by_year_writes == [("Statistics_by_year", "append", len(refreshed[constants.STATS["BY_YEAR"]][2025]["QB"]))]
+        else:
+            # Without row-level deletes the merged table is written once, not rewritten and then appended to.
+            total_rows = sum(len(df) for positions in refreshed[constants.STATS["BY_YEAR"]].values() for df in positions.values())
+            assert by_year_writes == [("Statistics_by_year", "replace", total_rows)]
+        assert [write[0] for write in writes].count("Cache_row_hashes") == 1
+        assert {write[0] for write in writes} <= {"Statistics_by_year", "Cache_manifest", "Cache_row_hashes", "Cache_changes", "Cache_build"}
+
+        by_year = service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["BY_YEAR"]]
+        assert by_year[2025]["QB"].loc["Patrick Mahomes", "Pass TD"] == 40
+        assert by_year[2025]["WR"].loc["JaMarr Chase", "Rec Yds"] == 1462
+        assert sorted(by_year) == [2024, 2025]
+    finally:
+        service.close()
+
+
+def test_lazy_load_materializes_seasons_and_weekly_logs_on_first_access(store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(store)
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        eager = service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["BY_YEAR"]]
+
+        eager_weekly = service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["PLAYER_WEEKLY_STATS"]]
+
+        service.lazy = True
+        lazy_stats = service.load_from_db(constants.CACHE["STATISTICS"])
+        lazy = lazy_stats[constants.STATS["BY_YEAR"]]
+        lazy_weekly = lazy_stats[constants.STATS["PLAYER_WEEKLY_STATS"]]
+
+        assert isinstance(lazy, LazyLRUMapping)
+        assert sorted(lazy) == [2024, 2025]
+        assert lazy.resident_keys == []
+        for season, positions in eager.items():
+            assert sorted(lazy[season]) == sorted(positions)
+            for position, frame in positions.items():
+                pd.testing.assert_frame_equal(lazy[season][position], frame)
+        assert lazy.get(1999) is None
+        lazy.clear()
+        assert isinstance(lazy, LazySeasonMapping)
+        assert lazy.season_columns == {season: {position: list(frame.columns) for position, frame in positions.items()} for season, positions in eager.items()}
+        assert lazy.player_seasons("Patrick Mahomes") == [2024, 2025]
+        assert lazy.player_seasons("JaMarr Chase") == [2025]
+        assert lazy.resident_keys == []
+
+        assert isinstance(lazy_weekly, LazyRecordListMapping)
+        assert sorted(lazy_weekly) == sorted(eager_weekly)
+        assert lazy_weekly.total_records == sum(len(weeks) for weeks in eager_weekly.values())
+        assert lazy_weekly.resident_keys == []
+        assert lazy_weekly["Patrick Mahomes"] == eager_weekly["Patrick Mahomes"]
+        assert lazy_weekly.resident_keys == ["Patrick Mahomes"]
+        assert lazy_weekly.get("Unknown Player") is None
+    finally:
+        service.close()
+
+
+def test_lazy_weekly_reads_several_players_for_one_season_in_one_query(monkeypatch, store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(store, lazy=True)
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        lazy_weekly = service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["PLAYER_WEEKLY_STATS"]]
+        queries: list[dict] = []
+        load_records = store.load_records
+        monkeypatch.setattr(store, "load_records", lambda table_name, where: queries.append(where) or load_records(table_name, where))
+
+        selected = lazy_weekly.records_where(["Patrick Mahomes", "JaMarr Chase", "Unknown Player"], {"season": 2025})
+
+        assert queries == [{"__player_key": ["Patrick Mahomes", "JaMarr Chase"], "season": 2025}]
+        assert lazy_weekly.resident_keys == []
+        assert selected == {name: service._load_player_weekly(name, season=2025) for name in ("Patrick Mahomes", "JaMarr Chase")}
+        assert selected["Patrick Mahomes"][0]["Pass Yds"] == 320
+        assert lazy_weekly.records_where(["Patrick Mahomes"], {"season": 2024}) == {}
+    finally:
+        service.close()
+
+
+def test_staged_write_records_build_manifest_used_for_validation(tmp_path, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        build = service.cache_build_info()
+        assert build is not None
+        assert build["schema_version"] == 1
+        assert {"Statistics_by_year", "Schedules_by_team", "DepthChart_by_team"} <= set(build["tables"])
+        assert service.has_cached_data() is True
+
+        manifest = service.db.load_rows("Cache_manifest", {"table_name": "Statistics_by_year"})
+        row_counts = dict(zip(manifest["partition"], manifest["row_count"]))
+        assert row_counts['[2025, "QB"]'] == len(stats_cache[constants.STATS["BY_YEAR"]][2025]["QB"])
+
+        # Identical data keeps the content-derived data version; changed data moves it.
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        assert service.cache_build_info()["data_version"] == build["data_version"]
+        refreshed = deepcopy(stats_cache)
+        refreshed[constants.STATS["BY_YEAR"]][2025]["QB"].loc["Patrick Mahomes", "Pass TD"] = 40
+        _staged_save(service, refreshed, schedules_cache, depth_chart_cache)
+        assert service.cache_build_info()["data_version"] != build["data_version"]
+
+        # Lazy loaders take their keys from the manifest instead of scanning the family tables.
+        def fail_value_counts(*_args, **_kwargs):
+            raise AssertionError("value_counts should not be called when a manifest exists")
+
+        service.db.value_counts = fail_value_counts
+        service.lazy = True
+        lazy_stats = service.load_from_db(constants.CACHE["STATISTICS"])
+        assert sorted(lazy_stats[constants.STATS["BY_YEAR"]]) == [2024, 2025]
+        assert "Patrick Mahomes" in lazy_stats[constants.STATS["PLAYER_WEEKLY_STATS"]]
+
+        stale = service.db.load_table("Cache_build").assign(schema_version=0)
+        service.db.save_table("Cache_build", stale, index=False)
+        assert service.has_cached_data() is False
+
+        partial = service.db.load_table("Cache_build").assign(schema_version=1, tables='["Statistics_by_year"]')
+        service.db.save_table("Cache_build", partial, index=False)
+        assert service.has_cached_data() is False
+    finally:
+        service.close()
+
+
+def test_load_many_in_parallel_matches_sequential_load(backend, store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(store)
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        service.use_read_only()
+        assert service.db.supports_concurrent_reads is True
+
+        names = [constants.CACHE["DEPTH_CHART"], constants.CACHE["SCHEDULES"], constants.CACHE["STATISTICS"]]
+        sequential = service.load_many(names, workers=1)
+        parallel = service.load_many(names, workers=4)
+
+        assert list(parallel) == names
+        assert list(parallel[constants.CACHE["STATISTICS"]]) == list(sequential[constants.CACHE["STATISTICS"]])
+        assert parallel[constants.CACHE["STATISTICS"]][constants.STATS["ALL_PLAYERS"]] == sequential[constants.CACHE["STATISTICS"]][constants.STATS["ALL_PLAYERS"]]
+        assert parallel[constants.CACHE["STATISTICS"]][constants.STATS["PLAYER_WEEKLY_STATS"]] == sequential[constants.CACHE["STATISTICS"]][constants.STATS["PLAYER_WEEKLY_STATS"]]
+        pd.testing.assert_frame_equal(parallel[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]][2025]["QB"],
+                                      sequential[constants.CACHE["STATISTICS"]][constants.STATS["BY_YEAR"]][2025]["QB"])
+        pd.testing.assert_frame_equal(parallel[constants.CACHE["SCHEDULES"]][2025]["KC"], sequential[constants.CACHE["SCHEDULES"]][2025]["KC"])
+        pd.testing.assert_frame_equal(parallel[constants.CACHE["DEPTH_CHART"]]["KC"], sequential[constants.CACHE["DEPTH_CHART"]]["KC"])
+        if backend == "sqlite":
+            assert service.db.pool_size > 1
+    finally:
+        service.close()
+
+
+def test_search_players_uses_the_stored_name_index(backend, store, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    service = SQLService(store)
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+        service.use_read_only()
+
+        if backend != "sqlite":
+            assert service.search_players("maho") is None
+            return
+        records, count = service.search_players("maho")
+        assert count == 1
+        assert records[0]["name"] == "Patrick Mahomes"
+        assert records[0]["team"] == "KC"
+        assert service.search_players("ma", position="WR") == (
+            [record for record in service.load_from_db(constants.CACHE["STATISTICS"])[constants.STATS["ALL_PLAYERS"]] if record["name"] == "JaMarr Chase"], 1)
+        assert service.search_players("zzz") == ([], 0)
+    finally:
+        service.close()
+
+
+def test_save_falls_back_to_in_memory_search_without_fts5_trigram(tmp_path, monkeypatch, stats_cache, schedules_cache, depth_chart_cache) -> None:
+    monkeypatch.setattr(sqlite_dao, "_fts5_trigram_available", lambda: False)
+    service = SQLService(SQLiteCacheManager(str(tmp_path / "cache.db")))
+    try:
+        _staged_save(service, stats_cache, schedules_cache, depth_chart_cache)
+
+        assert "Statistics_player_search" not in service.db.list_tables()
+        assert service.search_players("maho") is None
+        assert service.has_cached_data() is True
+    finally:
+        service.close()
@@ -0,0 +1,62 @@
+import pandas as pd
+
+from backend.statistics.statistics import RosterData, Statistics
+from backend.statistics.util import process_pool
+
+
+def _sources() -> dict[str, pd.DataFrame]:
+    names = ["Patrick Mahomes", "JaMarr Chase", "Joe Burrow", "Travis Kelce", None]
+    positions = ["QB", "WR", "QB", "TE", "WR"]
+    weekly = pd.DataFrame(
+        {
+            "season": [2024] * 10 + [2025] * 10,
+            "week": [week for _ in range(2) for week in (2, 1) for _ in range(5)],
+            "game_id": [f"g{index}" for index in range(20)],
+            "player_id": [f"00-{index % 5}" for index in range(20)],
+            "player_display_name": names * 4,
+            "position": positions * 4,
+            "team": ["KC", "CIN", "CIN", "KC", "KC"] * 4,
+            "fantasy_points_ppr": [float(index) for index in range(20)],
+            "receiving_yards": [float(index * 3 % 7) for index in range(20)],
+            "receptions": [index % 4 for index in range(20)],
+        }
+    )
+    seasonal = weekly.groupby(["season", "player_id", "player_display_name", "position", "team"], as_index=False)[["fantasy_points_ppr", "receiving_yards"]].sum()
+    sources = {key: pd.DataFrame() for key, _ in [*Statistics.WEEKLY_JOIN_SPECS, *Statistics.SEASONAL_JOIN_SPECS]}
+    sources["pfr_rec_weekly"] = pd.DataFrame(
+        {"season": [2025], "week": [2], "game_id": ["g11"], "player_display_name": ["JaMarr Chase"], "team": ["CIN"], "pfr_rec_drop": [1.0]}
+    )
+    return {"player_weekly": weekly, "player_seasonal": seasonal, **sources}
+
+
+def test_process_pool_stages_match_the_thread_pool_stages() -> None:
+    sources = _sources()
+    roster_data = RosterData({"JaMarr Chase": "WR"}, {}, {"JaMarr Chase"}, {}, {"JaMarr Chase": "CIN"}, {})
+
+    def build(statistics: Statistics):
+        with process_pool.stats_process_pool(statistics.process_workers) as pool:
+            weekly_df, seasonal_df = statistics._shape_statistics_data(*statistics._merge_statistics_data(sources, pool))
+            return statistics._build_statistics_data(weekly_df, seasonal_df, roster_data, {"JaMarr Chase"}, pool)
+
+    threaded_by_year, threaded_weekly, threaded_players = build(Statistics([2024, 2025], process_workers=0))
+    by_year, weekly, players = build(Statistics([2024, 2025], process_workers=2))
+
+    assert list(weekly) == list(threaded_weekly)
+    assert weekly == threaded_weekly
+    assert [record["pfr_rec_drop"] for record in weekly["JaMarr Chase"]] == [None, None, None, 1.0]
+    assert players == threaded_players
+    assert by_year.keys() == threaded_by_year.keys()
+    for season, by_position in threaded_by_year.items():
+        assert by_year[season].keys() == by_position.keys()
+        for position, frame in by_position.items():
+            pd.testing.assert_frame_equal(by_year[season][position], frame)
+
+
+def test_partition_rows_keeps_each_value_in_one_partition() -> None:
+    df = pd.DataFrame({"name": ["a", "b", "a", "c", None, "b"], "value": range(6)})
+
+    parts = process_pool.partition_rows(df, "name", 2)
+
+    assert sorted(index for part in parts for index in part.index) == list(range(6))
+    assert all(set(part["name"].dropna()).isdisjoint(other["name"].dropna()) for part in parts for other in parts if other is not part)
+    assert all(part.index.is_monotonic_increasing for part in parts)
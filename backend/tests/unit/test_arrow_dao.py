@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from backend.database.DAO.arrow_dao import ArrowCacheManager
+
+
+def test_arrow_dao_rejects_unsafe_table_names(tmp_path) -> None:
+    manager = ArrowCacheManager(str(tmp_path))
+    unsafe_name = "../stats"
+
+    with pytest.raises(ValueError):
+        manager.save_table(unsafe_name, pd.DataFrame({"value": [1]}), index=False)
+    with pytest.raises(ValueError):
+        manager.load_table(unsafe_name)
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_arrow_dao_round_trips_tables_through_manifest(tmp_path, file_format, memory_map) -> None:
+    manager = ArrowCacheManager(str(tmp_path), file_format=file_format, memory_map=memory_map)
+    source = pd.DataFrame({"player": ["Patrick Mahomes", "Josh Allen"], "pass_yds": [4280, 4306]})
+
+    manager.save_table("stats_2025_QB", source, index=False)
+    reopened = ArrowCacheManager(str(tmp_path), file_format=file_format, memory_map=memory_map)
+
+    assert reopened.table_exists("stats_2025_QB") is True
+    assert reopened.list_tables() == ["stats_2025_QB"]
+    assert reopened.load_table("stats_2025_QB").to_dict("records") == source.to_dict("records")
+    assert reopened.load_rows("stats_2025_QB", {"player": ["Josh Allen", "Lamar Jackson"]}).to_dict("records") == [{"player": "Josh Allen", "pass_yds": 4306}]
+
+    reopened.drop_table("stats_2025_QB")
+    assert reopened.table_exists("stats_2025_QB") is False
+    assert list(tmp_path.glob("stats_2025_QB*")) == []
+
+
+def test_arrow_dao_missing_table_reports_no_such_table(tmp_path) -> None:
+    manager = ArrowCacheManager(str(tmp_path))
+
+    with pytest.raises(FileNotFoundError, match="no such table"):
+        manager.load_table("Statistics_all_players")
+
+
+def test_arrow_dao_stringifies_mixed_type_object_columns(tmp_path) -> None:
+    manager = ArrowCacheManager(str(tmp_path))
+    manager.save_table("mixed", pd.DataFrame({"value": [1, "BYE", None]}), index=False)
+
+    assert manager.load_table("mixed")["value"].tolist()[:2] == ["1", "BYE"]
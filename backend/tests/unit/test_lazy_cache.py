@@ -0,0 +1,57 @@
+import pytest
+
+from backend.database.service.lazy_cache import LazyLRUMapping
+
+
+def _tracking_mapping(max_entries: int, max_bytes: int = 0):
+    loads: list[int] = []
+
+    def loader(key: int) -> str:
+        loads.append(key)
+        return f"season-{key}"
+
+    mapping = LazyLRUMapping([2023, 2024, 2025], loader, max_entries=max_entries, max_bytes=max_bytes, sizeof=len)
+    return mapping, loads
+
+
+def test_lazy_mapping_loads_on_first_access_only() -> None:
+    mapping, loads = _tracking_mapping(max_entries=3)
+
+    assert len(mapping) == 3
+    assert list(mapping) == [2023, 2024, 2025]
+    assert 2024 in mapping
+    assert loads == []
+
+    assert mapping[2025] == "season-2025"
+    assert mapping.get(2025) == "season-2025"
+    assert loads == [2025]
+
+    assert mapping.get(1999) is None
+    with pytest.raises(KeyError):
+        mapping[1999]
+    assert loads == [2025]
+
+
+def test_lazy_mapping_evicts_least_recently_used_entry() -> None:
+    mapping, loads = _tracking_mapping(max_entries=2)
+
+    mapping[2023]
+    mapping[2024]
+    mapping[2023]
+    mapping[2025]
+
+    assert mapping.resident_keys == [2023, 2025]
+    mapping[2024]
+    assert loads == [2023, 2024, 2025, 2024]
+
+
+def test_lazy_mapping_respects_byte_budget() -> None:
+    # Each value is 11 characters, so a 20-byte budget keeps a single value resident.
+    mapping, _ = _tracking_mapping(max_entries=3, max_bytes=20)
+
+    mapping[2023]
+    mapping[2024]
+
+    assert mapping.resident_keys == [2024]
+    mapping.clear()
+    assert mapping.resident_keys == []
@@ -0,0 +1,64 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from backend.util.exceptions import DataLoadError
+from backend.util.raw_source_cache import RawSourceCache
+
+
+class _RecordingFetcher:
+    """Fake nflreadpy loader returning one row per requested season and recording each call."""
+
+    def __init__(self, value: int = 1) -> None:
+        self.value = value
+        self.calls: list[list[int]] = []
+
+    def __call__(self, seasons: list[int]) -> pd.DataFrame:
+        self.calls.append(list(seasons))
+        return pd.DataFrame({"season": seasons, "value": [self.value] * len(seasons)})
+
+
+def test_raw_source_cache_fetches_only_missing_seasons(tmp_path) -> None:
+    cache = RawSourceCache(str(tmp_path), current_season=2025)
+    fetch = _RecordingFetcher()
+
+    first = cache.load("player_weekly", fetch, [2023, 2024])
+    second = cache.load("player_weekly", fetch, [2023, 2024, 2025])
+
+    assert first["season"].tolist() == [2023, 2024]
+    assert second["season"].tolist() == [2023, 2024, 2025]
+    assert fetch.calls == [[2023, 2024], [2025]]
+    # Identical content for two seasons would share one object; here each season differs.
+    assert len(list((tmp_path / "objects").glob("*/*.parquet"))) == 3
+
+
+def test_raw_source_cache_expires_only_the_current_season(tmp_path) -> None:
+    cache = RawSourceCache(str(tmp_path), ttl_hours=1, current_season=2025)
+    cache.load("rosters", _RecordingFetcher(1), [2024, 2025])
+
+    expired = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat(timespec="seconds")
+    for season in (2024, 2025):
+        path = tmp_path / "sources" / "rosters" / f"{season}.json"
+        path.write_text(json.dumps({**json.loads(path.read_text()), "fetched_at": expired}))
+
+    refetch = _RecordingFetcher(2)
+    reloaded = cache.load("rosters", refetch, [2024, 2025])
+
+    assert refetch.calls == [[2025]]
+    assert reloaded["value"].tolist() == [1, 2]
+    assert json.loads((tmp_path / "sources" / "rosters" / "2025.json").read_text())["fetched_at"] != expired
+    # The replaced 2025 object is no longer referenced, so it is removed.
+    assert len(list((tmp_path / "objects").glob("*/*.parquet"))) == 2
+
+
+def test_raw_source_cache_offline_serves_cached_seasons_and_rejects_missing_ones(tmp_path) -> None:
+    RawSourceCache(str(tmp_path), current_season=2025).load("schedules", _RecordingFetcher(), [2025])
+    offline = RawSourceCache(str(tmp_path), ttl_hours=0, offline=True, current_season=2025)
+    fetch = _RecordingFetcher()
+
+    assert offline.load("schedules", fetch, [2025])["season"].tolist() == [2025]
+    with pytest.raises(DataLoadError, match="not cached"):
+        offline.load("schedules", fetch, [2024, 2025])
+    assert fetch.calls == []
@@ -0,0 +1,39 @@
+import pandas as pd
+
+from backend.database.service.lazy_cache import LazyRecordListMapping
+from backend.database.service.snapshot import read_snapshot, write_snapshot
+from backend.util import constants
+
+
+def test_snapshot_round_trips_the_assembled_caches(tmp_path, app_caches) -> None:
+    path = str(tmp_path / "cache_snapshot.arrows")
+    write_snapshot(app_caches, path, data_version="v1")
+
+    restored = read_snapshot(path, data_version="v1")
+
+    assert restored is not None
+    stats = restored[constants.CACHE["STATISTICS"]]
+    expected_stats = app_caches[constants.CACHE["STATISTICS"]]
+    assert stats[constants.STATS["ALL_PLAYERS"]] == expected_stats[constants.STATS["ALL_PLAYERS"]]
+    pd.testing.assert_frame_equal(stats[constants.STATS["BY_YEAR"]][2025]["QB"], expected_stats[constants.STATS["BY_YEAR"]][2025]["QB"])
+    pd.testing.assert_frame_equal(restored[constants.CACHE["SCHEDULES"]][2025]["KC"], app_caches[constants.CACHE["SCHEDULES"]][2025]["KC"])
+    pd.testing.assert_frame_equal(restored[constants.CACHE["DEPTH_CHART"]]["KC"], app_caches[constants.CACHE["DEPTH_CHART"]]["KC"])
+
+    weekly = stats[constants.STATS["PLAYER_WEEKLY_STATS"]]
+    assert isinstance(weekly, LazyRecordListMapping)
+    assert weekly.resident_keys == []
+    assert weekly.total_records == 2
+    assert weekly["JaMarr Chase"][0]["Rec Yds"] == 112
+    assert weekly["JaMarr Chase"][0]["Pass Yds"] is None
+
+
+def test_snapshot_is_ignored_when_stale_or_unreadable(tmp_path, app_caches) -> None:
+    path = tmp_path / "cache_snapshot.arrows"
+
+    assert read_snapshot(str(path), data_version="v1") is None
+
+    write_snapshot(app_caches, str(path), data_version="v1")
+    assert read_snapshot(str(path), data_version="v2") is None
+
+    path.write_bytes(path.read_bytes()[:200])
+    assert read_snapshot(str(path), data_version="v1") is None
@@ -1,6 +1,12 @@
+import os
+import sqlite3
+import threading
+
 import pandas as pd
 import pytest
 
+from backend.api.util.search_helpers import rank_search_results
+from backend.database.DAO.base_dao import frame_to_records
 from backend.database.DAO.sqlite_dao import SQLiteCacheManager
 
 
@@ -37,3 +43,251 @@ def test_sqlite_dao_allows_valid_table_names() -> None:
         assert manager.table_exists(table_name) is False
     finally:
         manager.close()
+
+
+def test_sqlite_dao_bulk_write_uses_explicit_column_types(tmp_path) -> None:
+    manager = SQLiteCacheManager(str(tmp_path / "cache.db"))
+    source = pd.DataFrame(
+        {
+            "player": ["Patrick Mahomes", "Josh Allen"],
+            "pass_yds": [4280, 4306],
+            "cmp_pct": [0.68, None],
+            "is_rookie": [False, True],
+            "Yds/Att": [7.3, 7.7],
+        }
+    )
+
+    try:
+        with manager.bulk_write():
+            manager.save_table("stats_2025_QB", source, index=False)
+            assert manager.in_bulk_write is True
+
+        column_types = {row[1]: row[2] for row in manager.conn.execute('PRAGMA table_info("stats_2025_QB")')}
+        assert column_types == {"player": "TEXT", "pass_yds": "INTEGER", "cmp_pct": "REAL", "is_rookie": "INTEGER", "Yds/Att": "REAL"}
+
+        loaded = manager.load_table("stats_2025_QB")
+        assert loaded["pass_yds"].tolist() == [4280, 4306]
+        assert pd.isna(loaded.loc[1, "cmp_pct"])
+        assert loaded["is_rookie"].tolist() == [0, 1]
+    finally:
+        manager.close()
+
+
+def test_sqlite_dao_bulk_write_rolls_back_every_table_on_error(tmp_path) -> None:
+    manager = SQLiteCacheManager(str(tmp_path / "cache.db"))
+    manager.save_table("existing", pd.DataFrame({"value": [1]}), index=False)
+
+    try:
+        with pytest.raises(RuntimeError):
+            with manager.bulk_write():
+                manager.save_table("existing", pd.DataFrame({"value": [2, 3]}), index=False)
+                manager.save_table("added", pd.DataFrame({"value": [4]}), index=False)
+                raise RuntimeError("refresh failed")
+
+        assert manager.load_table("existing")["value"].tolist() == [1]
+        assert manager.table_exists("added") is False
+    finally:
+        manager.close()
+
+
+def test_sqlite_dao_replace_partitions_deletes_only_matching_keys() -> None:
+    manager = SQLiteCacheManager(":memory:")
+    source = pd.DataFrame({"__season": [2024, 2025, 2025], "__position": ["QB", "QB", "WR"], "player": ["A", "B", "C"]})
+
+    try:
+        manager.save_table("stats_by_year", source, index=False)
+        manager.replace_partitions("stats_by_year", ["__season", "__position"], [(2025, "QB"), (2023, "TE")], source.iloc[0:0])
+
+        assert manager.load_table("stats_by_year")["player"].tolist() == ["A", "C"]
+        manager.replace_partitions("stats_by_year", ["__season", "__position"], [(2024, "QB")], pd.DataFrame({"__season": [2024], "__position": ["QB"], "player": ["D"]}))
+        assert manager.load_table("stats_by_year")["player"].tolist() == ["C", "D"]
+        with pytest.raises(ValueError):
+            manager.replace_partitions("stats_by_year", ["__season; --"], [(2024,)], source.iloc[0:0])
+    finally:
+        manager.close()
+
+
+def test_sqlite_dao_reads_matching_records_and_value_counts() -> None:
+    manager = SQLiteCacheManager(":memory:")
+    source = pd.DataFrame({"__player_key": ["A", "A", "B"], "week": [1, 2, 1], "fantasy_points_ppr": [12.5, None, 8.0]})
+
+    try:
+        manager.save_table("weekly", source, index=False)
+
+        assert manager.load_records("weekly", {"__player_key": "A"}) == [
+            {"__player_key": "A", "week": 1, "fantasy_points_ppr": 12.5},
+            {"__player_key": "A", "week": 2, "fantasy_points_ppr": None},
+        ]
+        assert manager.load_records("weekly", {"__player_key": "Z"}) == []
+        assert manager.load_records("weekly", {"__player_key": ["A", "B"], "week": 1}) == [
+            {"__player_key": "A", "week": 1, "fantasy_points_ppr": 12.5},
+            {"__player_key": "B", "week": 1, "fantasy_points_ppr": 8.0},
+        ]
+        assert manager.value_counts("weekly", "__player_key") == {"A": 2, "B": 1}
+    finally:
+        manager.close()
+
+
+def test_sqlite_dao_text_index_ranks_filters_and_counts_matches() -> None:
+    manager = SQLiteCacheManager(":memory:")
+    players = pd.DataFrame({"name": ["Patrick Mahomes", "Mahomes Backup", "Tom Brady", "Ja'Marr Chase"],
+                            "position": ["QB", "WR", "QB", "WR"],
+                            "age": [29, None, 45, 24]})
+
+    try:
+        manager.save_table("players", players, index=False)
+        manager.build_text_index("players_search", "players", "name")
+
+        records, total = manager.search_text("players_search", "name", "MAHO", {}, limit=1)
+        assert total == 2
+        assert records == [{"name": "Mahomes Backup", "position": "WR", "age": None}]
+        assert manager.search_text("players_search", "name", "maho", {"position": "QB"}, limit=20) == (
+            [{"name": "Patrick Mahomes", "position": "QB", "age": 29}], 1)
+        assert [record["name"] for record in manager.search_text("players_search", "name", "ma", {}, limit=20)[0]] == [
+            "Mahomes Backup", "Ja'Marr Chase", "Patrick Mahomes"]
+        assert manager.search_text("players_search", "name", 'x"y', {}, limit=20) == ([], 0)
+        assert "players_search" in manager.list_tables()
+        assert not any(table.startswith("players_search_") for table in manager.list_tables())
+    finally:
+        manager.close()
+
+
+def test_sqlite_dao_text_search_orders_like_the_in_memory_fallback() -> None:
+    manager = SQLiteCacheManager(":memory:")
+    # bm25 would rank the name that repeats the trigram first; the fallback orders by name.
+    players = [{"name": "Zed Rivers-Rivers"}, {"name": "Ann Rivers"}, {"name": "rivers Cole"}, {"name": "Philip Rivers"}]
+
+    try:
+        manager.save_table("players", pd.DataFrame(players), index=False)
+        manager.build_text_index("players_search", "players", "name")
+
+        for query in ("riv", "Rivers", "ri"):
+            records, _ = manager.search_text("players_search", "name", query, {}, limit=20)
+            assert records == rank_search_results([player for player in players if query.lower() in player["name"].lower()], query)
+    finally:
+        manager.close()
+
+
+def test_sqlite_dao_read_only_view_serves_threads_from_a_fixed_pool(tmp_path) -> None:
+    writer = SQLiteCacheManager(str(tmp_path / "cache.db"))
+    writer.save_table("stats", pd.DataFrame({"player": ["A", "B"]}), index=False)
+    reader = SQLiteCacheManager(str(tmp_path / "cache.db"), read_only=True, read_connections=2)
+    writer.close()
+
+    try:
+        assert isinstance(reader, SQLiteCacheManager) and reader.read_only is True
+        assert reader.supports_staging is False
+        assert reader.load_table("stats")["player"].tolist() == ["A", "B"]
+        with pytest.raises(pd.errors.DatabaseError):
+            reader.save_table("stats", pd.DataFrame({"player": ["C"]}), if_exists="append", index=False)
+
+        other_thread_rows: list = []
+        worker = threading.Thread(target=lambda: other_thread_rows.extend(reader.load_records("stats", {"player": "B"})))
+        worker.start()
+        worker.join()
+
+        assert other_thread_rows == [{"player": "B"}]
+        assert reader.pool_size == 2
+    finally:
+        reader.close()
+    assert reader.pool_size == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        reader.load_table("stats")
+
+
+def test_sqlite_dao_read_only_connection_keeps_reading_replaced_file(tmp_path) -> None:
+    live_path = tmp_path / "cache.db"
+    for path, players in ((live_path, ["A"]), (tmp_path / "cache.db.staging", ["B"])):
+        writer = SQLiteCacheManager(str(path))
+        writer.save_table("stats", pd.DataFrame({"player": players}), index=False)
+        writer.close()
+
+    reader = SQLiteCacheManager(str(live_path), read_only=True)
+    try:
+        assert reader.load_table("stats")["player"].tolist() == ["A"]
+        os.replace(tmp_path / "cache.db.staging", live_path)
+        # An open immutable connection serves a consistent snapshot of the generation it opened.
+        assert reader.load_table("stats")["player"].tolist() == ["A"]
+    finally:
+        reader.close()
+
+
+def test_sqlite_dao_writer_connection_serves_concurrent_reads(tmp_path) -> None:
+    manager = SQLiteCacheManager(str(tmp_path / "cache.db"))
+    manager.save_table("stats", pd.DataFrame({"player": ["A", "B"]}), index=False)
+    errors: list = []
+
+    def read() -> None:
+        try:
+            for _ in range(200):
+                assert manager.table_exists("stats") is True
+                assert manager.list_tables() == ["stats"]
+        except Exception as e:
+            errors.append(e)
+
+    try:
+        workers = [threading.Thread(target=read) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert errors == []
+    finally:
+        manager.close()
+
+
+def test_sqlite_dao_read_only_pool_stays_on_its_generation_after_promotion(tmp_path) -> None:
+    writer = SQLiteCacheManager(str(tmp_path / "cache.db"))
+    writer.save_table("stats", pd.DataFrame({"generation": [1]}), index=False)
+    reader = writer.read_only_view()
+    try:
+        staging = writer.open_staging()
+        staging.save_table("stats", pd.DataFrame({"generation": [2]}), index=False)
+        writer.promote_staging(staging)
+
+        # Threads that first read after the promotion still see the generation the pool opened on.
+        other_thread_rows: list = []
+        worker = threading.Thread(target=lambda: other_thread_rows.extend(reader.load_records("stats", {})))
+        worker.start()
+        worker.join()
+
+        assert reader.load_table("stats")["generation"].tolist() == [1]
+        assert other_thread_rows == [{"generation": 1}]
+        assert writer.load_table("stats")["generation"].tolist() == [2]
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_frame_to_records_replaces_missing_values_with_none() -> None:
+    source = pd.DataFrame({"player": ["A", None], "week": [1, 2], "fantasy_points_ppr": [12.5, float("nan")]})
+
+    assert frame_to_records(source) == [
+        {"player": "A", "week": 1, "fantasy_points_ppr": 12.5},
+        {"player": None, "week": 2, "fantasy_points_ppr": None},
+    ]
+    assert frame_to_records(source.iloc[0:0]) == []
+
+
+def test_sqlite_dao_archives_lists_opens_and_prunes_generations(tmp_path) -> None:
+    manager = SQLiteCacheManager(str(tmp_path / "cache.db"))
+    try:
+        for generation, player in ((1, "A"), (2, "B"), (3, "C")):
+            staging = manager.open_staging()
+            staging.save_table("stats", pd.DataFrame({"player": [player]}), index=False)
+            manager.promote_staging(staging)
+            manager.archive_generation(generation)
+
+        assert manager.list_generations() == [1, 2, 3]
+        archived = manager.open_generation(1)
+        try:
+            assert archived.load_table("stats")["player"].tolist() == ["A"]
+        finally:
+            archived.close()
+
+        manager.prune_generations(2)
+        assert manager.list_generations() == [2, 3]
+        with pytest.raises(KeyError):
+            manager.open_generation(1)
+    finally:
+        manager.close()
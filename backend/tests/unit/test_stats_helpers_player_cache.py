@@ -111,6 +111,29 @@ def test_load_player_weekly_stats_requires_structural_columns(monkeypatch: pytes
         statistics_source._source_loader.load_player_weekly_stats()
 
 
+def test_extract_all_roster_data_keeps_latest_rows_and_current_season_flags(statistics_source: Statistics) -> None:
+    today = pd.Timestamp.now().normalize()
+    rosters = pd.DataFrame({
+        "full_name": ["A", "A", "B", "C", None, "", "D"],
+        "season": [2024, 2025, 2025, 2025, 2025, 2025, 2024],
+        "position": ["RB", "WR", "QB", "TE", "QB", "QB", "OL"],
+        "birth_date": [None, (today - pd.Timedelta(days=365 * 25 + 10)).strftime("%Y-%m-%d"), None, "1990-01-01", None, None, "1990-01-01"],
+        "headshot_url": ["https://img/a-2024.png", "", "https://img/b.png", None, None, None, "https://img/d.png"],
+        "status": ["ACT", "ACT", "RET", None, "ACT", "ACT", "ACT"],
+        "team": ["KC", "CIN", "BUF", "", "KC", "KC", "KC"],
+        "entry_year": [2020, 2020, 2025, None, 2025, 2025, 2024],
+    })
+
+    roster_data = statistics_source._extract_all_roster_data(rosters)
+
+    assert roster_data.positions == {"A": "WR", "B": "QB", "C": "TE"}
+    assert roster_data.ages == {"A": 25, "C": (today - pd.Timestamp("1990-01-01")).days // 365}
+    assert roster_data.eligible == {"A", "C"}
+    assert roster_data.headshots == {"A": "https://img/a-2024.png", "B": "https://img/b.png"}
+    assert roster_data.teams == {"A": "CIN", "B": "BUF"}
+    assert roster_data.rookies == {"B": True}
+
+
 def test_build_all_players_includes_expected_fields(statistics_source: Statistics) -> None:
     positions = {"A": "QB", "B": "WR"}
     eligible = {"A"}
@@ -207,3 +230,32 @@ def test_build_weekly_player_stats_replaces_nan_values_for_json_safety(statistic
     record = weekly["Test Receiver"][0]
     assert record["receiving_epa"] is None
     assert record["target_share"] == 0.2
+
+
+def test_splice_into_replaces_refreshed_seasons_and_keeps_older_ones(stats_cache) -> None:
+    incremental = Statistics([2025])
+    incremental.set_cache({
+        "all_players": [
+            {"name": "Patrick Mahomes", "position": "QB", "age": 30, "headshot_url": None, "team": "KC", "is_rookie": False, "is_eligible": True},
+            {"name": "New Rookie", "position": "WR", "age": 22, "headshot_url": None, "team": "KC", "is_rookie": True, "is_eligible": True},
+        ],
+        "by_year": {2025: {"QB": pd.DataFrame({"Pass TD": [40]}, index=pd.Index(["Patrick Mahomes"], name="player_display_name"))}},
+        "player_weekly_stats": {
+            "Patrick Mahomes": [{"season": 2025, "week": 1, "Pass TD": 3}, {"season": 2025, "week": 2, "Pass TD": 2}],
+            "New Rookie": [{"season": 2025, "week": 2, "Rec": 4}],
+        },
+    })
+
+    incremental.splice_into(stats_cache)
+    spliced = incremental.get_cache()
+
+    assert sorted(spliced["by_year"]) == [2024, 2025]
+    assert spliced["by_year"][2024] is stats_cache["by_year"][2024]
+    assert list(spliced["by_year"][2025]) == ["QB"]
+    assert [record["week"] for record in spliced["player_weekly_stats"]["Patrick Mahomes"]] == [1, 2]
+    # Chase's only weekly rows were in the refreshed season, which no longer has any for him.
+    assert set(spliced["player_weekly_stats"]) == {"Patrick Mahomes", "New Rookie"}
+    players = {player["name"]: player for player in spliced["all_players"]}
+    assert [player["name"] for player in spliced["all_players"]] == ["Patrick Mahomes", "JaMarr Chase", "Retired Veteran", "New Rookie"]
+    assert players["JaMarr Chase"]["is_eligible"] is False and players["JaMarr Chase"]["team"] is None
+    assert players["New Rookie"]["is_rookie"] is True
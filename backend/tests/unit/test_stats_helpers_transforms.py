@@ -195,6 +195,25 @@ def test_combine_aliases_all_null_stays_nan() -> None:
     assert pd.isna(result.loc[0, "exp_fp"])
 
 
+def test_combine_aliases_matches_backfill_for_mixed_int_and_float_sources() -> None:
+    df = pd.DataFrame(
+        {
+            "targets": pd.Series([5, 7], dtype="int32"),
+            "ng_rec_targets": [float("nan"), 6.0],
+            "carries": pd.Series([3, 4], dtype="int32"),
+            "ffo_rush_att": [float("nan"), 9.0],
+        }
+    )
+    expected = df.copy()
+    expected["targets"] = df[["targets", "ng_rec_targets"]].bfill(axis=1).iloc[:, 0]
+    expected["rush_att"] = df[["carries", "ffo_rush_att"]].bfill(axis=1).iloc[:, 0]
+
+    result = stats_helpers.combine_aliases(df)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(result.columns) == ["targets", "ng_rec_targets", "carries", "ffo_rush_att", "rush_att"]
+
+
 def test_add_group_ranks_ranks_within_groups() -> None:
     df = pd.DataFrame(
         {
@@ -224,6 +243,23 @@ def test_add_group_ranks_handles_ties() -> None:
     assert result["rec_yds_rank"].tolist() == [1, 1]
 
 
+def test_add_group_ranks_stores_int16_and_leaves_missing_values_and_groups_unranked() -> None:
+    df = pd.DataFrame(
+        {
+            "season": [2025, 2025, 2025, 2025],
+            "position": ["RB", "RB", None, "WR"],
+            "rush_yds": [80.0, None, 120.0, 5.0],
+            "rec_yds": [10.0, 30.0, 0.0, 90.0],
+        }
+    )
+
+    result = stats_helpers.add_group_ranks(df, ["season", "position"])
+
+    assert result["rush_yds_rank"].dtype == "Int16"
+    assert result["rush_yds_rank"].tolist() == [1, pd.NA, pd.NA, 1]
+    assert result["rec_yds_rank"].tolist() == [2, 1, pd.NA, 1]
+
+
 def test_add_group_ranks_skips_missing_default_metrics() -> None:
     df = pd.DataFrame({"season": [2025], "position": ["QB"], "fp_ppr": [300.0]})
 
@@ -386,3 +386,52 @@ def test_align_pfr_seasonal_names_handles_missing_name_column() -> None:
     aligned = stats_helpers.align_pfr_seasonal_names(pfr_df, base_df)
 
     assert aligned.equals(pfr_df)
+
+
+def test_name_index_is_shared_across_sources_and_skips_ambiguous_names() -> None:
+    base_df = pd.DataFrame({"player_display_name": ["Kenneth Walker III", "D'Andre Swift", "Mike Williams", "Mike Williams Jr."]})
+    name_index = stats_helpers.NameIndex(base_df)
+
+    rush = stats_helpers.align_pfr_seasonal_names(pd.DataFrame({"player_display_name": ["Kenneth Walker", "DAndre Swift"]}), base_df, name_index)
+    rec = stats_helpers.align_pfr_seasonal_names(pd.DataFrame({"player_display_name": ["Kenneth Walker", "Mike Williams"]}), base_df, name_index)
+
+    assert list(rush["player_display_name"]) == ["Kenneth Walker III", "D'Andre Swift"]
+    assert list(rec["player_display_name"]) == ["Kenneth Walker III", "Mike Williams"]
+    assert name_index.resolve(pd.Series(["Kenneth Walker", "Mike Williams", None])) == {"Kenneth Walker": "Kenneth Walker III"}
+
+
+def test_merge_sources_matches_chained_left_merges() -> None:
+    base = pd.DataFrame(
+        {
+            "season": [2025, 2025, 2025, 2024],
+            "week": [1, 2, 3, 1],
+            "game_id": ["g1", None, "g3", "g0"],
+            "player_display_name": ["A", "A", "B", "B"],
+            "team": ["KC", "KC", "BUF", "BUF"],
+        },
+        index=[10, 11, 12, 13],
+    )
+    snaps = pd.DataFrame(
+        {
+            "season": [2025, 2025, 2025],
+            "week": [1, 1, 2],
+            "game_id": ["g1", "g1", "g2"],
+            "player_display_name": ["A", "A", "A"],
+            "snaps": [50, 99, 40],
+        }
+    )
+    pfr = pd.DataFrame({"season": [2025, 2025], "game_id": ["g2", None], "team": ["KC", "BUF"], "drops": [1.0, 2.0]})
+    sources = [(snaps, ["season", "week", "player_display_name"]), (pfr, ["season", "game_id", "team"]), (pd.DataFrame(), ["season"])]
+
+    expected = base
+    for source, join_candidates in sources:
+        join_keys = [key for key in join_candidates if key in expected.columns and key in source.columns]
+        if join_keys:
+            expected = expected.merge(source.drop_duplicates(subset=join_keys), on=join_keys, how="left")
+
+    merged = stats_helpers.merge_sources(base, sources)
+
+    pd.testing.assert_frame_equal(merged, expected)
+    assert list(merged["snaps"].iloc[:2]) == [50, 40]
+    assert list(merged["game_id_y"].iloc[:2]) == ["g1", "g2"]
+    assert list(merged["drops"].iloc[:3]) == [1.0, 1.0, 2.0]
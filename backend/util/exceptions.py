@@ -6,6 +6,7 @@ Hierarchy:
     ├── DataLoadError           — external data source failures (nflreadpy, web)
     ├── DataProcessingError     — data transformation or computation failures
     ├── CacheNotLoadedError     — cache missing or empty
+    ├── CacheVersionNotFoundError — requested cache generation is not kept
     └── PlayerNotFoundError     — player lookup failed across all data sources
 """
 
@@ -31,6 +32,11 @@ class CacheNotLoadedError(FantasyFootballError):
     pass
 
 
+class CacheVersionNotFoundError(FantasyFootballError):
+    """Requested cache generation (data version) is not kept"""
+    pass
+
+
 class PlayerNotFoundError(FantasyFootballError):
     """Player could not be found in any data source"""
     pass
@@ -0,0 +1,148 @@
+"""Persistent content-addressed cache of raw nflreadpy downloads, one Parquet object per source and season.
+
+Layout under RAW_SOURCE_CACHE_DIR:
+- objects/<hash[:2]>/<hash>.parquet: one season of one source, named by a hash of its content
+- sources/<source>/<season>.json: fetch metadata (object hash, row count, fetched_at) pointing at an object
+
+Seasons before CURRENT_SEASON never expire; the current season is re-fetched once RAW_SOURCE_TTL_HOURS pass.
+With RAW_SOURCE_OFFLINE=true nothing is fetched and every season must already be cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from backend.config.settings import (
+    RAW_SOURCE_CACHE,
+    RAW_SOURCE_CACHE_DIR,
+    RAW_SOURCE_OFFLINE,
+    RAW_SOURCE_TTL_HOURS,
+)
+from backend.util import constants
+from backend.util.exceptions import DataLoadError
+
+logger = logging.getLogger(__name__)
+
+Fetcher = Callable[[List[int]], pd.DataFrame]
+
+
+class RawSourceCache:
+    """Serve per-season raw source frames from disk, fetching only missing or expired seasons."""
+
+    def __init__(self, root: str = RAW_SOURCE_CACHE_DIR, ttl_hours: float = RAW_SOURCE_TTL_HOURS, offline: bool = RAW_SOURCE_OFFLINE,
+                 current_season: int = constants.CURRENT_SEASON) -> None:
+        self.root = Path(root)
+        self.ttl = timedelta(hours=ttl_hours)
+        self.offline = offline
+        self.current_season = current_season
+        # Loaders run on a thread pool; object cleanup reads every entry, so entry writes are serialized.
+        self._lock = threading.Lock()
+
+    def load(self, source: str, fetch: Fetcher, seasons: List[int]) -> pd.DataFrame:
+        """Return the source rows for the given seasons, re-fetching only seasons that are missing or stale."""
+        stale = [season for season in seasons if not self._is_fresh(self._read_entry(source, season), season)]
+        if stale and self.offline:
+            missing = [season for season in stale if self._read_entry(source, season) is None]
+            if missing:
+                raise DataLoadError(f"{source} seasons {missing} are not cached and RAW_SOURCE_OFFLINE is set", source="RawSourceCache")
+        elif stale:
+            logger.info("Fetching %s for seasons %s.", source, stale)
+            for season, frame in self._fetch_by_season(fetch, stale).items():
+                self._store(source, season, frame)
+        frames = [self._read_object(source, season) for season in seasons]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def _fetch_by_season(self, fetch: Fetcher, seasons: List[int]) -> Dict[int, pd.DataFrame]:
+        """Fetch all stale seasons in one call and split them on the season column, or fetch one season at a time without one."""
+        if len(seasons) == 1:
+            return {seasons[0]: fetch(seasons)}
+        fetched = fetch(seasons)
+        if "season" not in fetched.columns:
+            return {season: fetch([season]) for season in seasons}
+        season_values = pd.to_numeric(fetched["season"], errors="coerce")
+        return {season: fetched.loc[season_values == season].reset_index(drop=True) for season in seasons}
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]], season: int) -> bool:
+        if entry is None or not self._object_path(entry["object"]).is_file():
+            return False
+        if season < self.current_season:
+            return True
+        return datetime.now(timezone.utc) - datetime.fromisoformat(entry["fetched_at"]) < self.ttl
+
+    def _entry_path(self, source: str, season: int) -> Path:
+        return self.root / "sources" / source / f"{season}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.parquet"
+
+    def _read_entry(self, source: str, season: int) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(source, season)
+        if not path.is_file():
+            return None
+        try:
+            entry: Dict[str, Any] = json.loads(path.read_text())
+            return entry
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable raw source entry %s: %s", path, e)
+            return None
+
+    @staticmethod
+    def _content_hash(df: pd.DataFrame) -> str:
+        """Hash the columns, dtypes, and row values, so identical downloads map to the same object."""
+        digest = hashlib.sha256(json.dumps([[str(column), str(dtype)] for column, dtype in df.dtypes.items()]).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _store(self, source: str, season: int, df: pd.DataFrame) -> None:
+        """Write the season's object (unless identical content is already stored) and point its entry at it."""
+        digest = self._content_hash(df)
+        object_path = self._object_path(digest)
+        if not object_path.is_file():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_name(f"{object_path.name}.{threading.get_ident()}.tmp")
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, object_path)
+
+        entry_path = self._entry_path(source, season)
+        entry = {"source": source, "season": season, "object": digest, "rows": len(df),
+                 "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        with self._lock:
+            previous = self._read_entry(source, season)
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_name(f"{entry_path.name}.tmp")
+            tmp_path.write_text(json.dumps(entry))
+            os.replace(tmp_path, entry_path)
+            if previous is not None and previous["object"] != digest:
+                self._remove_if_unreferenced(previous["object"])
+
+    def _remove_if_unreferenced(self, digest: str) -> None:
+        for path in (self.root / "sources").glob("*/*.json"):
+            if json.loads(path.read_text()).get("object") == digest:
+                return
+        self._object_path(digest).unlink(missing_ok=True)
+
+    def _read_object(self, source: str, season: int) -> pd.DataFrame:
+        entry = self._read_entry(source, season)
+        if entry is None:
+            raise DataLoadError(f"{source} season {season} is not cached", source="RawSourceCache")
+        return pd.read_parquet(self._object_path(entry["object"]))
+
+
+_default_cache: Optional[RawSourceCache] = None
+
+
+def load_raw_source(source: str, fetch: Fetcher, seasons: List[int]) -> pd.DataFrame:
+    """Load a raw source through the on-disk cache when RAW_SOURCE_CACHE is set, else fetch it directly."""
+    global _default_cache
+    if not RAW_SOURCE_CACHE:
+        return fetch(seasons)
+    if _default_cache is None:
+        _default_cache = RawSourceCache()
+    return _default_cache.load(source, fetch, seasons)